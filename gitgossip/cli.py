@@ -1,33 +1,85 @@
-"""CLI entrypoint for GitGossip — human-friendly Git summaries and digests."""
+"""CLI entrypoint for GitGossip — human-friendly Git summaries and digests.
+
+Only ``typer`` and the daemon client are imported at module level. Command
+modules (and with them ``openai``, ``git``, ``pydantic``, ``ruamel.yaml`` and
+Rich) are imported inside the invoked subcommand, so ``--help`` and
+daemon-served commands start fast. ``tests/test_cli_startup.py`` enforces this.
+"""
 
 from __future__ import annotations
 
+import importlib
 import logging
 from pathlib import Path
+from typing import Any
 
 import typer
-from rich.console import Console
-from rich.logging import RichHandler
 
-from gitgossip.commands.commit import commit_cmd
-from gitgossip.commands.init import init_config_cmd
-from gitgossip.commands.list_authors import list_all_authors
-from gitgossip.commands.prompts import prompts_init_cmd
-from gitgossip.commands.summarize import summarize_cmd
-from gitgossip.commands.summarize_mr import summarize_mr_cmd
+from gitgossip.daemon.client import run_in_daemon
+from gitgossip.utils import output, profiler, tracing
 
-console = Console()
 app = typer.Typer(help="GitGossip 🧠 — AI-powered commit summaries and merge request digests.")
 
-
-# Configure Rich logging
-logging.basicConfig(
-    level=logging.WARNING, format="%(message)s", handlers=[RichHandler(console=console, rich_tracebacks=True)]
-)
-
 # Create a named logger
 logger = logging.getLogger("gitgossip")
 
+
+class _LazyRichHandler(logging.Handler):
+    """Hands records to a Rich handler built on the first one, so runs that never log skip importing Rich."""
+
+    def __init__(self) -> None:
+        """Initialize without importing Rich."""
+        super().__init__()
+        self._rich: logging.Handler | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Render ``record`` through Rich on stderr."""
+        if self._rich is None:
+            from rich.console import Console
+            from rich.logging import RichHandler
+
+            self._rich = RichHandler(console=Console(stderr=True), rich_tracebacks=True)
+        self._rich.handle(record)
+
+
+def _configure_logging() -> None:
+    """Route log records through Rich, imported only once something is actually logged."""
+    logging.basicConfig(level=logging.WARNING, format="%(message)s", handlers=[_LazyRichHandler()])
+
+
+# Slack on top of commit.hook_deadline for the daemon round trip; the daemon enforces the deadline itself.
+_HOOK_DAEMON_GRACE = 1.0
+
+
+def _dispatch(command: str, target: str, *, daemon_timeout: float | None = None, **kwargs: Any) -> None:
+    """Run ``command`` on the ``gitgossip serve`` daemon when one is listening, otherwise in-process.
+
+    ``target`` is the ``module:function`` implementing the command; it is only
+    imported when the command actually runs in this process. Profiled and
+    traced runs always stay in-process so the phases and spans can be measured.
+    A daemon that has not answered within ``daemon_timeout`` seconds is given
+    up on and the command runs in-process instead.
+    """
+    measured = profiler.active() is not None or tracing.active() is not None
+    exit_code = None if measured else run_in_daemon(command, kwargs, timeout=daemon_timeout)
+    if exit_code is None:
+        module, _, name = target.partition(":")
+        with profiler.phase("import"):
+            func = getattr(importlib.import_module(module), name)
+        func(**kwargs)
+    elif exit_code:
+        raise typer.Exit(code=exit_code)
+
+
+def _output_format(value: str) -> str:
+    """Validate ``--format`` without importing any command module."""
+    if value not in output.FORMATS:
+        raise typer.BadParameter(f"Use one of: {', '.join(output.FORMATS)}.")
+    return value
+
+
+_FORMAT_HELP = "Output format: 'text' (Rich panels), or 'json'/'ndjson' records streamed to stdout as each is ready."
+
 prompts_app = typer.Typer(help="Manage custom prompt templates.")
 app.add_typer(prompts_app, name="prompts", rich_help_panel="Setup & Configuration")
 
@@ -35,12 +87,16 @@ app.add_typer(prompts_app, name="prompts", rich_help_panel="Setup & Configuratio
 @prompts_app.command("init")
 def prompts_init() -> None:
     """Scaffold editable prompt templates into your prompts directory."""
+    from gitgossip.commands.prompts import prompts_init_cmd
+
     prompts_init_cmd()
 
 
 @app.command(help="Run the interactive setup wizard for GitGossip.", rich_help_panel="Setup & Configuration")
 def init() -> None:
     """Initialize or update GitGossip configuration interactively."""
+    from gitgossip.commands.init import init_config_cmd
+
     init_config_cmd()
 
 
@@ -62,9 +118,21 @@ def list_authors(
         "-a",
         help="Include authors from all commits in history, ignoring the --since filter.",
     ),
+    max_depth: int = typer.Option(
+        1, "--max-depth", min=1, help="How many directory levels below PATH to search for repositories."
+    ),
+    output_format: str = typer.Option("text", "--format", callback=_output_format, help=_FORMAT_HELP),
 ) -> None:
     """Display all unique commit authors in one or more repositories."""
-    list_all_authors(path=path, since=since, all_commits=all_commits)
+    _dispatch(
+        "list-authors",
+        "gitgossip.commands.list_authors:list_all_authors",
+        path=path,
+        since=since,
+        all_commits=all_commits,
+        max_depth=max_depth,
+        output_format=output_format,
+    )
 
 
 @app.command(help="Summarize recent commits into a human-friendly digest.", rich_help_panel="AI Summaries")
@@ -90,9 +158,36 @@ def summarize(
         "--use-mock",
         help="Use the mock LLM analyzer (for local testing) instead of calling a real AI model.",
     ),
+    stats: bool = typer.Option(False, "--stats", help="Print per-call LLM latency and token statistics."),
+    stats_json: str | None = typer.Option(
+        None, "--stats-json", help="Append this run's LLM statistics as a JSON line to the given file."
+    ),
+    jobs: int = typer.Option(
+        1, "--jobs", "-j", min=1, help="Summarize up to N repositories concurrently when PATH holds several repos."
+    ),
+    ordered: bool = typer.Option(
+        False, "--ordered", help="With --jobs, print results in discovery order instead of as they finish."
+    ),
+    max_depth: int = typer.Option(
+        1, "--max-depth", min=1, help="How many directory levels below PATH to search for repositories."
+    ),
+    output_format: str = typer.Option("text", "--format", callback=_output_format, help=_FORMAT_HELP),
 ) -> None:
     """Generate a plain-English summary of recent Git commits."""
-    summarize_cmd(path=path, author=author, since=since, use_mock=use_mock)
+    _dispatch(
+        "summarize",
+        "gitgossip.commands.summarize:summarize_cmd",
+        path=path,
+        author=author,
+        since=since,
+        use_mock=use_mock,
+        stats=stats,
+        stats_json=stats_json,
+        jobs=jobs,
+        ordered=ordered,
+        max_depth=max_depth,
+        output_format=output_format,
+    )
 
 
 @app.command(help="Generate an AI-assisted Merge Request title and description.", rich_help_panel="AI Summaries")
@@ -101,9 +196,24 @@ def summarize_mr(
     path: str = typer.Option(".", "--path", help="Path to the Git repository (default: current directory)."),
     pull: bool = typer.Option(False, "--pull", help="Pull the latest target branch before creating the diff."),
     use_mock: bool = typer.Option(False, "--use-mock", help="Use the mock LLM analyzer instead of a real model."),
+    stats: bool = typer.Option(False, "--stats", help="Print per-call LLM latency and token statistics."),
+    stats_json: str | None = typer.Option(
+        None, "--stats-json", help="Append this run's LLM statistics as a JSON line to the given file."
+    ),
+    output_format: str = typer.Option("text", "--format", callback=_output_format, help=_FORMAT_HELP),
 ) -> None:
     """Generate a human-readable summary for a Merge Request."""
-    summarize_mr_cmd(target_branch=target_branch, path=path, pull=pull, use_mock=use_mock)
+    _dispatch(
+        "summarize-mr",
+        "gitgossip.commands.summarize_mr:summarize_mr_cmd",
+        target_branch=target_branch,
+        path=path,
+        pull=pull,
+        use_mock=use_mock,
+        stats=stats,
+        stats_json=stats_json,
+        output_format=output_format,
+    )
 
 
 @app.command(help="Generate an AI commit message from staged changes.", rich_help_panel="AI Summaries")
@@ -114,21 +224,158 @@ def commit(
         None, "--hook", help="prepare-commit-msg mode: write the message into the given file and exit 0."
     ),
     use_mock: bool = typer.Option(False, "--use-mock", help="Use the mock LLM analyzer instead of a real model."),
+    candidates: int | None = typer.Option(
+        None,
+        "--candidates",
+        "-n",
+        min=1,
+        help="Generate N messages concurrently so 'regenerate' is instant (default: commit.candidates, 1).",
+    ),
+    fresh: bool = typer.Option(
+        False, "--fresh", help="Ignore the message cached for identical staged changes and ask the model again."
+    ),
 ) -> None:
     """Generate a Conventional Commit message from the staged diff."""
-    commit_cmd(path=path, print_only=print_only, hook_file=hook_file, use_mock=use_mock)
+    if hook_file is not None:
+        from gitgossip.commands.commit_hook import hook_deadline
 
+        _dispatch(
+            "commit-hook",
+            "gitgossip.commands.commit_hook:hook_cmd",
+            daemon_timeout=hook_deadline() + _HOOK_DAEMON_GRACE,
+            hook_file=hook_file,
+            path=path,
+            use_mock=use_mock,
+            fresh=fresh,
+        )
+        return
+    if print_only:
+        _dispatch(
+            "commit",
+            "gitgossip.commands.commit:commit_cmd",
+            path=path,
+            print_only=print_only,
+            hook_file=hook_file,
+            use_mock=use_mock,
+            fresh=fresh,
+        )
+        return
 
-@app.command(rich_help_panel="Miscellaneous")
-def digest() -> None:
-    """(Coming soon) Generate a full developer activity digest."""
-    typer.secho("🚧 Coming soon... This feature is under development.", fg=typer.colors.YELLOW, bold=True)
-    raise typer.Exit(code=0)
+    from gitgossip.commands.commit import commit_cmd
+
+    commit_cmd(
+        path=path, print_only=print_only, hook_file=hook_file, use_mock=use_mock, candidates=candidates, fresh=fresh
+    )
+
+
+@app.command(help="Per-author, per-day activity digest across repositories.", rich_help_panel="AI Summaries")
+def digest(
+    path: str = typer.Argument(
+        default_factory=Path.cwd,
+        help="Path to a Git repository or a directory containing multiple repositories (default: current directory).",
+    ),
+    since: str = typer.Option("7days", "--since", "-s", help="Digest window, e.g. '1days', '7days' or '2025-10-01'."),
+    author: str | None = typer.Option(
+        None,
+        "--author",
+        "-a",
+        help="Only include authors whose 'Name <email>' matches this case-insensitive regular expression.",
+    ),
+    use_mock: bool = typer.Option(False, "--use-mock", help="Use the mock LLM analyzer instead of a real model."),
+    max_depth: int = typer.Option(
+        1, "--max-depth", min=1, help="How many directory levels below PATH to search for repositories."
+    ),
+    stats: bool = typer.Option(False, "--stats", help="Print per-call LLM latency and token statistics."),
+    stats_json: str | None = typer.Option(
+        None, "--stats-json", help="Append this run's LLM statistics as a JSON line to the given file."
+    ),
+) -> None:
+    """Generate a developer activity digest, summarizing only what changed since the last run."""
+    _dispatch(
+        "digest",
+        "gitgossip.commands.digest:digest_cmd",
+        path=path,
+        since=since,
+        author=author,
+        use_mock=use_mock,
+        max_depth=max_depth,
+        stats=stats,
+        stats_json=stats_json,
+    )
+
+
+@app.command(help="Run a background daemon that keeps GitGossip warm.", rich_help_panel="Setup & Configuration")
+def serve(
+    socket_path: str | None = typer.Option(
+        None, "--socket", help="Unix socket to listen on (default: $GITGOSSIP_SOCKET or ~/.gitgossip/gitgossip.sock)."
+    ),
+) -> None:
+    """Serve commands over a local socket; other gitgossip invocations use it automatically."""
+    from gitgossip.commands.serve import serve_cmd
+
+    serve_cmd(socket_path=socket_path)
 
 
 @app.callback(invoke_without_command=True)
-def main_callback(ctx: typer.Context) -> None:
+def main_callback(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Print wall and CPU time per phase (import, discovery, ingestion, parse, LLM, ...) at exit.",
+    ),
+    profile_out: str | None = typer.Option(
+        None, "--profile-out", help="With --profile, also write a cProfile dump to this file (implies --profile)."
+    ),
+    mem_report: bool = typer.Option(
+        False,
+        "--mem-report",
+        help="Track allocations with tracemalloc and print peak memory per phase at exit (implies --profile).",
+    ),
+    trace: str | None = typer.Option(
+        None,
+        "--trace",
+        envvar="GITGOSSIP_TRACE",
+        help="Append this run's tracing spans (git, chunking, LLM calls, ...) to the given file.",
+    ),
+    trace_format: str = typer.Option(
+        "ndjson", "--trace-format", help="Trace file format: 'ndjson' (one span per line) or 'otlp' (OTLP/JSON)."
+    ),
+) -> None:
     """Show help when no command is provided."""
+    _configure_logging()
     if ctx.invoked_subcommand is None:
         typer.echo(ctx.get_help())
         raise typer.Exit()
+    if profile or profile_out or mem_report:
+        profiler.start(Path(profile_out).expanduser() if profile_out else None, memory=mem_report)
+        ctx.call_on_close(_print_profile)
+    if trace:
+        if trace_format not in tracing.FORMATS:
+            raise typer.BadParameter(f"Use one of: {', '.join(tracing.FORMATS)}.", param_hint="--trace-format")
+        tracing.start(Path(trace).expanduser(), trace_format, resource={"service.version": _version()})
+        ctx.call_on_close(tracing.stop)
+        # Closed before tracing.stop (close callbacks run last-in, first-out), so the root span is exported.
+        ctx.with_resource(tracing.span(f"gitgossip {ctx.invoked_subcommand}", command=ctx.invoked_subcommand))
+
+
+def _version() -> str:
+    """Return the installed gitgossip version ("unknown" when running from an uninstalled tree)."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("gitgossip")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _print_profile() -> None:
+    """Stop the phase profiler and print its breakdown."""
+    finished = profiler.stop()
+    if finished is None:
+        return
+    from rich.console import Console
+
+    from gitgossip.commands.profile_report import report_profile
+
+    report_profile(finished, Console(stderr=True))
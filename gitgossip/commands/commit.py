@@ -2,40 +2,113 @@
 
 from __future__ import annotations
 
-import logging
 from pathlib import Path
+from typing import Any, Callable
 
 import click
 import typer
+from git.exc import GitCommandError
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 
+from gitgossip.commands.commit_hook import hook_cmd, message_cache_key
+from gitgossip.config.config_service import ConfigService
 from gitgossip.core.factories.llm_analyzer_factory import LLMAnalyzerFactory
 from gitgossip.core.providers.git_repo_provider import GitRepoProvider
+from gitgossip.core.services.commit_message_service import CommitMessageCandidates
+from gitgossip.core.storage.commit_message_cache import CommitMessageCache
+
+DEFAULT_CANDIDATES = 1
 
 console = Console()
 
 
-def commit_cmd(path: str, print_only: bool, hook_file: str | None, use_mock: bool) -> None:
-    """Generate a Conventional Commit message from the staged diff and optionally commit."""
+def commit_cmd(  # pylint: disable=too-many-positional-arguments
+    path: str,
+    print_only: bool,
+    hook_file: str | None,
+    use_mock: bool,
+    candidates: int | None = None,
+    fresh: bool = False,
+) -> None:
+    """Generate a Conventional Commit message from the staged diff and optionally commit.
+
+    ``candidates`` (default ``commit.candidates`` from the config) messages are
+    generated concurrently in interactive mode, so "regenerate" can show one
+    that is already waiting while the next is drafted in the background.
+
+    The last message shown (or edited) for a staged tree is cached, and an
+    identical staged state starts from it without calling the model unless
+    ``fresh`` is set.
+    """
     if hook_file is not None:
-        _run_hook_mode(msg_file=Path(hook_file), path=path, use_mock=use_mock)
+        hook_cmd(hook_file=hook_file, path=path, use_mock=use_mock, fresh=fresh)
         return
 
     provider = GitRepoProvider(path=Path(path))
-    diff_text = provider.get_staged_diff()
+    staged = provider.get_staged_changes()
+    diff_text = staged.patch
     if not diff_text.strip():
         console.print("[yellow]Nothing staged. Stage changes first, e.g. [cyan]git add -p[/cyan].[/yellow]")
         raise typer.Exit(code=1)
 
-    analyzer = LLMAnalyzerFactory().get_analyzer(use_mock=use_mock)
-    file_summary = ", ".join(provider.get_staged_files())
-    message = analyzer.generate_commit_message(diff_text, file_summary)
+    cfg = ConfigService().load()
+    if print_only:
+        candidates = 1
+    elif candidates is None:
+        commit_cfg: dict[str, Any] = cfg.get("commit") or {}
+        candidates = max(1, int(commit_cfg.get("candidates", DEFAULT_CANDIDATES)))
+
+    cached, remember = _message_cache(provider, cfg, use_mock, fresh)
+    if cached is not None and not print_only:
+        console.print("[dim]Same staged changes as last time; regenerate or use --fresh for a new message.[/dim]")
+
+    analyzer = LLMAnalyzerFactory().get_analyzer(use_mock=use_mock, show_status=False)
+    with CommitMessageCandidates(
+        analyzer, diff_text, staged.file_summary(), candidates=candidates, first=cached
+    ) as pool:
+        _interact(provider, pool, print_only, remember=remember)
+
+
+def _message_cache(
+    provider: GitRepoProvider, cfg: dict[str, Any], use_mock: bool, fresh: bool
+) -> tuple[str | None, Callable[[str], None]]:
+    """Return the cached message for the staged tree (None when ``fresh``) and a callback that stores new ones.
+
+    When git cannot write the staged tree (e.g. unmerged paths mid-merge) there is
+    no key, so nothing is read or stored: the cache is never needed for a message.
+    """
+    try:
+        tree = provider.get_staged_tree()
+    except GitCommandError:
+        return None, lambda message: None
+    cache = CommitMessageCache()
+    key = message_cache_key(tree, cfg, use_mock)
+    return (None if fresh else cache.get(key)), lambda message: cache.put(key, message)
+
+
+def _next_message(pool: CommitMessageCandidates) -> str:
+    """Take the next candidate, showing a spinner only when it is not ready yet."""
+    if pool.ready:
+        return pool.next()
+    with console.status("[bold cyan]Drafting commit message...", spinner="dots"):
+        return pool.next()
+
+
+def _interact(
+    provider: GitRepoProvider, pool: CommitMessageCandidates, print_only: bool, remember: Callable[[str], None]
+) -> None:
+    """Print the first candidate, or loop over accept / edit / regenerate / quit until the user decides.
+
+    Every message shown is passed to ``remember``, so re-running on the same staged tree picks up where this left off.
+    """
+    message = _next_message(pool)
 
     if message.startswith("[LLM ERROR]"):
         console.print(f"[red]Failed to generate commit message: {message}[/red]")
         raise typer.Exit(code=1)
+    remember(message)
 
     if print_only:
         typer.echo(message)
@@ -53,38 +126,13 @@ def commit_cmd(path: str, print_only: bool, hook_file: str | None, use_mock: boo
             edited = click.edit(message)
             if edited is not None and edited.strip():
                 message = edited.strip()
+                remember(message)
         elif choice == "r":
-            message = analyzer.generate_commit_message(diff_text, file_summary)
+            message = _next_message(pool)
             if message.startswith("[LLM ERROR]"):
                 console.print(f"[red]Regeneration failed: {message}[/red]")
                 raise typer.Exit(code=1)
+            remember(message)
         else:
             console.print("[yellow]Aborted. Nothing committed.[/yellow]")
             raise typer.Exit(code=0)
-
-
-def _run_hook_mode(msg_file: Path, path: str, use_mock: bool) -> None:
-    """Fill the commit-message file for prepare-commit-msg.
-
-    Fail-open by design: any error leaves the file untouched and returns
-    normally so a broken model can never block a commit.
-    """
-    try:
-        existing = msg_file.read_text(encoding="utf-8") if msg_file.exists() else ""
-        has_real_message = any(line.strip() and not line.lstrip().startswith("#") for line in existing.splitlines())
-        if has_real_message:
-            return
-
-        provider = GitRepoProvider(path=Path(path))
-        diff_text = provider.get_staged_diff()
-        if not diff_text.strip():
-            return
-
-        analyzer = LLMAnalyzerFactory().get_analyzer(use_mock=use_mock)
-        message = analyzer.generate_commit_message(diff_text, ", ".join(provider.get_staged_files()))
-        if message.startswith("[LLM ERROR]"):
-            return
-
-        msg_file.write_text(f"{message}\n{existing}", encoding="utf-8")
-    except Exception:  # noqa: BLE001 — fail-open is the hook contract
-        logging.getLogger("gitgossip.commit-hook").debug("Hook mode failed; leaving message file untouched.")
@@ -0,0 +1,218 @@
+"""prepare-commit-msg hook mode for ``gitgossip commit --hook`` — deadline-bounded and light on imports.
+
+Only the standard library, the config service, the prompt builder and the
+commit message cache are imported up front. The staged files and patch come
+from one ``git diff --cached`` call (no GitPython), a message cached for the
+same staged tree is reused without touching the model, and the analyzer stack
+is imported inside a worker thread that is abandoned once the deadline passes.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from gitgossip.config.config_service import ConfigService
+from gitgossip.core.llm.prompt_builder import PromptBuilder
+from gitgossip.core.storage.commit_message_cache import CommitMessageCache
+from gitgossip.utils.staged_diff import STAGED_DIFF_ARGS, parse_staged_diff
+
+DEFAULT_HOOK_DEADLINE = 3.0
+
+_DOC_SUFFIXES = (".md", ".rst", ".adoc", ".txt")
+_BUILD_FILES = ("pyproject.toml", "setup.py", "setup.cfg", "Makefile", "Dockerfile", "package.json", "go.mod")
+
+_MODEL_KEYS = ("provider", "model", "base_url")
+
+_logger = logging.getLogger("gitgossip.commit-hook")
+
+
+def hook_cmd(  # pylint: disable=too-many-positional-arguments
+    hook_file: str,
+    path: str = ".",
+    use_mock: bool = False,
+    fresh: bool = False,
+    git_env: dict[str, str] | None = None,
+) -> None:
+    """Fill the commit-message file for prepare-commit-msg within ``commit.hook_deadline`` seconds.
+
+    Fail-open by design: any error or a missed deadline leaves the file
+    untouched (or, with ``commit.hook_fallback: heuristic``, fills in a
+    message derived from the staged file list) and returns normally so a
+    broken or slow model can never block a commit. ``fresh`` skips the
+    commit message cache lookup (the new message is still stored).
+    ``git_env`` replaces this process's ``GIT_*`` variables for the git calls;
+    the daemon passes the calling hook's, so ``GIT_INDEX_FILE`` and friends
+    (set by ``git commit -a``, ``git commit <paths>`` and worktrees) are honoured.
+    """
+    started = time.monotonic()
+    try:
+        cfg = ConfigService().load()
+        commit_cfg: dict[str, Any] = cfg.get("commit") or {}
+        deadline = started + float(commit_cfg.get("hook_deadline", DEFAULT_HOOK_DEADLINE))
+        env = None
+        if git_env is not None:
+            env = {name: value for name, value in os.environ.items() if not name.startswith("GIT_")} | git_env
+        _fill_message_file(
+            Path(hook_file),
+            functools.partial(_git, path, deadline, env=env),
+            use_mock=use_mock,
+            deadline=deadline,
+            heuristic=commit_cfg.get("hook_fallback") == "heuristic",
+            cfg=cfg,
+            fresh=fresh,
+        )
+    except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+        # Fail-open is the hook contract.
+        _logger.debug("Hook mode failed; leaving message file untouched.", exc_info=True)
+
+
+def hook_deadline() -> float:
+    """Return ``commit.hook_deadline`` in seconds, or the default when the config cannot be read."""
+    try:
+        return float((ConfigService().load().get("commit") or {}).get("hook_deadline", DEFAULT_HOOK_DEADLINE))
+    except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+        return DEFAULT_HOOK_DEADLINE
+
+
+def message_cache_key(tree: str, cfg: dict[str, Any], use_mock: bool) -> str:
+    """Return the `CommitMessageCache` key for the staged ``tree`` under the configured model and commit template.
+
+    Only the settings that change the message (provider, model and base URL)
+    are part of the key; tuning such as timeouts or pool sizes is not.
+    """
+    llm_cfg: dict[str, Any] = cfg.get("llm") or {}
+    model = "mock" if use_mock else json.dumps([llm_cfg.get(name) for name in _MODEL_KEYS], default=str)
+    prompts_dir = (cfg.get("paths") or {}).get("prompts")
+    template = PromptBuilder(user_dir=Path(prompts_dir) if prompts_dir else None).fingerprint("commit")
+    return CommitMessageCache.key(tree, model, template)
+
+
+def _fill_message_file(
+    msg_file: Path,
+    git: Callable[..., str],
+    *,
+    use_mock: bool,
+    deadline: float,
+    heuristic: bool,
+    cfg: dict[str, Any],
+    fresh: bool,
+) -> None:
+    """Write a cached, generated (or heuristic) message above the existing template unless the user wrote one."""
+    existing = msg_file.read_text(encoding="utf-8") if msg_file.exists() else ""
+    if any(line.strip() and not line.lstrip().startswith("#") for line in existing.splitlines()):
+        return
+
+    try:
+        staged = parse_staged_diff(git(*STAGED_DIFF_ARGS))
+        tree = _staged_tree(git)
+    except subprocess.TimeoutExpired:
+        _logger.debug("Reading the staged diff missed the hook deadline.")
+        return
+    if not staged.patch.strip():
+        return
+
+    cache = CommitMessageCache()
+    key = None if tree is None else message_cache_key(tree, cfg, use_mock)
+    message = None if fresh or key is None else cache.get(key)
+    if message is None:
+        message = _generate(staged.patch, staged.file_summary(), use_mock, deadline)
+        if message is not None and key is not None:
+            cache.put(key, message)
+    if message is None and heuristic:
+        message = (
+            f"{heuristic_message(staged.statuses)}\n# gitgossip: the model missed the hook deadline; heuristic message"
+        )
+    if message is None:
+        return
+    msg_file.write_text(f"{message}\n{existing}", encoding="utf-8")
+
+
+def _staged_tree(git: Callable[..., str]) -> str | None:
+    """Return the tree the index would commit, or None when git cannot write one (e.g. unmerged paths).
+
+    Raises:
+        subprocess.TimeoutExpired: If the deadline passes first.
+    """
+    try:
+        return git("write-tree").strip()
+    except subprocess.CalledProcessError:
+        _logger.debug("git write-tree failed; continuing without the message cache.", exc_info=True)
+        return None
+
+
+def _generate(diff_text: str, file_summary: str, use_mock: bool, deadline: float) -> str | None:
+    """Build the analyzer and ask for a message on a worker thread; None on error or a missed deadline.
+
+    A worker that overruns is left behind as a daemon thread: its result is
+    ignored and it cannot keep the process alive once the hook returns.
+    """
+    result: list[str] = []
+
+    def work() -> None:
+        try:
+            # Imported here so the hook module stays light when a cached message is enough.
+            from gitgossip.core.factories.llm_analyzer_factory import (  # pylint: disable=import-outside-toplevel
+                LLMAnalyzerFactory,
+            )
+
+            analyzer = LLMAnalyzerFactory().get_analyzer(use_mock=use_mock, show_status=False)
+            result.append(analyzer.generate_commit_message(diff_text, file_summary))
+        except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+            # Reported as "no message" to the fail-open caller.
+            _logger.debug("Commit message generation failed.", exc_info=True)
+
+    worker = threading.Thread(target=work, name="gitgossip-commit-hook", daemon=True)
+    worker.start()
+    worker.join(max(0.0, deadline - time.monotonic()))
+    if worker.is_alive():
+        _logger.debug("Commit message generation missed the hook deadline; abandoning it.")
+        return None
+    if not result or result[0].startswith("[LLM ERROR]"):
+        return None
+    return result[0]
+
+
+def _git(path: str, deadline: float, *args: str, env: dict[str, str] | None = None) -> str:
+    """Run a git command in ``path`` with whatever is left of the deadline as its timeout (and ``env``, if given).
+
+    Raises:
+        subprocess.TimeoutExpired: If the deadline passes first.
+        subprocess.CalledProcessError: If git fails (e.g. not a repository).
+    """
+    timeout = max(0.0, deadline - time.monotonic())
+    return subprocess.run(
+        ["git", "-C", path, *args], capture_output=True, text=True, check=True, timeout=timeout, env=env
+    ).stdout
+
+
+def heuristic_message(statuses: dict[str, str]) -> str:
+    """Return a Conventional Commit subject guessed from staged paths and their statuses alone."""
+    files = list(statuses)
+    if not files:
+        return "chore: update files"
+
+    names = [Path(f).name for f in files]
+    if all(f.endswith(_DOC_SUFFIXES) or f.startswith("docs/") for f in files):
+        kind = "docs"
+    elif all(f.startswith(("tests/", "test/")) or n.startswith("test_") or "_test." in n for f, n in zip(files, names)):
+        kind = "test"
+    elif all(n in _BUILD_FILES or n.endswith(".lock") or n.startswith("requirements") for n in names):
+        kind = "build"
+    else:
+        kind = "chore"
+
+    tops = {Path(f).parts[0] for f in files}
+    scope = f"({tops.pop()})" if len(tops) == 1 and all(len(Path(f).parts) > 1 for f in files) else ""
+
+    letters = set(statuses.values())
+    verb = "add" if letters == {"A"} else "remove" if letters == {"D"} else "update"
+    target = ", ".join(names) if len(names) <= 3 else f"{len(names)} files"
+    return f"{kind}{scope}: {verb} {target}"
@@ -0,0 +1,123 @@
+"""Digest command — per-author, per-day activity across one or many repositories."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from datetime import datetime
+from itertools import groupby
+from pathlib import Path
+
+import typer
+from git import GitCommandError
+from rich.console import Console
+from rich.panel import Panel
+
+from gitgossip.commands.stats_report import report_stats
+from gitgossip.core.factories.llm_analyzer_factory import LLMAnalyzerFactory
+from gitgossip.core.llm.telemetry import LLMStatsRecorder
+from gitgossip.core.models.digest import DigestEntry
+from gitgossip.core.services.digest_service import DigestService
+from gitgossip.core.services.repo_discovery_service import RepoDiscoveryService, is_repository
+from gitgossip.core.storage.digest_store import DigestStore
+from gitgossip.core.storage.discovery_cache import DiscoveryCache
+from gitgossip.utils.parse import parse_since
+from gitgossip.utils.profiler import phase
+
+console = Console()
+
+
+def digest_cmd(
+    path: str,
+    since: str = "7days",
+    author: str | None = None,
+    use_mock: bool = False,
+    max_depth: int = 1,
+    stats: bool = False,
+    stats_json: str | None = None,
+) -> None:
+    """Print a developer activity digest for the repositories under ``path``.
+
+    New commits are ingested incrementally into the digest store and only
+    (repository, author, day) buckets whose commits changed are sent to the
+    LLM; everything else is composed from summaries cached by earlier runs.
+    ``author`` is a case-insensitive Python regular expression searched in
+    each commit's mailmap-resolved ``Name <email>``.
+
+    Raises:
+        typer.BadParameter: If ``author`` is not a valid regular expression.
+        typer.Exit: With code 1 when no repository is found or the digest cannot be built.
+    """
+    if author:
+        try:
+            re.compile(author)
+        except re.error as e:
+            raise typer.BadParameter(f"Invalid regular expression: {e}.", param_hint="--author") from e
+    work_dir = Path(path).expanduser().resolve()
+    # Start at local midnight so the oldest day's bucket is whole and its fingerprint stays stable between runs.
+    window_start = datetime.fromisoformat(parse_since(since)).replace(hour=0, minute=0, second=0, microsecond=0)
+    since_ts = int(window_start.timestamp())
+    if is_repository(str(work_dir)):
+        repos = [work_dir]
+    else:
+        repos = RepoDiscoveryService(base_dir=work_dir, max_depth=max_depth, cache=DiscoveryCache()).find_repositories()
+    if not repos:
+        console.print(f"[red]No git repositories found in {work_dir}[/red]")
+        raise typer.Exit(code=1)
+
+    recorder = LLMStatsRecorder() if stats or stats_json else None
+    try:
+        analyzer = LLMAnalyzerFactory().get_analyzer(use_mock=use_mock, stats_recorder=recorder)
+        with DigestStore() as store:
+            service = DigestService(store=store, llm_analyzer=analyzer)
+            readable = _ingest(service, repos)
+            entries = service.build(readable, since_ts=since_ts, author=author)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        console.print(f"[red]Failed to build digest: {e}[/red]")
+        raise typer.Exit(code=1) from e
+    finally:
+        report_stats(recorder, console, command="digest", show_table=stats, json_path=stats_json)
+
+    if not entries:
+        console.print(f"[yellow]No activity since {since}.[/yellow]")
+        return
+    with phase("render"):
+        _print_digest(entries, since)
+
+
+def _ingest(service: DigestService, repos: list[Path]) -> list[Path]:
+    """Ingest new commits for every repository, reporting (and skipping) the ones git cannot read."""
+    readable: list[Path] = []
+    added = 0
+    with console.status("[bold cyan]Reading new commits...", spinner="dots"):
+        for repo in repos:
+            try:
+                added += service.ingest(repo)
+            except GitCommandError as e:
+                console.print(f"[red]Skipping {repo}: {e.stderr.strip() or e}[/red]")
+                continue
+            readable.append(repo)
+    console.print(f"[dim]{added} new commits ingested from {len(readable)} repositories.[/dim]")
+    return readable
+
+
+def _print_digest(entries: list[DigestEntry], since: str) -> None:
+    """Render entries grouped by day, newest first."""
+    console.print(f"\n[bold]Activity digest — last {since}[/bold]\n")
+    for day, group in groupby(entries, key=lambda e: e.day):
+        lines: list[str] = []
+        for entry in group:
+            plural = "commit" if entry.commits == 1 else "commits"
+            lines.append(f"[bold]{entry.author}[/bold] in [cyan]{entry.repo}[/cyan] — {entry.commits} {plural}")
+            lines.append(entry.summary.strip())
+            lines.append("")
+        console.print(
+            Panel.fit(
+                "\n".join(lines).strip(),
+                title=f"[bold green]{day:%A, %Y-%m-%d}[/bold green]",
+                border_style="cyan",
+                padding=(1, 2),
+            )
+        )
+    reused = sum(1 for e in entries if e.cached)
+    console.print(f"[dim]{len(entries) - reused} summaries generated, {reused} reused from earlier runs.[/dim]")
@@ -147,7 +147,7 @@ def _warn_if_insufficient_resources(model_name: str) -> None:
 def init_config_cmd() -> None:
     """Interactive configuration command for GitGossip."""
     service = ConfigService()
-    cfg = service.load()
+    cfg = service.load_for_edit()
 
     provider = _select_provider(cfg["llm"].get("provider", "local"))
     cfg["llm"]["provider"] = provider
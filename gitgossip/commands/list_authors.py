@@ -2,59 +2,143 @@
 
 from __future__ import annotations
 
+import datetime
+import time
+from functools import partial
 from pathlib import Path
-from typing import Set
 
 import typer
-from git import Repo
 from rich.console import Console
 
+from gitgossip.core.models.author import AuthorStats, RepoAuthors
+from gitgossip.core.services.author_service import AuthorService
 from gitgossip.core.services.repo_discovery_service import RepoDiscoveryService
+from gitgossip.core.storage.discovery_cache import DiscoveryCache
+from gitgossip.utils.output import RecordWriter
 from gitgossip.utils.parse import parse_since
+from gitgossip.utils.profiler import phase
 
 console = Console()
+err_console = Console(stderr=True)
 
 
-def list_all_authors(path: str, since: str, all_commits: bool = False) -> None:
+def list_all_authors(
+    path: str, since: str, all_commits: bool = False, max_depth: int = 1, output_format: str = "text"
+) -> None:
     """Display all unique commit authors in one or more repositories.
 
     Args:
         path: Path to a Git repository or a directory containing multiple repos.
         since: Time filter for commits (e.g. "7days" or "2025-10-01"). Ignored if `all_commits` is True.
         all_commits: Whether to include all commits in history, bypassing time filtering.
+        max_depth: How many directory levels below ``path`` to search for repositories.
+        output_format: ``"text"``, or ``"json"``/``"ndjson"`` for one record per repository
+            (streamed as each is read) followed by one record with the merged authors.
     """
     work_dir = Path(path).expanduser().resolve()
-
-    # Case 1: Single Git repository
-    if (work_dir / ".git").exists():
-        _get_authors_from_commits(work_dir, since, all_commits)
-        return
-
-    # Case 2: Directory containing multiple Git repositories
-    repo_discovery = RepoDiscoveryService(base_dir=work_dir)
-    repos = repo_discovery.find_repositories()
-    if not repos:
-        console.print(f"[red]No Git repositories found in {work_dir}[/red]")
-        raise typer.Exit(code=1)
-
-
-def _get_authors_from_commits(path: Path, since: str, all_commits: bool) -> None:
-    """Extract authors from Git commit history and print them."""
+    writer = RecordWriter(output_format) if output_format != "text" else None
+    ui = console if writer is None else err_console
+
+    try:
+        # Case 1: Single Git repository
+        if (work_dir / ".git").exists():
+            _print_authors([work_dir], since, all_commits, writer)
+            return
+
+        # Case 2: Directory containing multiple Git repositories
+        repo_discovery = RepoDiscoveryService(base_dir=work_dir, max_depth=max_depth, cache=DiscoveryCache())
+        repos = repo_discovery.find_repositories()
+        if not repos:
+            ui.print(f"[red]No Git repositories found in {work_dir}[/red]")
+            raise typer.Exit(code=1)
+
+        ui.print(f"[bold blue]Found {len(repos)} repositories under {work_dir}[/bold blue]")
+        _print_authors(repos, since, all_commits, writer)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _print_authors(repos: list[Path], since: str, all_commits: bool, writer: RecordWriter | None = None) -> None:
+    """Collect authors from every repository concurrently and print them with commit counts."""
+    started = time.perf_counter()
     since_date = None if all_commits else parse_since(since)
-    repo = Repo(path)
-    authors: Set[str] = set()
+    on_repository = partial(_emit_repository, writer, started) if writer is not None else None
+    authors, errors = AuthorService().collect(repos, since=since_date, on_repository=on_repository)
+
+    if writer is not None:
+        writer.emit(
+            {
+                "command": "list-authors",
+                "type": "authors",
+                "since": None if all_commits else since,
+                "repositories": len(repos),
+                "authors": [author.model_dump(mode="json") for author in authors],
+                "timings": {"elapsed_ms": round((time.perf_counter() - started) * 1000, 2)},
+            }
+        )
+        return
 
-    for commit in repo.iter_commits(since=since_date):
-        authors.add(f"{commit.author.name} <{commit.author.email}>")
+    for repo, error in errors.items():
+        console.print(f"[red]Error reading authors in {repo}: {error}[/red]")
 
     if not authors:
         console.print("[yellow]No commits found in the given range.[/yellow]")
         raise typer.Exit(code=0)
 
-    header = f"Authors from the last {since}" if not all_commits else "All authors in repository"
-    console.print(f"\n[bold]{header}[/bold]\n")
-
-    for idx, author in enumerate(sorted(authors), start=1):
-        console.print(f"[cyan]{idx}.[/cyan] {author}")
-
-    console.print(f"\n[green]Total unique authors: {len(authors)}[/green]")
+    scope = f"across {len(repos)} repositories" if len(repos) > 1 else "in repository"
+    header = f"Authors from the last {since}" if not all_commits else f"All authors {scope}"
+    if len(repos) > 1 and not all_commits:
+        header = f"{header} {scope}"
+    with phase("render"):
+        console.print(f"\n[bold]{header}[/bold]\n")
+        for idx, author in enumerate(authors, start=1):
+            console.print(f"[cyan]{idx}.[/cyan] {_describe(author, multi_repo=len(repos) > 1)}")
+        console.print(f"\n[green]Total unique authors: {len(authors)}[/green]")
+
+
+def _emit_repository(writer: RecordWriter, started: float, result: RepoAuthors) -> None:
+    """Emit the record for one repository as soon as `AuthorService` has read it."""
+    writer.emit(
+        {
+            "command": "list-authors",
+            "type": "repository",
+            "repo": str(result.repo),
+            "name": result.repo.name,
+            "status": "error" if result.error else "ok",
+            "error": result.error,
+            "authors": [
+                {
+                    "name": entry.name,
+                    "email": entry.email,
+                    "commits": entry.commits,
+                    "first_seen": _iso(entry.first_seen),
+                    "last_seen": _iso(entry.last_seen),
+                }
+                for entry in sorted(result.activity, key=lambda a: (-a.commits, a.name.lower()))
+            ],
+            "timings": {
+                "read_ms": round(result.elapsed_ms, 2),
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            },
+            "cache": {"author_index": result.index_status},
+        }
+    )
+
+
+def _iso(timestamp: int) -> str:
+    """Format a Unix timestamp as an ISO 8601 UTC string, the way pydantic serializes `AuthorStats` dates."""
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _describe(author: AuthorStats, multi_repo: bool) -> str:
+    """Format one author line: identity, commit count, last commit date and (for several repos) where."""
+    identity = f"{author.name} <{author.email}>" if author.email else author.name
+    plural = "commit" if author.commits == 1 else "commits"
+    line = f"{identity} [dim]— {author.commits} {plural}"
+    if author.last_seen is not None:
+        line += f", last {author.last_seen:%Y-%m-%d}"
+    line += "[/dim]"
+    if multi_repo:
+        line += f" [dim]in {', '.join(author.repositories)}[/dim]"
+    return line
@@ -0,0 +1,53 @@
+"""Render the phase breakdown collected by ``--profile``."""
+
+from __future__ import annotations
+
+from rich.console import Console
+from rich.table import Table
+
+from gitgossip.utils.profiler import PhaseProfiler
+
+
+def report_profile(profiler: PhaseProfiler, console: Console) -> None:
+    """Print phases sorted by self wall time, plus whatever no phase accounted for.
+
+    With memory tracking on (``--mem-report``) a column shows the peak traced
+    allocation while each phase was open, and the total row the run's peak.
+    """
+    wall, cpu = profiler.elapsed
+    timings = profiler.timings()
+    memory = profiler.memory
+
+    table = Table(title="Phase profile", title_style="bold cyan")
+    columns = ["Phase", "Calls", "Wall (s)", "CPU (s)", "% of run"] + (["Peak (MiB)"] if memory else [])
+    for column in columns:
+        table.add_column(column, justify="left" if column == "Phase" else "right")
+    for timing in timings:
+        share = f"{timing.wall_s / wall * 100:.1f}" if wall else "-"
+        row = [timing.name, str(timing.calls), f"{timing.wall_s:.3f}", f"{timing.cpu_s:.3f}", share]
+        table.add_row(*row, *([_mib(timing.peak_bytes)] if memory else []))
+
+    attributed = sum(t.wall_s for t in timings)
+    if attributed < wall:
+        other = wall - attributed
+        table.add_row(
+            "[dim]other[/dim]", "", f"{other:.3f}", "", f"{other / wall * 100:.1f}", *([""] if memory else [])
+        )
+    total = ["[bold]TOTAL[/bold]", "", f"{wall:.3f}", f"{cpu:.3f}", ""]
+    table.add_row(*total, *([_mib(profiler.peak_bytes)] if memory else []))
+    console.print(table)
+
+    if attributed > wall:
+        console.print("[dim]Phases ran concurrently, so their wall times add up to more than the run.[/dim]")
+    if memory:
+        console.print("[dim]Peaks are traced Python allocations (tracemalloc), which slows the run down.[/dim]")
+    if profiler.cprofile_path is not None:
+        console.print(
+            f"[dim]cProfile dump (main thread) written to {profiler.cprofile_path} — "
+            f"inspect with `python -m pstats {profiler.cprofile_path}`.[/dim]"
+        )
+
+
+def _mib(value: int | None) -> str:
+    """Format a byte count in MiB."""
+    return f"{value / 2**20:.1f}" if value is not None else "-"
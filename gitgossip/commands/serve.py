@@ -0,0 +1,50 @@
+"""Run the GitGossip daemon in the foreground."""
+
+from __future__ import annotations
+
+import logging
+import signal
+import threading
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from gitgossip.core.factories.llm_analyzer_factory import LLMAnalyzerFactory
+from gitgossip.daemon.client import DISABLE_ENV, resolve_socket_path
+from gitgossip.daemon.server import DaemonServer
+
+console = Console()
+
+
+def serve_cmd(socket_path: str | None = None) -> None:
+    """Listen on a Unix socket and run summarize / digest / list-authors / commit hook requests warm.
+
+    Stops on Ctrl+C or SIGTERM and removes the socket on the way out.
+    """
+    path = Path(socket_path).expanduser() if socket_path else resolve_socket_path()
+    try:
+        server = DaemonServer(path)
+    except OSError as e:
+        console.print(f"[red]Cannot start daemon: {e}[/red]")
+        raise typer.Exit(code=1) from e
+
+    _warm_up()
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown, daemon=True).start())
+    console.print(f"[green]GitGossip daemon listening on {path}[/green] (set {DISABLE_ENV}=1 to bypass it)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        console.print("[dim]Daemon stopped.[/dim]")
+
+
+def _warm_up() -> None:
+    """Build the configured analyzer once so the LLM client stack is imported and its client cached."""
+    try:
+        LLMAnalyzerFactory().get_analyzer(show_status=False)
+    except Exception as e:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+        # Warm-up is best effort; requests report real errors.
+        logging.getLogger("gitgossip.daemon").warning("LLM not configured yet (%s); mock requests still work.", e)
@@ -0,0 +1,76 @@
+"""Render and persist per-call LLM statistics collected during a command run."""
+
+from __future__ import annotations
+
+import datetime
+import json
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from gitgossip.core.llm.telemetry import LLMStatsRecorder
+
+
+def report_stats(
+    recorder: LLMStatsRecorder | None,
+    console: Console,
+    command: str,
+    show_table: bool,
+    json_path: str | None,
+) -> None:
+    """Print the aggregate table and/or append the run to a JSON-lines stats file."""
+    if recorder is None:
+        return
+    rows = recorder.aggregate()
+    if show_table:
+        _print_table(console, rows)
+    if json_path:
+        _append_json(Path(json_path).expanduser(), command, recorder, rows)
+
+
+def _print_table(console: Console, rows: list[dict[str, Any]]) -> None:
+    """Render aggregated rows as a Rich table."""
+    if not rows:
+        console.print("[yellow]No LLM calls were made.[/yellow]")
+        return
+
+    table = Table(title="LLM call statistics", title_style="bold cyan")
+    for column in ("Operation", "Calls", "Prompt (s)", "Wall (s)", "Avg (s)", "Avg TTFT (s)"):
+        table.add_column(column, justify="left" if column == "Operation" else "right")
+    for column in ("Prompt tok", "Cached tok", "Completion tok", "Tok/s", "Retries", "Failed"):
+        table.add_column(column, justify="right")
+
+    for row in rows:
+        estimated = "~" if row["tokens_estimated"] else ""
+        table.add_row(
+            f"[bold]{row['operation']}[/bold]" if row["operation"] == "TOTAL" else row["operation"],
+            str(row["calls"]),
+            f"{row['prompt_ms'] / 1000:.2f}",
+            f"{row['wall_ms'] / 1000:.2f}",
+            f"{row['avg_wall_ms'] / 1000:.2f}",
+            f"{row['avg_ttft_ms'] / 1000:.2f}" if row["avg_ttft_ms"] is not None else "-",
+            f"{estimated}{row['prompt_tokens']}",
+            str(row["cached_tokens"]),
+            f"{estimated}{row['completion_tokens']}",
+            f"{row['tokens_per_second']:.1f}" if row["tokens_per_second"] is not None else "-",
+            str(row["retries"]),
+            str(row["failures"]),
+        )
+    console.print(table)
+    if any(row["tokens_estimated"] for row in rows):
+        console.print("[dim]~ token counts estimated from text length (provider reported no usage).[/dim]")
+
+
+def _append_json(path: Path, command: str, recorder: LLMStatsRecorder, rows: list[dict[str, Any]]) -> None:
+    """Append one JSON record for this run so stats can be tracked over time."""
+    record = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "command": command,
+        "operations": rows,
+        "calls": [call.model_dump() for call in recorder.calls],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
@@ -2,90 +2,201 @@
 
 from __future__ import annotations
 
+import time
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Any, NamedTuple
 
 import typer
 from git import InvalidGitRepositoryError, NoSuchPathError
 from rich.console import Console
 from rich.panel import Panel
 
+from gitgossip.commands.stats_report import report_stats
 from gitgossip.core.factories.llm_analyzer_factory import LLMAnalyzerFactory
+from gitgossip.core.interfaces.llm_analyzer import ILLMAnalyzer
+from gitgossip.core.llm.telemetry import LLMStatsRecorder, scoped_calls
+from gitgossip.core.models.repo_summary import RepoSummary
 from gitgossip.core.parsers.commit_parser import CommitParser
 from gitgossip.core.providers.git_repo_provider import GitRepoProvider
+from gitgossip.core.services.multi_repo_summarizer_service import MultiRepoSummarizerService
 from gitgossip.core.services.repo_discovery_service import RepoDiscoveryService
 from gitgossip.core.services.summarizer_service import SummarizerService
+from gitgossip.core.storage.discovery_cache import DiscoveryCache
+from gitgossip.utils.output import RecordWriter, llm_usage
+from gitgossip.utils.profiler import phase
 
 console = Console()
+err_console = Console(stderr=True)
 
 
-def summarize_cmd(
+class _Run(NamedTuple):
+    """Options and shared state of one ``summarize`` invocation."""
+
+    author: str | None
+    since: str | None
+    use_mock: bool
+    jobs: int
+    ordered: bool
+    max_depth: int
+    recorder: LLMStatsRecorder | None
+    writer: RecordWriter | None
+    started: float
+
+
+def summarize_cmd(  # pylint: disable=too-many-arguments
     path: str,
+    *,
     author: str | None = None,
     since: str | None = None,
     use_mock: bool = False,
+    stats: bool = False,
+    stats_json: str | None = None,
+    jobs: int = 1,
+    ordered: bool = False,
+    max_depth: int = 1,
+    output_format: str = "text",
 ) -> None:
     """Summarize recent commits for a repository (or multiple) using AI.
 
     Produces a single natural-language summary string describing changes.
+    With ``jobs > 1`` several repositories are processed concurrently and
+    printed as they finish (or in discovery order with ``ordered``). With
+    ``output_format`` ``"json"`` or ``"ndjson"`` each repository becomes one
+    record on stdout, and spinners and panels are switched off.
+    """
+    writer = RecordWriter(output_format) if output_format != "text" else None
+    recorder = LLMStatsRecorder() if stats or stats_json or writer else None
+    run = _Run(author, since, use_mock, jobs, ordered, max_depth, recorder, writer, time.perf_counter())
+    try:
+        _summarize_path(Path(path).expanduser().resolve(), run)
+    finally:
+        if writer is not None:
+            writer.close()
+        report_stats(recorder, _ui(writer), command="summarize", show_table=stats, json_path=stats_json)
+
+
+def _ui(writer: RecordWriter | None) -> Console:
+    """Return the console for human-facing messages: stderr when stdout carries records."""
+    return console if writer is None else err_console
+
+
+def _summarize_path(work_dir: Path, run: _Run) -> None:
+    """Summarize a single repository or every repository discovered under ``work_dir``.
+
+    The analyzer (config, chat client and its HTTP connection pool, prompt
+    builder) is built once and shared by every repository.
     """
-    work_dir = Path(path).expanduser().resolve()
+    show_status = run.writer is None
 
     # Case 1: Direct git repo
     if (work_dir / ".git").exists():
-        _summarize_repo(work_dir, author, since, use_mock)
+        analyzer = _build_analyzer(run, show_status=show_status)
+        _report(_summarize_repo(0, work_dir, run.author, run.since, analyzer), run)
         return
 
     # Case 2: Folder containing multiple repos
-    repo_discovery = RepoDiscoveryService(base_dir=work_dir)
+    repo_discovery = RepoDiscoveryService(base_dir=work_dir, max_depth=run.max_depth, cache=DiscoveryCache())
     repos = repo_discovery.find_repositories()
     if not repos:
-        console.print(f"[red]No git repositories found in {work_dir}[/red]")
+        _ui(run.writer).print(f"[red]No git repositories found in {work_dir}[/red]")
         raise typer.Exit(code=1)
 
-    console.print(f"[bold blue]Found {len(repos)} repositories under {work_dir}[/bold blue]\n")
-    for repo in repos:
-        console.rule(f"[bold cyan]{repo.name}[/bold cyan]")
-        _summarize_repo(repo, author, since, use_mock)
+    _ui(run.writer).print(f"[bold blue]Found {len(repos)} repositories under {work_dir}[/bold blue]\n")
+    if run.jobs > 1 and len(repos) > 1:
+        _summarize_concurrently(repos, _build_analyzer(run, show_status=False), run)
+        return
 
+    analyzer = _build_analyzer(run, show_status=show_status)
+    for index, repo in enumerate(repos):
+        if run.writer is None:
+            console.rule(f"[bold cyan]{repo.name}[/bold cyan]")
+        _report(_summarize_repo(index, repo, run.author, run.since, analyzer), run)
 
-def _summarize_repo(
-    repo_path: Path,
-    author: str | None,
-    since: str | None,
-    use_mock: bool,
-) -> None:
-    """Summarize commits for a single repository using the LLM analyzer."""
+
+def _summarize_concurrently(repos: list[Path], analyzer: ILLMAnalyzer, run: _Run) -> None:
+    """Summarize repositories on ``run.jobs`` workers, reporting each result as soon as it is released."""
+    service = MultiRepoSummarizerService(llm_analyzer=analyzer, jobs=run.jobs)
+    status = f"[bold cyan]Summarizing {len(repos)} repositories with {run.jobs} jobs..."
+    with console.status(status, spinner="dots") if run.writer is None else nullcontext():
+        for result in service.summarize_repositories(repos, author=run.author, since=run.since, ordered=run.ordered):
+            if run.writer is None:
+                console.rule(f"[bold cyan]{result.repo_path.name}[/bold cyan]")
+            _report(result, run)
+
+
+def _build_analyzer(run: _Run, show_status: bool = True) -> ILLMAnalyzer:
+    """Initialize the analyzer (mock or real) once per command run."""
     try:
-        # Initialize analyzer (mock or real)
-        analyzer = LLMAnalyzerFactory().get_analyzer(use_mock=use_mock)
-        summarizer = SummarizerService(
-            commit_parser=CommitParser(repo_provider=GitRepoProvider(path=repo_path)),
-            llm_analyzer=analyzer,
+        return LLMAnalyzerFactory().get_analyzer(
+            use_mock=run.use_mock, stats_recorder=run.recorder, show_status=show_status
         )
-
-        summary_text = summarizer.summarize_repository(author=author, since=since)
-    except (FileNotFoundError, InvalidGitRepositoryError, NoSuchPathError) as e:
-        console.print(f"[red]Invalid repository at {repo_path}: {e}[/red]")
-        return
     except (OSError, ValueError) as e:
-        console.print(f"[red]Error reading commits in {repo_path}: {e}[/red]")
-        return
+        _ui(run.writer).print(f"[red]Failed to initialize LLM analyzer: {e}[/red]")
+        raise typer.Exit(code=1) from e
 
-    if not summary_text:
-        console.print(f"[yellow]No commits found in {repo_path.name}.[/yellow]\n")
-        return
 
-    # Display AI summary
-    _print_summary(repo_path, summary_text)
+def _summarize_repo(
+    index: int,
+    repo_path: Path,
+    author: str | None,
+    since: str | None,
+    analyzer: ILLMAnalyzer,
+) -> RepoSummary:
+    """Summarize commits for a single repository using the shared LLM analyzer."""
+    with scoped_calls() as calls:
+        try:
+            summarizer = SummarizerService(
+                commit_parser=CommitParser(repo_provider=GitRepoProvider(path=repo_path)),
+                llm_analyzer=analyzer,
+            )
+
+            summary_text = summarizer.summarize_repository(author=author, since=since)
+        except (FileNotFoundError, InvalidGitRepositoryError, NoSuchPathError) as e:
+            error = f"Invalid repository at {repo_path}: {e}"
+            return RepoSummary(index=index, repo_path=repo_path, error=error, llm_calls=calls)
+        except (OSError, ValueError) as e:
+            error = f"Error reading commits in {repo_path}: {e}"
+            return RepoSummary(index=index, repo_path=repo_path, error=error, llm_calls=calls)
+    return RepoSummary(index=index, repo_path=repo_path, summary=summary_text or "", llm_calls=calls)
+
+
+def _report(result: RepoSummary, run: _Run) -> None:
+    """Print one repository's outcome, or emit it as a record when writing machine-readable output."""
+    if run.writer is not None:
+        run.writer.emit(_record(result, run.started))
+    elif result.error:
+        console.print(f"[red]{result.error}[/red]")
+    elif not result.summary:
+        console.print(f"[yellow]No commits found in {result.repo_path.name}.[/yellow]\n")
+    else:
+        _print_summary(result.repo_path, result.summary)
+
+
+def _record(result: RepoSummary, started: float) -> dict[str, Any]:
+    """Build the ``--format json|ndjson`` record for one repository."""
+    usage = llm_usage(result.llm_calls)
+    usage["timings"]["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return {
+        "command": "summarize",
+        "type": "repository",
+        "repo": str(result.repo_path),
+        "name": result.repo_path.name,
+        "status": "error" if result.error else ("ok" if result.summary else "empty"),
+        "summary": result.summary.strip(),
+        "error": result.error,
+        **usage,
+    }
 
 
 def _print_summary(repo_path: Path, summary: str) -> None:
     """Pretty-print the repository summary in a Rich panel."""
-    console.print(
-        Panel.fit(
-            summary.strip(),
-            title=f"[bold green]AI Summary for {repo_path.name}[/bold green]",
-            border_style="cyan",
-            padding=(1, 2),
+    with phase("render"):
+        console.print(
+            Panel.fit(
+                summary.strip(),
+                title=f"[bold green]AI Summary for {repo_path.name}[/bold green]",
+                border_style="cyan",
+                padding=(1, 2),
+            )
         )
-    )
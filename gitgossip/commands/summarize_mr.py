@@ -2,50 +2,122 @@
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
+from typing import Any
 
 import typer
 from git import GitCommandError, Repo
 from rich.console import Console
 from rich.panel import Panel
 
+from gitgossip.commands.stats_report import report_stats
+from gitgossip.config.config_service import ConfigService
 from gitgossip.core.factories.llm_analyzer_factory import LLMAnalyzerFactory
+from gitgossip.core.llm.telemetry import LLMStatsRecorder
 from gitgossip.core.parsers.commit_parser import CommitParser
 from gitgossip.core.providers.git_repo_provider import GitRepoProvider
 from gitgossip.core.services.summarizer_service import SummarizerService
+from gitgossip.utils.output import RecordWriter, llm_usage
+from gitgossip.utils.profiler import phase
+
+DEFAULT_DIFF_MEMORY_MB = 16
 
 console = Console()
+err_console = Console(stderr=True)
+
 
+def summarize_mr_cmd(
+    target_branch: str,
+    path: str,
+    *,
+    pull: bool = False,
+    use_mock: bool = False,
+    stats: bool = False,
+    stats_json: str | None = None,
+    output_format: str = "text",
+) -> None:
+    """Generate a professional Merge Request title & description from code differences.
 
-def summarize_mr_cmd(target_branch: str, path: str, pull: bool = False, use_mock: bool = False) -> None:
-    """Generate a professional Merge Request title & description from code differences."""
-    console.print(f"[bold green]Preparing to generate MR summary for target branch:[/bold green] {target_branch}")
+    With ``output_format`` ``"json"`` or ``"ndjson"`` the result is one record
+    on stdout; progress messages go to stderr and spinners are switched off.
+    """
+    started = time.perf_counter()
+    writer = RecordWriter(output_format) if output_format != "text" else None
+    ui = console if writer is None else err_console
+    ui.print(f"[bold green]Preparing to generate MR summary for target branch:[/bold green] {target_branch}")
 
     if pull:
-        try:
-            repo = Repo(path)
-            current_branch = repo.active_branch.name
-            console.print(f"[blue]Fetching latest updates for '{target_branch}'...[/blue]")
-            repo.git.fetch("origin", target_branch)
-            repo.git.checkout(target_branch)
-            repo.git.pull("origin", target_branch)
-            repo.git.checkout(current_branch)
-            console.print(f"[green]✅ Refreshed target branch '{target_branch}' successfully.[/green]\n")
-        except GitCommandError as e:
-            console.print(f"[red]Failed to update target branch: {e}[/red]")
-            raise typer.Exit(code=1)
-        except Exception as e:
-            console.print(f"[red]Unexpected error while pulling branch: {e}[/red]")
+        _refresh_target_branch(path, target_branch, ui)
+    recorder = LLMStatsRecorder() if stats or stats_json or writer else None
+    try:
+        summarizer = _build_summarizer(path, use_mock, recorder, show_progress=writer is None)
+        title, description = summarizer.summarize_for_merge_request(target_branch)
+        if writer is not None:
+            writer.emit(_record(path, target_branch, title, description, recorder=recorder, started=started))
+        else:
+            _print_summary(path, title, description)
+
+        if _is_error(title):
+            ui.print(f"[red]❌ Failed to generate MR summary: {description}[/red]")
             raise typer.Exit(code=1)
+
+        ui.print("\n[green]✨ Merge Request summary generated successfully![/green]")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        ui.print(f"[red]Error generating MR summary: {e}[/red]")
+        if writer is not None:
+            writer.emit(_record(path, target_branch, "", "", recorder=recorder, started=started, error=str(e)))
+        raise typer.Exit(code=1)
+    finally:
+        if writer is not None:
+            writer.close()
+        report_stats(recorder, ui, command="summarize-mr", show_table=stats, json_path=stats_json)
+
+
+def _refresh_target_branch(path: str, target_branch: str, ui: Console) -> None:
+    """Fetch and fast-forward ``target_branch`` from origin, then return to the current branch."""
     try:
-        analyzer = LLMAnalyzerFactory().get_analyzer(use_mock=use_mock)
+        repo = Repo(path)
+        current_branch = repo.active_branch.name
+        ui.print(f"[blue]Fetching latest updates for '{target_branch}'...[/blue]")
+        repo.git.fetch("origin", target_branch)
+        repo.git.checkout(target_branch)
+        repo.git.pull("origin", target_branch)
+        repo.git.checkout(current_branch)
+        ui.print(f"[green]✅ Refreshed target branch '{target_branch}' successfully.[/green]\n")
+    except GitCommandError as e:
+        ui.print(f"[red]Failed to update target branch: {e}[/red]")
+        raise typer.Exit(code=1)
+    except Exception as e:
+        ui.print(f"[red]Unexpected error while pulling branch: {e}[/red]")
+        raise typer.Exit(code=1)
 
-        summarizer = SummarizerService(
-            commit_parser=CommitParser(repo_provider=GitRepoProvider(path=Path(path))),
-            llm_analyzer=analyzer,
-        )
 
-        title, description = summarizer.summarize_for_merge_request(target_branch)
+def _build_summarizer(
+    path: str, use_mock: bool, recorder: LLMStatsRecorder | None, show_progress: bool
+) -> SummarizerService:
+    """Build the summarizer with the ``merge_request.diff_memory_mb`` spool budget from the config."""
+    analyzer = LLMAnalyzerFactory().get_analyzer(use_mock=use_mock, stats_recorder=recorder, show_status=show_progress)
+    mr_cfg: dict[str, Any] = ConfigService().load().get("merge_request") or {}
+    return SummarizerService(
+        commit_parser=CommitParser(repo_provider=GitRepoProvider(path=Path(path))),
+        llm_analyzer=analyzer,
+        max_diff_memory=int(float(mr_cfg.get("diff_memory_mb", DEFAULT_DIFF_MEMORY_MB)) * 2**20),
+        show_progress=show_progress,
+    )
+
+
+def _is_error(title: str) -> bool:
+    """Return whether the summarizer reported a failure in place of a title."""
+    return title.startswith(("[LLM ERROR]", "[SYSTEM ERROR]"))
+
+
+def _print_summary(path: str, title: str, description: str) -> None:
+    """Pretty-print the merge request title and description in a Rich panel."""
+    with phase("render"):
         console.print(
             Panel.fit(
                 f"[bold underline]{title}[/bold underline]\n\n{description.strip()}",
@@ -55,12 +127,29 @@ def summarize_mr_cmd(target_branch: str, path: str, pull: bool = False, use_mock
             )
         )
 
-        if title.startswith("[LLM ERROR]") or title.startswith("[SYSTEM ERROR]"):
-            console.print(f"[red]❌ Failed to generate MR summary: {description}[/red]")
-            raise typer.Exit(code=1)
-
-        console.print("\n[green]✨ Merge Request summary generated successfully![/green]")
 
-    except Exception as e:
-        console.print(f"[red]Error generating MR summary: {e}[/red]")
-        raise typer.Exit(code=1)
+def _record(
+    path: str,
+    target_branch: str,
+    title: str,
+    description: str,
+    *,
+    recorder: LLMStatsRecorder | None,
+    started: float,
+    error: str | None = None,
+) -> dict[str, Any]:
+    """Build the ``--format json|ndjson`` record for a merge request summary."""
+    failed = error is not None or _is_error(title)
+    usage = llm_usage(recorder.calls if recorder is not None else [])
+    usage["timings"]["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return {
+        "command": "summarize-mr",
+        "type": "merge_request",
+        "repo": str(Path(path).expanduser().resolve()),
+        "target_branch": target_branch,
+        "status": "error" if failed else "ok",
+        "title": title,
+        "description": description.strip(),
+        "error": error or (description.strip() if failed else None),
+        **usage,
+    }
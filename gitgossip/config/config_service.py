@@ -2,50 +2,74 @@
 
 from __future__ import annotations
 
+import copy
 import datetime
+import hashlib
+import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from ruamel.yaml import YAML
-from ruamel.yaml.error import YAMLError
+from gitgossip.core.constants import CACHE_DIR
 
 
 class ConfigService:
-    """Manages GitGossip configuration persistence."""
+    """Manages GitGossip configuration persistence.
+
+    Reads are served from a per-process memo and, across processes, from a
+    JSON snapshot under ``CACHE_DIR/config``; both are validated against the
+    YAML file's mtime and size. ``ruamel.yaml`` is only imported when the YAML
+    actually has to be parsed (the file changed) or written.
+    """
 
     DEFAULT_CONFIG_PATH = Path.home() / ".gitgossip" / "config.yaml"
+    SNAPSHOT_DIR = CACHE_DIR / "config"
+    SNAPSHOT_VERSION = 1
+
+    # config path -> ([mtime_ns, size], parsed config) for configs already read in this process
+    _memo: dict[Path, tuple[list[int], Dict[str, Any]]] = {}
 
     def __init__(self, config_path: Optional[Path] = None) -> None:
         """Initialize the ConfigService with optional custom config path."""
-        self._yaml = YAML()
-        self._yaml.default_flow_style = False
-        self._yaml.indent(mapping=2, sequence=4, offset=2)
+        self._yaml: Any = None  # round-trip ruamel parser, built on first parse or save
         self._path = config_path or self.DEFAULT_CONFIG_PATH
         self._logger = logging.getLogger(self.__class__.__name__)
 
     def load(self) -> Dict[str, Any]:
-        """Load config from disk. Returns an empty default if missing or invalid."""
-        if not self._path.exists():
+        """Load config from disk. Returns an empty default if missing or invalid.
+
+        The result is a private copy; mutate it freely and pass it to `save`.
+        """
+        signature = self._signature()
+        if signature is None:
             self._logger.info("No config file found at %s. Returning default config.", self._path)
             return self._default_config()
 
-        try:
-            with self._path.open("r", encoding="utf-8") as f:
-                config = self._yaml.load(f)
-                if not isinstance(config, dict):
-                    raise ValueError("Invalid config format (expected mapping).")
-                return config
-        except (FileNotFoundError, PermissionError, OSError, ValueError, YAMLError) as e:
-            self._logger.warning("Failed to load config at %s: %s", self._path, e)
+        config = self._cached(signature)
+        if config is None:
+            parsed = self._parse()
+            if parsed is None:
+                return self._default_config()
+            config = self._remember(signature, parsed)
+        return copy.deepcopy(config)
+
+    def load_for_edit(self) -> Dict[str, Any]:
+        """Parse the YAML file round-trip (comments and key order kept) for code that rewrites it."""
+        if not self._path.exists():
             return self._default_config()
+        config = self._parse()
+        return config if config is not None else self._default_config()
 
     def save(self, config: Dict[str, Any]) -> None:
         """Persist the given configuration dictionary to disk."""
         self._path.parent.mkdir(parents=True, exist_ok=True)
         with self._path.open("w", encoding="utf-8") as f:
-            self._yaml.dump(config, f)
+            self._parser().dump(config, f)
         self._logger.info("Configuration saved successfully to %s", self._path)
+        signature = self._signature()
+        if signature is not None:
+            self._remember(signature, config)
 
     def ensure_exists(self) -> Dict[str, Any]:
         """Ensure config file exists, returning it or initializing defaults."""
@@ -54,7 +78,7 @@ class ConfigService:
             default = self._default_config()
             self.save(default)
             return default
-        return self.load()
+        return self.load_for_edit()
 
     def update(self, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Merge updates into existing config and save."""
@@ -67,6 +91,92 @@ class ConfigService:
         """Public wrapper to retrieve default config (for tests or CLI init)."""
         return self._default_config()
 
+    def _parser(self) -> Any:
+        """Return the round-trip YAML parser, importing ruamel.yaml on first use."""
+        if self._yaml is None:
+            from ruamel.yaml import YAML
+
+            yaml = YAML()
+            yaml.default_flow_style = False
+            yaml.indent(mapping=2, sequence=4, offset=2)
+            self._yaml = yaml
+        return self._yaml
+
+    def _parse(self) -> Dict[str, Any] | None:
+        """Parse the YAML file; None (after logging a warning) when it is unreadable or not a mapping."""
+        from ruamel.yaml.error import YAMLError
+
+        try:
+            with self._path.open("r", encoding="utf-8") as f:
+                config = self._parser().load(f)
+                if not isinstance(config, dict):
+                    raise ValueError("Invalid config format (expected mapping).")
+                return config
+        except (FileNotFoundError, PermissionError, OSError, ValueError, YAMLError) as e:
+            self._logger.warning("Failed to load config at %s: %s", self._path, e)
+            return None
+
+    def _signature(self) -> list[int] | None:
+        """Return ``[mtime_ns, size]`` of the config file, or None when it does not exist."""
+        try:
+            stat = self._path.stat()
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _snapshot_path(self) -> Path:
+        """Return where the JSON snapshot of this config file lives."""
+        digest = hashlib.sha1(str(self._path.expanduser().resolve()).encode("utf-8")).hexdigest()[:16]
+        return self.SNAPSHOT_DIR / f"{digest}.json"
+
+    def _cached(self, signature: list[int]) -> Dict[str, Any] | None:
+        """Return the memoized or snapshotted config when it still matches ``signature``."""
+        memo = ConfigService._memo.get(self._path)
+        if memo is not None and memo[0] == signature:
+            return memo[1]
+        try:
+            data = json.loads(self._snapshot_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != self.SNAPSHOT_VERSION
+            or data.get("path") != str(self._path)
+            or data.get("signature") != signature
+            or not isinstance(data.get("config"), dict)
+        ):
+            return None
+        config: Dict[str, Any] = data["config"]
+        ConfigService._memo[self._path] = (signature, config)
+        return config
+
+    def _remember(self, signature: list[int], config: Dict[str, Any]) -> Dict[str, Any]:
+        """Memoize ``config`` and write its snapshot; return the plain-dict copy that was stored.
+
+        Values JSON cannot represent (e.g. YAML timestamps) keep the parsed
+        object in the memo and skip the snapshot. The snapshot may hold API
+        keys, so it is created readable by the current user only.
+        """
+        try:
+            plain: Dict[str, Any] = json.loads(json.dumps(config))
+        except (TypeError, ValueError):
+            ConfigService._memo[self._path] = (signature, copy.deepcopy(config))
+            return ConfigService._memo[self._path][1]
+
+        ConfigService._memo[self._path] = (signature, plain)
+        data = {"version": self.SNAPSHOT_VERSION, "path": str(self._path), "signature": signature, "config": plain}
+        target = self._snapshot_path()
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, target)
+        except OSError as e:
+            self._logger.debug("Could not write config snapshot %s: %s", target, e)
+        return plain
+
     @staticmethod
     def _deep_update(base: Dict[str, Any], updates: Dict[str, Any]) -> None:
         """Recursively update nested dictionaries."""
@@ -88,6 +198,14 @@ class ConfigService:
                 "api_key": None,
                 "timeout": 120,  # seconds, agent provider only
             },
+            "commit": {
+                "hook_deadline": 3,  # seconds `commit --hook` may spend before leaving the message alone
+                "hook_fallback": "none",  # none | heuristic (message guessed from staged paths)
+                "candidates": 1,  # messages generated concurrently by interactive `commit` (regenerate is instant)
+            },
+            "merge_request": {
+                "diff_memory_mb": 16,  # diff kept in memory up to this size; larger diffs spill to a temp file
+            },
             "paths": {
                 "prompts": str(Path.home() / ".gitgossip" / "prompts"),
             },
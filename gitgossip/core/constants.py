@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from pathlib import Path
 
 # Files that add no semantic value to commit summaries
 IGNORED_DIFF_FILES: set[str] = {
@@ -39,6 +40,31 @@ DEFAULT_CONFIG = {
     "max_diff_size": MAX_DIFF_SIZE,
 }
 
+# Where GitGossip keeps rebuildable on-disk caches (discovery manifests, indexes, ...)
+CACHE_DIR = Path.home() / ".gitgossip" / "cache"
+
+# Unix socket of the `gitgossip serve` daemon (override with GITGOSSIP_SOCKET)
+DAEMON_SOCKET = Path.home() / ".gitgossip" / "gitgossip.sock"
+
+# Directory names (fnmatch globs) never descended into while discovering repositories
+DISCOVERY_SKIP_GLOBS: tuple[str, ...] = (
+    ".git",
+    "node_modules",
+    ".venv",
+    "venv",
+    "__pycache__",
+    ".tox",
+    ".nox",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".cache",
+    "build",
+    "dist",
+    "target",
+    "*.egg-info",
+)
+
 # Function / class detection patterns by language
 LANG_FUNC_PATTERNS = {
     "python": re.compile(r"^\s*(?:def|class)\s+([A-Za-z_][A-Za-z0-9_]*)", re.MULTILINE),
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -10,35 +12,107 @@ from gitgossip.config.config_service import ConfigService
 from gitgossip.core.interfaces.chat_client import IChatClient
 from gitgossip.core.interfaces.llm_analyzer import ILLMAnalyzer
 from gitgossip.core.llm.clients.agent_cli_chat_client import AgentCliChatClient
+from gitgossip.core.llm.clients.hedged_chat_client import HedgedChatClient
 from gitgossip.core.llm.clients.openai_chat_client import OpenAIChatClient
 from gitgossip.core.llm.llm_analyzer import LLMAnalyzer
 from gitgossip.core.llm.mock_llm_analyzer import MockLLMAnalyzer
 from gitgossip.core.llm.prompt_builder import PromptBuilder
+from gitgossip.core.llm.telemetry import LLMStatsRecorder
 
 
 class LLMAnalyzerFactory:
-    """Factory for constructing LLM analyzers based purely on user configuration."""
+    """Factory for constructing LLM analyzers based purely on user configuration.
+
+    By default every analyzer gets fresh chat clients. A long-lived process
+    (the ``gitgossip serve`` daemon) calls `keep_clients_warm` so clients, and
+    with them their HTTP connection pools and latency history, are shared by
+    every analyzer built from the same ``llm`` configuration.
+    """
+
+    _warm_clients: dict[str, IChatClient] | None = None
+    _warm_lock = threading.Lock()
+
+    @classmethod
+    def keep_clients_warm(cls) -> None:
+        """Reuse chat clients across `get_analyzer` calls for the rest of the process."""
+        if cls._warm_clients is None:
+            cls._warm_clients = {}
 
     def __init__(self) -> None:
         """Initialize an LLMAnalyzerFactory."""
         self.__logger = logging.getLogger(self.__class__.__name__)
         self.__config_service = ConfigService()
 
-    def get_analyzer(self, use_mock: bool = False) -> ILLMAnalyzer:
-        """Return a configured analyzer — Mock or real — depending on user settings."""
+    def get_analyzer(
+        self,
+        use_mock: bool = False,
+        stats_recorder: LLMStatsRecorder | None = None,
+        show_status: bool = True,
+    ) -> ILLMAnalyzer:
+        """Return a configured analyzer — Mock or real — depending on user settings.
+
+        ``stats_recorder`` collects per-call telemetry; the mock analyzer makes no calls and ignores it.
+        ``show_status`` toggles the per-call spinner (off when calls run concurrently).
+        """
         if use_mock:
             self.__logger.debug("Using MockLLMAnalyzer (explicit request).")
             return MockLLMAnalyzer()
 
         cfg = self.__config_service.load()
         llm_cfg: dict[str, Any] = cfg.get("llm", {})
-        provider = llm_cfg.get("provider")
-
-        chat_client = self.__build_agent_client(llm_cfg) if provider == "agent" else self.__build_openai_client(llm_cfg)
+        chat_client = self.__chat_client(llm_cfg)
 
         prompts_dir = cfg.get("paths", {}).get("prompts")
         prompt_builder = PromptBuilder(user_dir=Path(prompts_dir) if prompts_dir else None)
-        return LLMAnalyzer(chat_client=chat_client, prompt_builder=prompt_builder)
+        return LLMAnalyzer(
+            chat_client=chat_client,
+            prompt_builder=prompt_builder,
+            stats_recorder=stats_recorder,
+            show_status=show_status,
+        )
+
+    def __chat_client(self, llm_cfg: dict[str, Any]) -> IChatClient:
+        """Return the warm client for this configuration, building it on first use."""
+        warm = LLMAnalyzerFactory._warm_clients
+        if warm is None:
+            return self.__build_chat_client(llm_cfg)
+        key = json.dumps(llm_cfg, sort_keys=True, default=str)
+        with LLMAnalyzerFactory._warm_lock:
+            client = warm.get(key)
+            if client is None:
+                client = warm[key] = self.__build_chat_client(llm_cfg)
+        return client
+
+    def __build_chat_client(self, llm_cfg: dict[str, Any]) -> IChatClient:
+        """Build the primary client, wrapped in a HedgedChatClient when fallbacks are configured."""
+        primary = self.__build_single_client(llm_cfg)
+        fallbacks: list[dict[str, Any]] = llm_cfg.get("fallbacks") or []
+        if not fallbacks:
+            return primary
+
+        providers = [primary, *(self.__build_single_client(fallback) for fallback in fallbacks)]
+        names = [self.__describe(cfg) for cfg in (llm_cfg, *fallbacks)]
+        hedge_after = llm_cfg.get("hedge_after", 10)
+        self.__logger.debug("Initializing HedgedChatClient over: %s", ", ".join(names))
+        return HedgedChatClient(
+            providers=providers,
+            hedge_after=float(hedge_after) if hedge_after is not None else None,
+            percentile=float(llm_cfg.get("hedge_percentile") or 0.95),
+            names=names,
+        )
+
+    def __build_single_client(self, llm_cfg: dict[str, Any]) -> IChatClient:
+        """Build one transport from a provider section (the top-level llm block or a fallback entry)."""
+        if llm_cfg.get("provider") == "agent":
+            return self.__build_agent_client(llm_cfg)
+        return self.__build_openai_client(llm_cfg)
+
+    @staticmethod
+    def __describe(llm_cfg: dict[str, Any]) -> str:
+        """Return a short human-readable label for a provider section."""
+        if llm_cfg.get("provider") == "agent":
+            return f"agent:{llm_cfg.get('agent_cli')}"
+        return f"{llm_cfg.get('provider') or 'local'}:{llm_cfg.get('model')}"
 
     def __build_agent_client(self, llm_cfg: dict[str, Any]) -> IChatClient:
         """Build the subprocess-backed client for provider=agent."""
@@ -70,4 +144,27 @@ class LLMAnalyzerFactory:
             self.__logger.error(msg)
             raise ValueError(msg)
         self.__logger.debug("Initializing OpenAIChatClient: model=%s, base_url=%s", model, base_url)
-        return OpenAIChatClient(base_url=str(base_url), model=str(model), api_key=llm_cfg.get("api_key"))
+        return OpenAIChatClient(
+            base_url=str(base_url),
+            model=str(model),
+            api_key=llm_cfg.get("api_key"),
+            max_retries=int(llm_cfg.get("max_retries", 2)),
+            stream=bool(llm_cfg.get("stream", False)),
+            cache_hints=self.__cache_hints(llm_cfg),
+            pool_size=int(llm_cfg.get("pool_size", 10)),
+            keepalive_expiry=float(llm_cfg.get("keepalive_expiry", 30)),
+        )
+
+    @staticmethod
+    def __cache_hints(llm_cfg: dict[str, Any]) -> dict[str, Any]:
+        """Return prompt-cache request fields: explicit ``llm.cache_hints`` or safe defaults for local servers.
+
+        Local servers (Ollama, llama.cpp, LM Studio) ignore fields they do not know,
+        so both hints are sent by default. Hosted APIs may reject unknown fields and
+        already cache prefixes automatically, so nothing is sent unless configured.
+        """
+        if "cache_hints" in llm_cfg:
+            return dict(llm_cfg.get("cache_hints") or {})
+        if llm_cfg.get("provider", "local") == "local":
+            return {"cache_prompt": True, "keep_alive": "30m"}
+        return {}
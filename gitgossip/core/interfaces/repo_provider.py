@@ -6,6 +6,9 @@ from abc import ABC, abstractmethod
 
 from git import Repo
 
+from gitgossip.utils.diff_spool import DiffSpool
+from gitgossip.utils.staged_diff import StagedDiff
+
 
 class IRepoProvider(ABC):
     """Defines an abstract contract for accessing a Git repository.
@@ -24,8 +27,18 @@ class IRepoProvider(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_diff_between_branches(self, target_branch: str) -> str:
-        """Return textual diff between the current HEAD and the target branch."""
+    def write_diff_between_branches(self, target_branch: str, spool: DiffSpool) -> int:
+        """Write the diff between the current HEAD and the target branch into ``spool``; return the commit count."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_staged_changes(self) -> StagedDiff:
+        """Return the staged files (with status and line counts) and the staged patch in one read."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_staged_tree(self) -> str:
+        """Return the hash of the tree the index would commit (``git write-tree``)."""
         raise NotImplementedError
 
     @abstractmethod
@@ -7,6 +7,7 @@ import subprocess
 
 from gitgossip.core.interfaces.chat_client import IChatClient
 from gitgossip.core.llm.errors import ChatClientError
+from gitgossip.utils.tracing import span
 
 SUPPORTED_AGENT_CLIS = ("claude", "codex")
 
@@ -39,6 +40,13 @@ class AgentCliChatClient(IChatClient):
         Raises:
             ChatClientError: If the binary is missing, times out, exits non-zero, or prints nothing.
         """
+        with span("chat.agent_cli", cli=self.__agent_cli, model=self.__model) as current:
+            output = self.__complete(system, user)
+            current.set(output_chars=len(output))
+            return output
+
+    def __complete(self, system: str, user: str) -> str:
+        """Do the work of `complete`."""
         command = self.__build_command(f"{system}\n\n{user}")
         self.__logger.debug("Running agent CLI: %s", command[0])
         try:
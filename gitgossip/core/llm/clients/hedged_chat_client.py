@@ -0,0 +1,158 @@
+"""Composite chat client that hedges slow providers against an ordered list of fallbacks."""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+from gitgossip.core.interfaces.chat_client import IChatClient
+from gitgossip.core.llm.errors import ChatClientError
+from gitgossip.core.llm.latency_histogram import LatencyHistogram
+from gitgossip.core.llm.telemetry import attempt_call, merge_attempt
+from gitgossip.core.models.llm_call import LLMCallStats
+from gitgossip.utils.tracing import annotate, span
+
+
+class HedgedChatClient(IChatClient):
+    """Sends each completion to the first provider and hedges to the next one when it is slow.
+
+    If a provider has not answered within its hedge delay, the same request is
+    sent to the next provider and whichever finishes first wins. A provider that
+    fails outright triggers the next one immediately. The hedge delay for each
+    provider is its observed latency ``percentile`` once ``min_samples`` calls
+    have been seen, capped by the static ``hedge_after`` deadline.
+
+    Losing requests are abandoned rather than cancelled (neither the OpenAI SDK
+    nor a subprocess call can be interrupted safely); they run on daemon threads
+    and still feed the latency histograms when they eventually return. Each
+    request reports telemetry into its own attempt record, and only the
+    winner's is merged into the call being tracked.
+    """
+
+    def __init__(
+        self,
+        providers: list[IChatClient],
+        hedge_after: float | None = 10.0,
+        percentile: float = 0.95,
+        min_samples: int = 5,
+        names: list[str] | None = None,
+    ) -> None:
+        """Initialize with providers in priority order and the hedging policy."""
+        if not providers:
+            raise ValueError("HedgedChatClient requires at least one provider.")
+        if names is not None and len(names) != len(providers):
+            raise ValueError("names must match providers one-to-one.")
+        self.__providers = providers
+        self.__names = names or [f"provider-{idx}" for idx in range(len(providers))]
+        self.__hedge_after = hedge_after
+        self.__percentile = percentile
+        self.__min_samples = min_samples
+        self.__histograms = [LatencyHistogram() for _ in providers]
+        self.__logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def histograms(self) -> dict[str, LatencyHistogram]:
+        """Per-provider latency histograms keyed by provider name."""
+        return dict(zip(self.__names, self.__histograms))
+
+    def hedge_delay(self, index: int) -> float | None:
+        """Return how long to wait on provider ``index`` before hedging, or None to wait indefinitely."""
+        histogram = self.__histograms[index]
+        observed = histogram.percentile(self.__percentile) if histogram.count >= self.__min_samples else None
+        candidates = [value for value in (observed, self.__hedge_after) if value is not None]
+        return min(candidates) if candidates else None
+
+    def complete(self, system: str, user: str, temperature: float, max_tokens: int) -> str:
+        """Return the first successful completion across the provider list.
+
+        Raises:
+            ChatClientError: If every provider fails.
+        """
+        with span("chat.hedged", providers=len(self.__providers)):
+            return self.__complete(system, user, temperature, max_tokens)
+
+    def __complete(self, system: str, user: str, temperature: float, max_tokens: int) -> str:
+        """Do the work of `complete`."""
+        pending: dict[Future[tuple[str, LLMCallStats | None]], int] = {}
+        errors: list[str] = []
+        next_index = 0
+        hedge_at: float | None = None
+
+        def launch() -> None:
+            nonlocal next_index, hedge_at
+            pending[self.__submit(next_index, system, user, temperature, max_tokens)] = next_index
+            hedge_at = self.__hedge_deadline(next_index)
+            next_index += 1
+
+        launch()
+        while pending:
+            done = wait(pending, timeout=_remaining(hedge_at), return_when=FIRST_COMPLETED).done
+            if not done:
+                self.__logger.info(
+                    "%s has not answered within its hedge delay; hedging to %s",
+                    self.__names[next_index - 1],
+                    self.__names[next_index],
+                )
+                launch()
+                continue
+
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    return self.__accept(index, future, launched=next_index)
+                except ChatClientError as exc:
+                    self.__logger.warning("%s failed: %s", self.__names[index], exc)
+                    errors.append(f"{self.__names[index]}: {exc}")
+                    if next_index < len(self.__providers):
+                        launch()
+
+        raise ChatClientError("All providers failed. " + "; ".join(errors))
+
+    def __accept(self, index: int, future: Future[tuple[str, LLMCallStats | None]], launched: int) -> str:
+        """Return provider ``index``'s completion, merging its attempt record into the tracked call.
+
+        Raises:
+            ChatClientError: If the provider failed.
+        """
+        result, attempt = future.result()
+        if attempt is not None:
+            merge_attempt(attempt)
+        annotate(winner=self.__names[index], launched=launched)
+        return result
+
+    def __hedge_deadline(self, index: int) -> float | None:
+        """Return when to hedge past provider ``index`` (fixed at launch), or None when it is the last one."""
+        delay = self.hedge_delay(index) if index + 1 < len(self.__providers) else None
+        return None if delay is None else time.monotonic() + delay
+
+    def __submit(
+        self, index: int, system: str, user: str, temperature: float, max_tokens: int
+    ) -> Future[tuple[str, LLMCallStats | None]]:
+        """Run one provider call on a daemon thread, with its own attempt record, and expose both as a Future."""
+        future: Future[tuple[str, LLMCallStats | None]] = Future()
+        provider = self.__providers[index]
+        histogram = self.__histograms[index]
+
+        def run() -> None:
+            started = time.perf_counter()
+            try:
+                with attempt_call() as attempt, span("chat.hedge", provider=self.__names[index], index=index):
+                    result = provider.complete(system=system, user=user, temperature=temperature, max_tokens=max_tokens)
+            except Exception as exc:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+                future.set_exception(exc)
+                return
+            histogram.record(time.perf_counter() - started)
+            future.set_result((result, attempt))
+
+        # Carry the caller's context so chat clients can annotate the active telemetry record and trace span.
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(run,), name=f"hedge-{self.__names[index]}", daemon=True).start()
+        return future
+
+
+def _remaining(deadline: float | None) -> float | None:
+    """Return the seconds left until the monotonic ``deadline`` (never negative), or None when there is none."""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
@@ -3,20 +3,62 @@
 from __future__ import annotations
 
 import logging
+import time
+from typing import Any
 
-from openai import APIConnectionError, APIError, OpenAI, RateLimitError
+import httpx
+from openai import APIConnectionError, APIError, DefaultHttpxClient, InternalServerError, OpenAI, RateLimitError
 
 from gitgossip.core.interfaces.chat_client import IChatClient
+from gitgossip.core.llm import telemetry
 from gitgossip.core.llm.errors import ChatClientError
+from gitgossip.utils.tracing import annotate, span
+
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
 
 
 class OpenAIChatClient(IChatClient):
-    """Sends chat completions through the OpenAI SDK."""
+    """Sends chat completions through the OpenAI SDK.
+
+    Retries are handled here rather than inside the SDK so each one can be
+    counted in the call telemetry. With ``stream=True`` the response is read
+    incrementally, which lets the telemetry capture time to first token.
+
+    ``cache_hints`` are provider-specific request fields sent verbatim in the
+    body (e.g. llama.cpp's ``cache_prompt`` or Ollama's ``keep_alive``) so the
+    server keeps the stable prompt prefix warm between calls.
 
-    def __init__(self, base_url: str, model: str, api_key: str | None = None) -> None:
-        """Initialize the client with an endpoint, model, and optional API key."""
-        self.__client = OpenAI(base_url=base_url, api_key=api_key)
+    Each instance owns one pooled HTTP client; ``pool_size`` caps concurrent
+    connections and idle ones are kept open for ``keepalive_expiry`` seconds,
+    so a client shared across many requests pays the TCP/TLS handshake once.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        api_key: str | None = None,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+        stream: bool = False,
+        cache_hints: dict[str, Any] | None = None,
+        pool_size: int = 10,
+        keepalive_expiry: float = 30.0,
+    ) -> None:
+        """Initialize the client with an endpoint, model, optional API key, retry/streaming policy and cache hints."""
+        http_client = DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=keepalive_expiry,
+            )
+        )
+        self.__client = OpenAI(base_url=base_url, api_key=api_key, max_retries=0, http_client=http_client)
         self.__model = model
+        self.__max_retries = max_retries
+        self.__retry_backoff = retry_backoff
+        self.__stream = stream
+        self.__cache_hints = dict(cache_hints or {})
         self.__logger = logging.getLogger(self.__class__.__name__)
 
     def complete(self, system: str, user: str, temperature: float, max_tokens: int) -> str:
@@ -25,21 +67,89 @@ class OpenAIChatClient(IChatClient):
         Raises:
             ChatClientError: On API/network failure or empty model output.
         """
-        try:
-            response = self.__client.chat.completions.create(
-                model=self.__model,
-                messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
-        except (APIError, APIConnectionError, RateLimitError) as exc:
-            self.__logger.error("LLM API request failed: %s", exc)
-            raise ChatClientError(str(exc)) from exc
-        except OSError as exc:
-            self.__logger.error("System or network issue during LLM call: %s", exc)
-            raise ChatClientError(str(exc)) from exc
-
-        content = response.choices[0].message.content
+        with span("chat.openai", model=self.__model, stream=self.__stream, max_tokens=max_tokens):
+            return self.__complete(system, user, temperature, max_tokens)
+
+    def __complete(self, system: str, user: str, temperature: float, max_tokens: int) -> str:
+        """Do the work of `complete`, retrying retryable transport errors with exponential backoff."""
+        request: dict[str, Any] = {
+            "model": self.__model,
+            "messages": [{"role": "system", "content": system}, {"role": "user", "content": user}],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if self.__cache_hints:
+            request["extra_body"] = self.__cache_hints
+        for attempt in range(self.__max_retries + 1):
+            annotate(attempts=attempt + 1)
+            try:
+                content = self.__stream_completion(request) if self.__stream else self.__completion(request)
+                break
+            except _RETRYABLE_ERRORS as exc:
+                if attempt >= self.__max_retries:
+                    self.__logger.error("LLM API request failed: %s", exc)
+                    raise ChatClientError(str(exc)) from exc
+                delay = self.__retry_backoff * 2**attempt
+                self.__logger.warning("LLM API request failed (%s); retrying in %.1fs", exc, delay)
+                telemetry.record_retry()
+                time.sleep(delay)
+            except APIError as exc:
+                self.__logger.error("LLM API request failed: %s", exc)
+                raise ChatClientError(str(exc)) from exc
+            except OSError as exc:
+                self.__logger.error("System or network issue during LLM call: %s", exc)
+                raise ChatClientError(str(exc)) from exc
+
         if not content:
             raise ChatClientError("Empty response from model")
         return content.strip()
+
+    def __completion(self, request: dict[str, Any]) -> str | None:
+        """Issue a non-streaming request and report its usage."""
+        response = self.__client.chat.completions.create(**request)
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            telemetry.record_usage(
+                _as_int(getattr(usage, "prompt_tokens", None)),
+                _as_int(getattr(usage, "completion_tokens", None)),
+                model=_as_str(getattr(response, "model", None)),
+                cached_tokens=_cached_tokens(usage),
+            )
+        content: str | None = response.choices[0].message.content
+        return content
+
+    def __stream_completion(self, request: dict[str, Any]) -> str:
+        """Issue a streaming request, recording time to first token and the final usage chunk."""
+        stream = self.__client.chat.completions.create(**request, stream=True, stream_options={"include_usage": True})
+        parts: list[str] = []
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    if not parts:
+                        telemetry.record_first_token()
+                    parts.append(delta)
+            if chunk.usage is not None:
+                telemetry.record_usage(
+                    chunk.usage.prompt_tokens,
+                    chunk.usage.completion_tokens,
+                    model=chunk.model,
+                    cached_tokens=_cached_tokens(chunk.usage),
+                )
+        return "".join(parts)
+
+
+def _cached_tokens(usage: Any) -> int | None:
+    """Return prompt tokens served from the provider's prefix cache, when reported."""
+    details = getattr(usage, "prompt_tokens_details", None)
+    return _as_int(getattr(details, "cached_tokens", None))
+
+
+def _as_int(value: Any) -> int | None:
+    """Return ``value`` if it is a real int (SDK mocks and partial providers may return anything)."""
+    return value if isinstance(value, int) else None
+
+
+def _as_str(value: Any) -> str | None:
+    """Return ``value`` if it is a real string."""
+    return value if isinstance(value, str) else None
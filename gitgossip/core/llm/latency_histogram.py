@@ -0,0 +1,57 @@
+"""Decaying latency histogram used to tune hedged chat requests."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+
+# Geometric bucket upper bounds from 50 ms to ~30 min (ratio 1.25).
+_BUCKET_BOUNDS: tuple[float, ...] = tuple(0.05 * 1.25**i for i in range(48))
+
+
+class LatencyHistogram:
+    """Thread-safe histogram of call latencies with exponential decay.
+
+    Each new observation multiplies the existing bucket weights by ``decay``,
+    so recent behavior (e.g. a local model that just became busy) dominates
+    the percentile estimate instead of the whole process history.
+    """
+
+    def __init__(self, decay: float = 0.98) -> None:
+        """Initialize an empty histogram; ``decay`` must be in (0, 1]."""
+        if not 0 < decay <= 1:
+            raise ValueError("decay must be in (0, 1]")
+        self.__decay = decay
+        self.__weights = [0.0] * (len(_BUCKET_BOUNDS) + 1)
+        self.__total = 0.0
+        self.__count = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        """Number of observations recorded so far (undecayed)."""
+        return self.__count
+
+    def record(self, seconds: float) -> None:
+        """Record one latency observation in seconds."""
+        index = bisect.bisect_left(_BUCKET_BOUNDS, max(seconds, 0.0))
+        with self.__lock:
+            if self.__decay < 1:
+                self.__weights = [w * self.__decay for w in self.__weights]
+                self.__total *= self.__decay
+            self.__weights[index] += 1.0
+            self.__total += 1.0
+            self.__count += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the bucket upper bound covering ``fraction`` of the weight, or None when empty."""
+        with self.__lock:
+            if self.__total <= 0:
+                return None
+            threshold = self.__total * min(max(fraction, 0.0), 1.0)
+            cumulative = 0.0
+            for index, weight in enumerate(self.__weights):
+                cumulative += weight
+                if cumulative >= threshold and weight > 0:
+                    return _BUCKET_BOUNDS[min(index, len(_BUCKET_BOUNDS) - 1)]
+            return _BUCKET_BOUNDS[-1]
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
-from typing import List
+import time
+from contextlib import nullcontext
+from functools import partial
+from typing import Callable, List
 
 from rich.console import Console
 
@@ -11,16 +14,31 @@ from gitgossip.core.interfaces.chat_client import IChatClient
 from gitgossip.core.interfaces.llm_analyzer import ILLMAnalyzer
 from gitgossip.core.llm.errors import ChatClientError
 from gitgossip.core.llm.prompt_builder import PromptBuilder
+from gitgossip.core.llm.telemetry import LLMStatsRecorder, estimate_tokens, mark_call_started
 from gitgossip.core.models.commit import Commit
+from gitgossip.utils.profiler import phase
+from gitgossip.utils.tracing import span
 
 
 class LLMAnalyzer(ILLMAnalyzer):
     """Analyzes commits and diffs with an LLM reached through an injected chat client."""
 
-    def __init__(self, chat_client: IChatClient, prompt_builder: PromptBuilder | None = None) -> None:
-        """Initialize the analyzer with a chat transport and an optional prompt builder."""
+    def __init__(
+        self,
+        chat_client: IChatClient,
+        prompt_builder: PromptBuilder | None = None,
+        stats_recorder: LLMStatsRecorder | None = None,
+        show_status: bool = True,
+    ) -> None:
+        """Initialize the analyzer with a chat transport, an optional prompt builder, and optional call stats.
+
+        ``show_status`` controls the Rich spinner shown while waiting on the model;
+        disable it when several calls run concurrently (Rich allows one live display).
+        """
         self.__chat_client = chat_client
         self.__prompt_builder = prompt_builder or PromptBuilder(project_name="GitGossip")
+        self.__stats_recorder = stats_recorder
+        self.__show_status = show_status
         self.__logger = logging.getLogger(self.__class__.__name__)
         self.__console = Console()
 
@@ -35,15 +53,17 @@ class LLMAnalyzer(ILLMAnalyzer):
             f"(+{c.insertions}/-{c.deletions})"
             for c in commits
         )
-        prompt = self.__prompt_builder.build(
+        prompt = partial(
+            self.__prompt_builder.build,
             "chunk",
             content=commit_summaries,
             context="Recent repository activity to summarize.",
         )
         return self.__complete(
+            operation="analyze_commits",
             status="[bold cyan]Analyzing commits...",
             system="You summarize git repository activity clearly and succinctly.",
-            user=prompt,
+            prompt=prompt,
             temperature=0.4,
             max_tokens=500,
         )
@@ -53,15 +73,17 @@ class LLMAnalyzer(ILLMAnalyzer):
         if not diff_text or not diff_text.strip():
             return "No changes detected", "No differences found between branches."
 
-        prompt = self.__prompt_builder.build(
+        prompt = partial(
+            self.__prompt_builder.build,
             "final",
             content=self._safe_truncate(diff_text),
             context="Generate a concise, factual Merge Request summary suitable for team review.",
         )
         output = self.__complete(
+            operation="generate_mr_summary",
             status="[bold cyan] Finalizing merge request summary...",
             system="You create professional, factual Merge Request titles and descriptions from code diffs.",
-            user=prompt,
+            prompt=prompt,
             temperature=0.3,
             max_tokens=600,
         )
@@ -74,16 +96,18 @@ class LLMAnalyzer(ILLMAnalyzer):
         if not diff_text.strip():
             return "[LLM ERROR] No staged changes to describe."
 
-        prompt = self.__prompt_builder.build(
+        prompt = partial(
+            self.__prompt_builder.build,
             "commit",
             content=self._safe_truncate(diff_text),
             context="Generate a conventional commit message for the staged changes.",
             metadata=file_summary,
         )
         return self.__complete(
+            operation="generate_commit_message",
             status="[bold cyan]Drafting commit message...",
             system="You write concise, factual git commit messages.",
-            user=prompt,
+            prompt=prompt,
             temperature=0.3,
             max_tokens=300,
         )
@@ -93,16 +117,18 @@ class LLMAnalyzer(ILLMAnalyzer):
         if not diff_chunk.strip():
             return "No changes detected in this chunk."
 
-        prompt = self.__prompt_builder.build(
+        prompt = partial(
+            self.__prompt_builder.build,
             "chunk",
             content=self._safe_truncate(diff_chunk),
             context="You are analyzing a small portion of a git diff to summarize code changes.",
             metadata=metadata or "",
         )
         return self.__complete(
+            operation="summarize_diff_chunk",
             status="[bold cyan]Summarizing diff chunk...",
             system="You summarize code diffs concisely and factually without speculation.",
-            user=prompt,
+            prompt=prompt,
             temperature=0.3,
             max_tokens=400,
         )
@@ -112,29 +138,78 @@ class LLMAnalyzer(ILLMAnalyzer):
         if not chunk_summaries:
             return "No summaries to synthesize."
 
-        prompt = self.__prompt_builder.build(
+        prompt = partial(
+            self.__prompt_builder.build,
             "synthesis",
             content="\n".join(chunk_summaries),
             context="Merge partial diff summaries into one cohesive overview for a Merge Request.",
         )
         return self.__complete(
+            operation="synthesize_chunk_summaries",
             status="[bold cyan] Synthesising diff chunk...",
             system="You create professional, factual Merge Request titles and descriptions from code diffs.",
-            user=prompt,
+            prompt=prompt,
             temperature=0.3,
             max_tokens=600,
         )
 
-    def __complete(self, status: str, system: str, user: str, temperature: float, max_tokens: int) -> str:
-        """Run one chat completion, mapping transport errors to the '[LLM ERROR]' string contract."""
-        try:
-            with self.__console.status(status, spinner="dots"):
-                return self.__chat_client.complete(
-                    system=system, user=user, temperature=temperature, max_tokens=max_tokens
-                ).strip()
-        except ChatClientError as exc:
-            self.__logger.error("LLM request failed: %s", exc)
-            return f"[LLM ERROR] {exc}"
+    def __complete(
+        self,
+        operation: str,
+        status: str,
+        system: str,
+        prompt: Callable[[], str],
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Run one chat completion, mapping transport errors to the '[LLM ERROR]' string contract.
+
+        When a stats recorder is attached, the call is tracked: prompt rendering
+        and model wall time are measured here, while token usage, time to first
+        token and retries are reported by the chat client when it can.
+        """
+        tracker = self.__stats_recorder.track(operation) if self.__stats_recorder else nullcontext(None)
+        with span("llm.complete", operation=operation) as current, tracker as call:
+            started = time.perf_counter()
+            with phase("prompt"):
+                user = prompt()
+            prompt_done = time.perf_counter()
+            mark_call_started()
+            try:
+                with (
+                    phase("llm"),
+                    self.__console.status(status, spinner="dots") if self.__show_status else nullcontext(),
+                ):
+                    output = self.__chat_client.complete(
+                        system=system, user=user, temperature=temperature, max_tokens=max_tokens
+                    ).strip()
+            except ChatClientError as exc:
+                self.__logger.error("LLM request failed: %s", exc)
+                output = f"[LLM ERROR] {exc}"
+                if call is not None:
+                    call.ok = False
+            if call is not None:
+                call.prompt_ms = (prompt_done - started) * 1000
+                call.wall_ms = (time.perf_counter() - prompt_done) * 1000
+                if call.prompt_tokens is None:
+                    call.prompt_tokens = estimate_tokens(system) + estimate_tokens(user)
+                    call.completion_tokens = estimate_tokens(output) if call.ok else 0
+                    call.tokens_estimated = True
+                current.set(
+                    prompt_tokens=call.prompt_tokens,
+                    completion_tokens=call.completion_tokens,
+                    cached_tokens=call.cached_tokens,
+                    cache_hit=bool(call.cached_tokens) if call.cached_tokens is not None else None,
+                    tokens_estimated=call.tokens_estimated,
+                    ttft_ms=call.ttft_ms,
+                    retries=call.retries,
+                )
+            current.set(
+                ok=not output.startswith("[LLM ERROR]"),
+                prompt_chars=len(system) + len(user),
+                output_chars=len(output),
+            )
+            return output
 
     def _safe_truncate(self, text: str, limit: int = 8000) -> str:
         """Truncate large text safely to avoid context overflow."""
@@ -2,18 +2,76 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import re
+import threading
 from pathlib import Path
-from typing import Literal
+from typing import Literal, NamedTuple
 
 PromptType = Literal["chunk", "synthesis", "final", "commit"]
 
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{(project_name|content|context|metadata)\}\}")
+
+
+class CompiledTemplate(NamedTuple):
+    """A template pre-split into literal text and placeholder names.
+
+    ``segments`` alternates freely between literals and placeholders; each entry
+    is ``(is_placeholder, text)`` where ``text`` is the placeholder name for
+    placeholders. Leading/trailing whitespace of the template is already
+    stripped from the outer literals.
+    """
+
+    segments: tuple[tuple[bool, str], ...]
+
+    @classmethod
+    def compile(cls, template: str) -> CompiledTemplate:
+        """Split raw template text into segments."""
+        segments: list[tuple[bool, str]] = []
+        position = 0
+        for match in _PLACEHOLDER_PATTERN.finditer(template):
+            if match.start() > position:
+                segments.append((False, template[position : match.start()]))
+            segments.append((True, match.group(1)))
+            position = match.end()
+        if position < len(template):
+            segments.append((False, template[position:]))
+
+        if segments and not segments[0][0]:
+            segments[0] = (False, segments[0][1].lstrip())
+        if segments and not segments[-1][0]:
+            segments[-1] = (False, segments[-1][1].rstrip())
+        return cls(tuple(segment for segment in segments if segment[0] or segment[1]))
+
+    def render(self, values: dict[str, str]) -> str:
+        """Substitute placeholders in a single pass (placeholder text inside values is left alone)."""
+        rendered = "".join(values[text] if is_placeholder else text for is_placeholder, text in self.segments)
+        if self.segments and (self.segments[0][0] or self.segments[-1][0]):
+            return rendered.strip()
+        return rendered
+
+
+# Process-wide cache: template path -> ((mtime_ns, size), compiled template). Shared by every builder.
+_TEMPLATE_CACHE: dict[Path, tuple[tuple[int, int], CompiledTemplate]] = {}
+_CACHE_LOCK = threading.Lock()
+
 
 class PromptBuilder:
-    """Loads and builds prompt templates (default or user-defined)."""
+    """Loads and builds prompt templates (default or user-defined).
+
+    Templates are read once per process and cached in compiled form. User
+    templates are revalidated with a single ``stat`` per build (edits take
+    effect on the next build); bundled templates never change at runtime and
+    are served straight from the cache.
+    """
 
     def __init__(self, project_name: str = "GitGossip", user_dir: Path | None = None) -> None:
-        """Initialize PromptBuilder with an optional custom directory for user templates."""
+        """Initialize PromptBuilder with an optional custom directory for user templates.
+
+        Construction touches no files; the user directory is created by
+        ``gitgossip prompts init`` when the user scaffolds templates.
+        """
         self.project_name = project_name
         self.logger = logging.getLogger(self.__class__.__name__)
 
@@ -22,7 +80,6 @@ class PromptBuilder:
 
         # User custom prompts can live here
         self._user_dir = user_dir or Path.home() / ".gitgossip" / "prompts"
-        self._user_dir.mkdir(parents=True, exist_ok=True)
 
     def build(
         self,
@@ -33,29 +90,52 @@ class PromptBuilder:
     ) -> str:
         """Return a ready-to-send prompt string."""
         template = self._load_template(prompt_type)
-        prompt = (
-            template.replace("{{project_name}}", self.project_name)
-            .replace("{{content}}", self._truncate(content))
-            .replace("{{context}}", context or "")
-            .replace("{{metadata}}", metadata or "")
+        return template.render(
+            {
+                "project_name": self.project_name,
+                "content": self._truncate(content),
+                "context": context or "",
+                "metadata": metadata or "",
+            }
         )
-        return prompt.strip()
 
-    def _load_template(self, prompt_type: PromptType) -> str:
+    def fingerprint(self, prompt_type: PromptType) -> str:
+        """Return a hash of the template `build` would use, so cached outputs can follow template edits."""
+        return hashlib.sha256(repr(self._load_template(prompt_type).segments).encode("utf-8")).hexdigest()
+
+    def _load_template(self, prompt_type: PromptType) -> CompiledTemplate:
         """Load template from user dir or fallback to default."""
         user_file = self._user_dir / f"{prompt_type}.txt"
-        default_file = self._default_dir / f"{prompt_type}.txt"
-
-        if user_file.exists():
+        try:
+            stat = user_file.stat()
+        except OSError:
+            stat = None
+        if stat is not None:
             self.logger.debug("Using user-defined template for %s", prompt_type)
-            return user_file.read_text(encoding="utf-8")
+            return self._cached(user_file, (stat.st_mtime_ns, stat.st_size))
 
+        default_file = self._default_dir / f"{prompt_type}.txt"
+        cached = _TEMPLATE_CACHE.get(default_file)
+        if cached is not None:
+            return cached[1]
         if default_file.exists():
             self.logger.debug("Using default template for %s", prompt_type)
-            return default_file.read_text(encoding="utf-8")
+            stat = default_file.stat()
+            return self._cached(default_file, (stat.st_mtime_ns, stat.st_size))
 
         self.logger.warning("No template found for %s; using fallback.", prompt_type)
-        return self._fallback_template(prompt_type)
+        return CompiledTemplate.compile(self._fallback_template(prompt_type))
+
+    @staticmethod
+    def _cached(path: Path, signature: tuple[int, int]) -> CompiledTemplate:
+        """Return the compiled template for ``path``, re-reading it only when its mtime or size changed."""
+        cached = _TEMPLATE_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        compiled = CompiledTemplate.compile(path.read_text(encoding="utf-8"))
+        with _CACHE_LOCK:
+            _TEMPLATE_CACHE[path] = (signature, compiled)
+        return compiled
 
     def _truncate(self, text: str, limit: int = 8000) -> str:
         """Trim large content to avoid context overflow."""
@@ -0,0 +1,191 @@
+"""Lightweight per-call LLM instrumentation shared by the analyzer and chat clients.
+
+The analyzer opens a call record with `LLMStatsRecorder.track`; chat clients
+annotate whatever record is active in the current context via the
+module-level ``record_*`` helpers, so the `IChatClient` contract stays a plain
+``complete() -> str``. When no recorder is in use the helpers are no-ops.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from gitgossip.core.models.llm_call import LLMCallStats
+from gitgossip.utils.tracing import annotate
+
+_CURRENT_CALL: ContextVar[LLMCallStats | None] = ContextVar("gitgossip_llm_call", default=None)
+_CALL_STARTED: ContextVar[float] = ContextVar("gitgossip_llm_call_started", default=0.0)
+_SCOPE: ContextVar[list[LLMCallStats] | None] = ContextVar("gitgossip_llm_scope", default=None)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token) for providers that report no usage."""
+    return max(1, len(text) // 4) if text else 0
+
+
+def current_call() -> LLMCallStats | None:
+    """Return the call record active in this context, if any."""
+    return _CURRENT_CALL.get()
+
+
+def record_usage(
+    prompt_tokens: int | None,
+    completion_tokens: int | None,
+    model: str | None = None,
+    cached_tokens: int | None = None,
+) -> None:
+    """Attach provider-reported token usage to the active call (first report wins) and the current trace span."""
+    annotate(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        cached_tokens=cached_tokens,
+        cache_hit=bool(cached_tokens),
+        model=model,
+    )
+    call = _CURRENT_CALL.get()
+    if call is None or call.prompt_tokens is not None:
+        return
+    call.prompt_tokens = prompt_tokens
+    call.completion_tokens = completion_tokens
+    call.cached_tokens = cached_tokens
+    if model and not call.model:
+        call.model = model
+
+
+def record_first_token() -> None:
+    """Mark the arrival of the first streamed token for the active call."""
+    call = _CURRENT_CALL.get()
+    if call is not None and call.ttft_ms is None:
+        call.ttft_ms = (time.perf_counter() - _CALL_STARTED.get()) * 1000
+
+
+def record_retry() -> None:
+    """Count one transport-level retry on the active call."""
+    call = _CURRENT_CALL.get()
+    if call is not None:
+        call.retries += 1
+
+
+def mark_call_started() -> None:
+    """Reset the time-to-first-token reference point to now."""
+    _CALL_STARTED.set(time.perf_counter())
+
+
+@contextmanager
+def attempt_call() -> Iterator[LLMCallStats | None]:
+    """Give one of several racing attempts at the active call a private record (None when no call is active).
+
+    The ``record_*`` helpers called inside the block report into the attempt's
+    record, so an attempt that loses the race, and keeps running after the call
+    was stored, never touches the call itself. Fold the winner in with
+    `merge_attempt`.
+    """
+    call = _CURRENT_CALL.get()
+    if call is None:
+        yield None
+        return
+    attempt = LLMCallStats(operation=call.operation)
+    token = _CURRENT_CALL.set(attempt)
+    try:
+        yield attempt
+    finally:
+        _CURRENT_CALL.reset(token)
+
+
+def merge_attempt(attempt: LLMCallStats) -> None:
+    """Fold what the winning attempt reported (usage, model, time to first token, retries) into the active call."""
+    call = _CURRENT_CALL.get()
+    if call is None:
+        return
+    if call.prompt_tokens is None:
+        call.prompt_tokens = attempt.prompt_tokens
+        call.completion_tokens = attempt.completion_tokens
+        call.cached_tokens = attempt.cached_tokens
+    if call.ttft_ms is None:
+        call.ttft_ms = attempt.ttft_ms
+    call.model = call.model or attempt.model
+    call.retries += attempt.retries
+
+
+@contextmanager
+def scoped_calls() -> Iterator[list[LLMCallStats]]:
+    """Collect the calls tracked in this context (and contexts copied from it) into the yielded list.
+
+    Lets a command attribute usage to one repository while the run-wide
+    recorder still sees every call. Scopes do not nest: the innermost wins.
+    """
+    calls: list[LLMCallStats] = []
+    token = _SCOPE.set(calls)
+    try:
+        yield calls
+    finally:
+        _SCOPE.reset(token)
+
+
+class LLMStatsRecorder:
+    """Collects `LLMCallStats` records for one command run and aggregates them."""
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        self.__calls: list[LLMCallStats] = []
+        self.__lock = threading.Lock()
+
+    @property
+    def calls(self) -> list[LLMCallStats]:
+        """Snapshot of all recorded calls in completion order."""
+        with self.__lock:
+            return list(self.__calls)
+
+    @contextmanager
+    def track(self, operation: str) -> Iterator[LLMCallStats]:
+        """Open a call record, make it current for chat clients, and store it on exit."""
+        call = LLMCallStats(operation=operation)
+        call_token = _CURRENT_CALL.set(call)
+        started_token = _CALL_STARTED.set(time.perf_counter())
+        try:
+            yield call
+        finally:
+            _CURRENT_CALL.reset(call_token)
+            _CALL_STARTED.reset(started_token)
+            with self.__lock:
+                self.__calls.append(call)
+            scope = _SCOPE.get()
+            if scope is not None:
+                scope.append(call)
+
+    def aggregate(self) -> list[dict[str, Any]]:
+        """Return per-operation totals, followed by an overall ``TOTAL`` row."""
+        calls = self.calls
+        groups: dict[str, list[LLMCallStats]] = {}
+        for call in calls:
+            groups.setdefault(call.operation, []).append(call)
+        rows = [self._summarize(operation, group) for operation, group in groups.items()]
+        if calls:
+            rows.append(self._summarize("TOTAL", calls))
+        return rows
+
+    @staticmethod
+    def _summarize(operation: str, calls: list[LLMCallStats]) -> dict[str, Any]:
+        """Aggregate a group of calls into a single row."""
+        wall_ms = sum(c.wall_ms for c in calls)
+        ttfts = [c.ttft_ms for c in calls if c.ttft_ms is not None]
+        completion_tokens = sum(c.completion_tokens or 0 for c in calls)
+        return {
+            "operation": operation,
+            "calls": len(calls),
+            "failures": sum(1 for c in calls if not c.ok),
+            "prompt_ms": round(sum(c.prompt_ms for c in calls), 2),
+            "wall_ms": round(wall_ms, 2),
+            "avg_wall_ms": round(wall_ms / len(calls), 2),
+            "avg_ttft_ms": round(sum(ttfts) / len(ttfts), 2) if ttfts else None,
+            "prompt_tokens": sum(c.prompt_tokens or 0 for c in calls),
+            "cached_tokens": sum(c.cached_tokens or 0 for c in calls),
+            "completion_tokens": completion_tokens,
+            "tokens_per_second": round(completion_tokens / (wall_ms / 1000), 2) if wall_ms else None,
+            "tokens_estimated": any(c.tokens_estimated for c in calls),
+            "retries": sum(c.retries for c in calls),
+        }
@@ -0,0 +1,44 @@
+"""Author activity model aggregated across one or more repositories."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+from pydantic import BaseModel, Field
+
+
+class AuthorStats(BaseModel):
+    """One (mailmap-resolved) author identity and how much they committed."""
+
+    name: str = Field(..., description="Display name (the most frequently used one for this email)")
+    email: str = Field(default="", description="Canonical email, lowercased")
+    commits: int = Field(default=0, description="Number of commits in the queried range")
+    repositories: list[str] = Field(default_factory=list, description="Names of repositories the author committed to")
+    first_seen: datetime | None = Field(default=None, description="Earliest commit timestamp in the queried range")
+    last_seen: datetime | None = Field(default=None, description="Latest commit timestamp in the queried range")
+
+
+class AuthorActivity(NamedTuple):
+    """Per-repository activity of one identity (timestamps are Unix seconds)."""
+
+    name: str
+    email: str
+    commits: int
+    first_seen: int
+    last_seen: int
+
+
+class RepoAuthors(NamedTuple):
+    """One repository's author activity as read by `AuthorService`, with how it was obtained.
+
+    ``index_status`` is the `AuthorIndex` refresh outcome ("current", "extended"
+    or "rebuilt"), or None when the read failed.
+    """
+
+    repo: Path
+    activity: list[AuthorActivity]
+    error: str | None = None
+    index_status: str | None = None
+    elapsed_ms: float = 0.0
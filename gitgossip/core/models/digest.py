@@ -0,0 +1,21 @@
+"""Digest entry model: one author's activity in one repository on one day."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+
+class DigestEntry(BaseModel):
+    """A summarized (repository, author, day) bucket of commits."""
+
+    repo: str = Field(..., description="Repository name")
+    day: date = Field(..., description="Local calendar day of the commits")
+    author: str = Field(..., description="Mailmap-resolved author name")
+    email: str = Field(default="", description="Mailmap-resolved author email")
+    commits: int = Field(default=0, description="Number of commits in the bucket")
+    summary: str = Field(default="", description="LLM summary of the bucket")
+    cached: bool = Field(default=False, description="Whether the summary was reused from a previous run")
+
+    model_config = {"frozen": True}
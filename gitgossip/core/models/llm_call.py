@@ -0,0 +1,25 @@
+"""Per-call LLM instrumentation record."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class LLMCallStats(BaseModel):
+    """Timing and token accounting for one analyzer → chat-client round trip.
+
+    Unlike `Commit`, this model is mutable: the analyzer and the chat client
+    fill in fields while the call is in flight.
+    """
+
+    operation: str = Field(..., description="Analyzer operation, e.g. 'summarize_diff_chunk'")
+    model: str | None = Field(default=None, description="Model reported by the provider, when known")
+    ok: bool = Field(default=True, description="Whether the call produced a completion")
+    prompt_ms: float = Field(default=0.0, description="Time spent rendering the prompt template")
+    wall_ms: float = Field(default=0.0, description="Wall time of the chat-client call, including retries")
+    ttft_ms: float | None = Field(default=None, description="Time to first streamed token (streaming clients only)")
+    prompt_tokens: int | None = Field(default=None, description="Prompt tokens (from usage, or estimated)")
+    cached_tokens: int | None = Field(default=None, description="Prompt tokens served from a prefix cache")
+    completion_tokens: int | None = Field(default=None, description="Completion tokens (from usage, or estimated)")
+    tokens_estimated: bool = Field(default=False, description="True when token counts were estimated from text length")
+    retries: int = Field(default=0, description="Transport-level retries before the final attempt")
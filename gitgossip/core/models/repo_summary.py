@@ -0,0 +1,24 @@
+"""Result of summarizing one repository in a multi-repository run."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from gitgossip.core.models.llm_call import LLMCallStats
+
+
+class RepoSummary(BaseModel):
+    """Outcome for a single repository: either a summary or the error that stopped it."""
+
+    index: int = Field(..., description="Position of the repository in discovery order")
+    repo_path: Path = Field(..., description="Path to the repository")
+    summary: str = Field(default="", description="Generated summary text (empty on error or when nothing changed)")
+    commit_count: int = Field(default=0, description="Number of commits sent to the analyzer")
+    error: str | None = Field(default=None, description="Why the repository could not be summarized, if it failed")
+    llm_calls: list[LLMCallStats] = Field(
+        default_factory=list, description="LLM calls made for this repository (tracked only with a stats recorder)"
+    )
+
+    model_config = {"frozen": True}
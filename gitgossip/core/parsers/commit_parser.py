@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import os
 import re
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
 from git import Commit as GitCommit
-from git import Repo
+from git import GitCommandError, Repo
 
 from gitgossip.core.constants import (
     DEFAULT_FUNC_PATTERN,
@@ -20,7 +21,9 @@ from gitgossip.core.constants import (
 from gitgossip.core.interfaces.commit_parser import ICommitParser
 from gitgossip.core.interfaces.repo_provider import IRepoProvider
 from gitgossip.core.models.commit import Commit
+from gitgossip.core.storage.author_index import AuthorIndex
 from gitgossip.utils.parse import parse_since
+from gitgossip.utils.profiler import phase
 
 
 class CommitParser(ICommitParser):
@@ -65,15 +68,32 @@ class CommitParser(ICommitParser):
         if since is not None:
             kwargs["since"] = parse_since(since)
 
-        commits: list[Commit] = []
-        for commit in self.__repo.iter_commits(max_count=limit, **kwargs):
-            commits.append(self._parse_commit(commit))
-        return commits
+        with phase("ingestion"):
+            if author is not None:
+                shas = self._indexed_commits(author, kwargs.get("since"), limit)
+                if shas is not None:
+                    return [self._parse_commit(self.__repo.commit(sha)) for sha in shas]
+
+            commits: list[Commit] = []
+            for commit in self.__repo.iter_commits(max_count=limit, **kwargs):
+                commits.append(self._parse_commit(commit))
+            return commits
+
+    def _indexed_commits(self, author: str, since: str | None, limit: int) -> list[str] | None:
+        """Look up an author's commits in the persistent author index (``None`` if it cannot be used)."""
+        repo_dir = self.__repo.working_tree_dir or self.__repo.git_dir
+        try:
+            index = AuthorIndex(Path(repo_dir)).refresh()
+            since_ts = int(datetime.fromisoformat(since).timestamp()) if since else None
+            return index.commits_by(author, since_ts=since_ts, limit=limit)
+        except (GitCommandError, OSError, ValueError):
+            return None
 
     def _parse_commit(self, commit: GitCommit) -> Commit:
         """Convert a GitPython Commit object into our Commit domain model."""
-        stats = commit.stats.total
-        structured_changes = self._extract_diffs(commit)
+        with phase("parse"):
+            stats = commit.stats.total
+            structured_changes = self._extract_diffs(commit)
 
         return Commit(
             hash=commit.hexsha,
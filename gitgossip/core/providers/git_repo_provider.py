@@ -4,21 +4,27 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from git import InvalidGitRepositoryError, NoSuchPathError, Repo
+from git import Git, InvalidGitRepositoryError, NoSuchPathError, Repo
 
 from gitgossip.core.interfaces.repo_provider import IRepoProvider
+from gitgossip.utils.diff_spool import DiffSpool
+from gitgossip.utils.profiler import phase
+from gitgossip.utils.staged_diff import STAGED_DIFF_ARGS, StagedDiff, parse_staged_diff
+from gitgossip.utils.tracing import span
 
 
 class GitRepoProvider(IRepoProvider):
     """Provides access to a Git repository using GitPython.
 
     This class implements the `IRepoProvider` interface and ensures
-    safe initialization of a valid repository instance.
+    safe initialization of a valid repository instance. The `Repo` is built
+    on first use and reused by every later call.
     """
 
     def __init__(self, path: Path) -> None:
         """Initialize a GitRepoProvider instance."""
         self.__path = path
+        self.__repo: Repo | None = None
 
     def get_repo(self) -> Repo:
         """Return a GitPython Repo object for the given path.
@@ -27,55 +33,80 @@ class GitRepoProvider(IRepoProvider):
             FileNotFoundError: If the path does not exist or is invalid.
             InvalidGitRepositoryError: If the path is not a valid Git repository.
         """
+        if self.__repo is not None:
+            return self.__repo
+
         repo_path = Path(self.__path).expanduser().resolve()
         if not repo_path.exists():
             raise FileNotFoundError(f"Repository path does not exist: {self.__path}")
 
         try:
-            return Repo(repo_path)
+            self.__repo = Repo(repo_path)
         except (InvalidGitRepositoryError, NoSuchPathError) as exc:
             raise FileNotFoundError(f"Invalid or inaccessible repository: {self.__path}") from exc
+        return self.__repo
+
+    def get_staged_changes(self) -> StagedDiff:
+        """Return the staged files (status and +/- counts) and patch, read with one ``git diff --cached``."""
+        repo = self.get_repo()
+        with span("git.staged_diff", repo=str(self.__path)) as current, phase("ingestion"):
+            staged = parse_staged_diff(str(repo.git.diff(*STAGED_DIFF_ARGS[1:])))
+            current.set(diff_chars=len(staged.patch), file_count=len(staged.files))
+            return staged
+
+    def get_staged_tree(self) -> str:
+        """Return the hash of the tree the index would commit (``git write-tree``)."""
+        return str(self.get_repo().git.write_tree())
 
     def get_staged_diff(self) -> str:
         """Return the textual diff of currently staged changes (empty string when nothing is staged)."""
-        repo = self.get_repo()
-        return str(repo.git.diff("--cached", unified=3))
+        return self.get_staged_changes().patch
 
     def get_staged_files(self) -> list[str]:
         """Return the paths of currently staged files (empty list when nothing is staged)."""
-        repo = self.get_repo()
-        output = repo.git.diff("--cached", "--name-only")
-        return [line for line in output.splitlines() if line.strip()]
+        return self.get_staged_changes().paths
 
-    def get_diff_between_branches(self, target_branch: str) -> str:
-        """Return the textual diff between the current HEAD and the target branch, excluding merge commits.
+    def write_diff_between_branches(self, target_branch: str, spool: DiffSpool) -> int:
+        """Write the diff between HEAD and ``target_branch`` into ``spool``, one commit at a time.
 
-        The diff includes only commits that are unique to the current branch
-        (i.e., in HEAD but not in the target branch). Merge commits are skipped.
+        Only commits unique to HEAD are included and merge commits are skipped;
+        each section starts with a ``Commit: <sha>`` header. Each commit's
+        ``git diff`` runs as its own process whose output goes to the spool;
+        once the spool has moved to disk git writes into the file directly, so
+        no diff passes through a Python string. Returns the number of commits
+        written.
         """
         repo = self.get_repo()
 
         if target_branch not in repo.refs:
             raise ValueError(f"Target branch '{target_branch}' not found in repository.")
 
-        try:
-            diffs: list[str] = []
-
-            # Iterate over non-merge commits unique to the current branch
-            for commit in repo.iter_commits(f"{target_branch}..HEAD", no_merges=True):
-                if commit.parents:
-                    # Parent → child direction shows what this commit introduced
-                    parent_sha = commit.parents[0].hexsha
-                    child_sha = commit.hexsha
-                    diff = repo.git.diff(f"{parent_sha}..{child_sha}", unified=3)
-                    diffs.append(f"Commit: {child_sha}\n{diff}\n{'-' * 50}")
-                else:
-                    # Handle initial commit (no parents)
-                    diff = repo.git.diff_tree(commit.hexsha, unified=3, root=True)
-                    diffs.append(f"Commit: {commit.hexsha} (Initial commit)\n{diff}\n{'-' * 50}")
-
-            result = "\n".join(diffs).strip()
-            return result if result else "No non-merge commits found."
-
-        except Exception as exc:
-            raise RuntimeError(f"Failed to generate diff for branch comparison: {exc}") from exc
+        with span("git.branch_diff", repo=str(self.__path), target_branch=target_branch) as current, phase("ingestion"):
+            try:
+                count = 0
+                start = spool.size
+                git = [Git.GIT_PYTHON_GIT_EXECUTABLE or "git", f"--git-dir={repo.git_dir}"]
+
+                # Iterate over non-merge commits unique to the current branch
+                for commit in repo.iter_commits(f"{target_branch}..HEAD", no_merges=True):
+                    if count:
+                        spool.write("\n")
+                    if commit.parents:
+                        # Parent → child direction shows what this commit introduced
+                        parent_sha = commit.parents[0].hexsha
+                        child_sha = commit.hexsha
+                        spool.write(f"Commit: {child_sha}\n")
+                        command = [*git, "diff", "--unified=3", f"{parent_sha}..{child_sha}"]
+                    else:
+                        # Handle initial commit (no parents)
+                        spool.write(f"Commit: {commit.hexsha} (Initial commit)\n")
+                        command = [*git, "diff-tree", "--unified=3", "--root", commit.hexsha]
+                    spool.write_command(command, strip_trailing_newline=True)
+                    spool.write(f"\n{'-' * 50}")
+                    count += 1
+
+                current.set(commit_count=count, diff_bytes=spool.size - start, diff_spilled=spool.spilled)
+                return count
+
+            except Exception as exc:
+                raise RuntimeError(f"Failed to generate diff for branch comparison: {exc}") from exc
@@ -0,0 +1,103 @@
+"""Service that lists commit authors across repositories from their persistent author indexes."""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from git.exc import GitCommandError
+
+from gitgossip.core.models.author import AuthorStats, RepoAuthors
+from gitgossip.core.storage.author_index import AuthorIndex
+
+
+class AuthorService:
+    """Aggregates authors and commit counts for one or many repositories.
+
+    Each repository is answered from its persistent `AuthorIndex`, which only
+    reads commits added since the last run (git applies the repository's
+    ``.mailmap``). Repositories are queried concurrently. Identities are
+    merged across repositories by lowercased email; the name used most often wins.
+    """
+
+    def __init__(self, workers: int = 8) -> None:
+        """Initialize the service with the number of repositories queried at once."""
+        self.__workers = max(1, workers)
+        self.__logger = logging.getLogger(self.__class__.__name__)
+
+    def collect(
+        self,
+        repos: list[Path],
+        since: str | None = None,
+        on_repository: Callable[[RepoAuthors], None] | None = None,
+    ) -> tuple[list[AuthorStats], dict[Path, str]]:
+        """Return authors sorted by commit count (descending) plus per-repository error messages.
+
+        ``on_repository`` receives each repository's own result, in ``repos``
+        order, as soon as it and every repository before it are read.
+        """
+        errors: dict[Path, str] = {}
+        results: list[RepoAuthors] = []
+        with ThreadPoolExecutor(max_workers=min(self.__workers, max(1, len(repos)))) as pool:
+            futures = {repo: pool.submit(self.__activity, repo, since) for repo in repos}
+            for repo, future in futures.items():
+                try:
+                    result = future.result()
+                except (GitCommandError, OSError) as e:
+                    self.__logger.debug("Failed to read authors in %s: %s", repo, e)
+                    errors[repo] = str(e)
+                    result = RepoAuthors(repo, [], error=str(e))
+                if on_repository is not None:
+                    on_repository(result)
+                results.append(result)
+        return _merge(results), errors
+
+    @staticmethod
+    def __activity(repo: Path, since: str | None) -> RepoAuthors:
+        """Bring one repository's author index up to date and read its activity since ``since``."""
+        started = time.perf_counter()
+        since_ts = int(datetime.datetime.fromisoformat(since).timestamp()) if since else None
+        index = AuthorIndex(repo).refresh()
+        activity = index.activity(since_ts)
+        return RepoAuthors(repo, activity, index_status=index.status, elapsed_ms=(time.perf_counter() - started) * 1000)
+
+
+def _merge(results: list[RepoAuthors]) -> list[AuthorStats]:
+    """Merge per-repository activity by lowercased email, sorted by commit count (descending)."""
+    names: dict[str, Counter[str]] = {}
+    commits: Counter[str] = Counter()
+    first_seen: dict[str, int] = {}
+    last_seen: dict[str, int] = {}
+    repositories: dict[str, set[str]] = {}
+    for result in results:
+        for entry in result.activity:
+            key = entry.email.lower() or f"name:{entry.name.lower()}"
+            names.setdefault(key, Counter())[entry.name] += entry.commits
+            commits[key] += entry.commits
+            first_seen[key] = min(first_seen.get(key, entry.first_seen), entry.first_seen)
+            last_seen[key] = max(last_seen.get(key, entry.last_seen), entry.last_seen)
+            repositories.setdefault(key, set()).add(result.repo.name)
+
+    authors = [
+        AuthorStats(
+            name=names[key].most_common(1)[0][0],
+            email="" if key.startswith("name:") else key,
+            commits=total,
+            repositories=sorted(repositories[key]),
+            first_seen=_to_datetime(first_seen[key]),
+            last_seen=_to_datetime(last_seen[key]),
+        )
+        for key, total in commits.items()
+    ]
+    authors.sort(key=lambda a: (-a.commits, a.name.lower()))
+    return authors
+
+
+def _to_datetime(timestamp: int) -> datetime.datetime:
+    """Convert a Unix timestamp to an aware UTC datetime."""
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
@@ -0,0 +1,136 @@
+"""Service that keeps commit-message candidates generating ahead of the user."""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from types import TracebackType
+
+from gitgossip.core.interfaces.llm_analyzer import ILLMAnalyzer
+from gitgossip.utils.tracing import span
+
+
+class CommitMessageCandidates:
+    """Serves commit messages for one staged diff, generating up to ``candidates`` at a time.
+
+    ``candidates`` requests start at once and each message taken is the first
+    one to finish, whatever order the requests were started in. Replacements
+    are then started so that ``candidates - 1`` stay pending behind it: while
+    the user reads one message the next is already being generated, and
+    "regenerate" usually returns at once. A message identical to one already
+    shown is skipped in favour of the next one to finish. With ``candidates=1``
+    nothing is generated ahead and each `next` makes a fresh request.
+
+    A ``first`` message known in advance (e.g. from the commit message cache)
+    is returned by the first `next` and no request starts until a second
+    message is asked for.
+
+    Requests run on daemon threads: when the user accepts a message, the
+    requests still in flight are abandoned rather than waited for (neither
+    the OpenAI SDK nor a subprocess call can be interrupted safely).
+    """
+
+    def __init__(
+        self,
+        analyzer: ILLMAnalyzer,
+        diff_text: str,
+        file_summary: str,
+        candidates: int = 1,
+        first: str | None = None,
+    ) -> None:
+        """Start ``candidates`` concurrent requests for the staged diff (none yet when ``first`` is given).
+
+        Raises:
+            ValueError: If ``candidates`` is less than one.
+        """
+        if candidates < 1:
+            raise ValueError("candidates must be at least 1.")
+        self.__analyzer = analyzer
+        self.__diff_text = diff_text
+        self.__file_summary = file_summary
+        self.__candidates = candidates
+        self.__pending: list[Future[str]] = []
+        self.__shown: set[str] = set()
+        self.__closed = False
+        self.__first = first
+        self.requested = 0
+        for _ in range(0 if first is not None else candidates):
+            self.__submit()
+
+    @property
+    def ready(self) -> bool:
+        """Whether a candidate has already been generated and can be returned without waiting."""
+        return self.__first is not None or any(future.done() for future in self.__pending)
+
+    def next(self) -> str:
+        """Return the next candidate, waiting for it if it is still being generated.
+
+        Failures come back as ``[LLM ERROR]`` strings, as from the analyzer.
+
+        Raises:
+            RuntimeError: If the pool has been closed.
+        """
+        if self.__closed:
+            raise RuntimeError("CommitMessageCandidates is closed.")
+        if self.__first is not None:
+            message, self.__first = self.__first, None
+            self.__shown.add(message)
+            return message
+        message = self.__take()
+        for _ in range(self.__candidates - 1):
+            if message not in self.__shown or message.startswith("[LLM ERROR]"):
+                break
+            message = self.__take()
+        self.__shown.add(message)
+        return message
+
+    def close(self) -> None:
+        """Stop starting new requests; those in flight finish in the background and are discarded."""
+        self.__closed = True
+        self.__pending.clear()
+
+    def __enter__(self) -> CommitMessageCandidates:
+        """Return the pool itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the pool."""
+        self.close()
+
+    def __take(self) -> str:
+        """Wait for the first pending request to finish (starting one if none is pending) and top the pool up."""
+        if not self.__pending:
+            self.__submit()
+        done, _ = wait(self.__pending, return_when=FIRST_COMPLETED)
+        # Among requests finished together, prefer the one started first so the order stays predictable.
+        future = next(f for f in self.__pending if f in done)
+        self.__pending.remove(future)
+        while len(self.__pending) < self.__candidates - 1:
+            self.__submit()
+        return future.result()
+
+    def __submit(self) -> None:
+        """Run one `generate_commit_message` call on a daemon thread and add its Future to the pool."""
+        future: Future[str] = Future()
+        self.requested += 1
+        index = self.requested
+
+        def run() -> None:
+            try:
+                with span("commit.candidate", index=index):
+                    result = self.__analyzer.generate_commit_message(self.__diff_text, self.__file_summary)
+            except Exception as exc:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+                future.set_exception(exc)
+                return
+            future.set_result(result)
+
+        # Carry the caller's context so the analyzer's telemetry and trace spans nest under the command.
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(run,), name=f"commit-candidate-{index}", daemon=True).start()
+        self.__pending.append(future)
@@ -0,0 +1,134 @@
+"""Service that builds an activity digest from incrementally ingested commits and cached summaries."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from datetime import date, datetime, timezone
+from itertools import groupby
+from pathlib import Path
+from typing import Iterator
+
+from gitgossip.core.interfaces.llm_analyzer import ILLMAnalyzer
+from gitgossip.core.models.commit import Commit
+from gitgossip.core.models.digest import DigestEntry
+from gitgossip.core.storage.digest_store import CommitRow, DigestStore
+from gitgossip.utils.git_stream import git_output, is_ancestor, iter_git_records
+from gitgossip.utils.profiler import phase
+from gitgossip.utils.tracing import span
+
+# Per commit: SHA, mailmap-resolved author, committer timestamp and subject line.
+_LOG_FORMAT = "--format=%H%x00%aN%x00%aE%x00%ct%x00%s"
+
+
+class DigestService:
+    """Summarizes who did what, per repository, author and day.
+
+    `ingest` reads only commits added since the repository's stored tip.
+    `build` groups the window's commits into (repository, author, day) buckets
+    and asks the analyzer only about buckets whose commit set changed since
+    the last run, so the LLM cost of a run follows new activity rather than
+    the size of the window.
+    """
+
+    def __init__(self, store: DigestStore, llm_analyzer: ILLMAnalyzer) -> None:
+        """Initialize the service with a digest store and the analyzer used for new buckets."""
+        self.__store = store
+        self.__llm_analyzer = llm_analyzer
+        self.__logger = logging.getLogger(self.__class__.__name__)
+
+    def ingest(self, repo: Path) -> int:
+        """Record commits reachable from HEAD that are not stored yet; return how many were added.
+
+        Raises:
+            GitCommandError: If the repository or its HEAD cannot be read.
+        """
+        key = str(repo)
+        head = git_output(repo, "rev-parse", "--verify", "HEAD")
+        tip = self.__store.tip(key)
+        if tip == head:
+            return 0
+
+        incremental = tip is not None and is_ancestor(repo, tip, head)
+        revision_range = f"{tip}..{head}" if incremental else head
+        self.__logger.debug("Ingesting %s (%s)", repo, revision_range)
+        args = ["git", "-C", str(repo), "log", "-z", _LOG_FORMAT, revision_range]
+        with span("digest.ingest", repo=key, incremental=incremental) as current, phase("ingestion"):
+            added = self.__store.add_commits(key, self.__rows(args), tip=head, reset=not incremental)
+            current.set(commit_count=added)
+            return added
+
+    def build(self, repos: list[Path], since_ts: int, author: str | None = None) -> list[DigestEntry]:
+        """Return digest entries for every bucket in the window, newest day first."""
+        pattern = re.compile(author, re.IGNORECASE) if author else None
+        entries: list[DigestEntry] = []
+        for repo in repos:
+            rows = self.__store.commits_since(str(repo), since_ts)
+            if pattern is not None:
+                rows = [row for row in rows if pattern.search(f"{row.author} <{row.email}>")]
+            rows.sort(key=lambda row: (row.email.lower(), row.day, row.ts))
+            for (email, day), bucket in groupby(rows, key=lambda row: (row.email.lower(), row.day)):
+                entries.append(self.__summarize_bucket(repo, email, day, list(bucket)))
+        entries.sort(key=lambda e: (e.day, e.commits), reverse=True)
+        return entries
+
+    def __summarize_bucket(self, repo: Path, email: str, day: str, rows: list[CommitRow]) -> DigestEntry:
+        """Reuse the stored summary for this bucket or generate (and store) a new one."""
+        with span("digest.bucket", repo=str(repo), day=day, commit_count=len(rows)) as current:
+            entry = self.__summarize_rows(repo, email, day, rows)
+            current.set(cache_hit=entry.cached)
+            return entry
+
+    def __summarize_rows(self, repo: Path, email: str, day: str, rows: list[CommitRow]) -> DigestEntry:
+        """Do the work of `__summarize_bucket`."""
+        fingerprint = hashlib.sha1("\n".join(row.sha for row in rows).encode("ascii")).hexdigest()
+        cached = self.__store.summary(str(repo), email, day, fingerprint)
+        if cached is not None:
+            return self.__entry(repo, day, rows, cached, cached=True)
+
+        summary = self.__llm_analyzer.analyze_commits(
+            [
+                Commit(
+                    hash=row.sha,
+                    author=row.author,
+                    email=row.email,
+                    date=datetime.fromtimestamp(row.ts, tz=timezone.utc),
+                    message=row.subject,
+                    insertions=0,
+                    deletions=0,
+                    files_changed=0,
+                )
+                for row in rows
+            ]
+        )
+        if not summary.startswith("[LLM ERROR]"):
+            self.__store.save_summary(str(repo), email, day, fingerprint, summary)
+        return self.__entry(repo, day, rows, summary, cached=False)
+
+    @staticmethod
+    def __entry(repo: Path, day: str, rows: list[CommitRow], summary: str, cached: bool) -> DigestEntry:
+        """Build the digest entry for one bucket (the latest commit's spelling of the author wins)."""
+        return DigestEntry(
+            repo=repo.name,
+            day=date.fromisoformat(day),
+            author=rows[-1].author,
+            email=rows[-1].email.lower(),
+            commits=len(rows),
+            summary=summary,
+            cached=cached,
+        )
+
+    @staticmethod
+    def __rows(args: list[str]) -> Iterator[CommitRow]:
+        """Convert ``git log -z`` records into store rows (days are local calendar dates)."""
+        for sha, name, email, timestamp, subject in iter_git_records(args, width=5):
+            ts = int(timestamp)
+            yield CommitRow(
+                sha=sha.decode("ascii"),
+                author=name.decode("utf-8", "replace"),
+                email=email.decode("utf-8", "replace"),
+                ts=ts,
+                day=datetime.fromtimestamp(ts).date().isoformat(),
+                subject=subject.decode("utf-8", "replace"),
+            )
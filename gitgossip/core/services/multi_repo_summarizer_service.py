@@ -0,0 +1,134 @@
+"""Service that summarizes many repositories concurrently with a shared analyzer."""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterator, TypeVar
+
+from gitgossip.core.interfaces.commit_parser import ICommitParser
+from gitgossip.core.interfaces.llm_analyzer import ILLMAnalyzer
+from gitgossip.core.llm.telemetry import scoped_calls
+from gitgossip.core.models.commit import Commit
+from gitgossip.core.models.repo_summary import RepoSummary
+from gitgossip.core.parsers.commit_parser import CommitParser
+from gitgossip.core.providers.git_repo_provider import GitRepoProvider
+from gitgossip.utils.tracing import span
+
+_T = TypeVar("_T")
+
+
+def _default_parser(repo_path: Path) -> ICommitParser:
+    """Build the standard GitPython-backed commit parser for a repository."""
+    return CommitParser(repo_provider=GitRepoProvider(path=repo_path))
+
+
+def _in_context(func: Callable[..., _T]) -> Callable[..., _T]:
+    """Bind ``func`` to a copy of the caller's context, so pool threads see the caller's trace span."""
+    return partial(contextvars.copy_context().run, func)
+
+
+class MultiRepoSummarizerService:
+    """Overlaps git ingestion and LLM analysis across repositories.
+
+    Commit ingestion runs on a pool of ``jobs`` threads (GitPython shells out to
+    ``git``, so threads overlap fine). As soon as a repository's commits are
+    read, its analysis is queued on a separate executor bounded by
+    ``llm_concurrency`` so the model endpoint never sees more parallel requests
+    than configured. Results are yielded as they finish or, with
+    ``ordered=True``, in discovery order as soon as each prefix is ready.
+
+    A failing repository yields a `RepoSummary` with ``error`` set and never
+    blocks the others.
+    """
+
+    def __init__(
+        self,
+        llm_analyzer: ILLMAnalyzer,
+        jobs: int = 4,
+        llm_concurrency: int | None = None,
+        parser_factory: Callable[[Path], ICommitParser] = _default_parser,
+    ) -> None:
+        """Initialize the service with a shared analyzer and worker limits."""
+        if jobs < 1:
+            raise ValueError("jobs must be at least 1")
+        self.__llm_analyzer = llm_analyzer
+        self.__jobs = jobs
+        self.__llm_concurrency = max(1, llm_concurrency or jobs)
+        self.__parser_factory = parser_factory
+        self.__logger = logging.getLogger(self.__class__.__name__)
+
+    def summarize_repositories(
+        self,
+        repos: list[Path],
+        author: str | None = None,
+        since: str | None = None,
+        limit: int = 100,
+        ordered: bool = False,
+    ) -> Iterator[RepoSummary]:
+        """Yield one `RepoSummary` per repository as results become available."""
+        pending: dict[Future[RepoSummary | list[Commit]], tuple[int, bool]] = {}
+        ready: dict[int, RepoSummary] = {}
+        next_index = 0
+
+        with (
+            ThreadPoolExecutor(max_workers=self.__jobs, thread_name_prefix="gitgossip-ingest") as ingest_pool,
+            ThreadPoolExecutor(max_workers=self.__llm_concurrency, thread_name_prefix="gitgossip-llm") as llm_pool,
+        ):
+            for index, repo in enumerate(repos):
+                pending[ingest_pool.submit(_in_context(self._read_commits), repo, author, since, limit)] = (
+                    index,
+                    False,
+                )
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, analyzed = pending.pop(future)
+                    result = self.__outcome(future, index, repos[index], analyzed)
+                    if isinstance(result, list):
+                        pending[llm_pool.submit(_in_context(self._analyze), index, repos[index], result)] = (
+                            index,
+                            True,
+                        )
+                        continue
+                    if not ordered:
+                        yield result
+                        continue
+                    ready[index] = result
+                    while next_index in ready:
+                        yield ready.pop(next_index)
+                        next_index += 1
+
+    def _read_commits(self, repo: Path, author: str | None, since: str | None, limit: int) -> list[Commit]:
+        """Read commits for one repository (runs on the ingestion pool)."""
+        with span("repo.read_commits", repo=str(repo), author=author, since=since, limit=limit) as current:
+            commits = self.__parser_factory(repo).get_commits(author=author, since=since, limit=limit)
+            current.set(commit_count=len(commits))
+            return commits
+
+    def _analyze(self, index: int, repo: Path, commits: list[Commit]) -> RepoSummary:
+        """Summarize already-read commits (runs on the bounded LLM pool); no commits means an empty summary."""
+        if not commits:
+            return RepoSummary(index=index, repo_path=repo)
+        with span("repo.analyze", repo=str(repo), commit_count=len(commits)), scoped_calls() as calls:
+            summary = self.__llm_analyzer.analyze_commits(commits)
+        return RepoSummary(index=index, repo_path=repo, summary=summary, commit_count=len(commits), llm_calls=calls)
+
+    def __outcome(
+        self,
+        future: Future[RepoSummary | list[Commit]],
+        index: int,
+        repo: Path,
+        analyzed: bool,
+    ) -> RepoSummary | list[Commit]:
+        """Unwrap a finished future, converting any exception into an error result for that repository."""
+        try:
+            return future.result()
+        except Exception as exc:
+            stage = "analyzing" if analyzed else "reading commits in"
+            self.__logger.debug("Failed %s %s: %s", stage, repo, exc, exc_info=True)
+            return RepoSummary(index=index, repo_path=repo, error=f"Error {stage} {repo}: {exc}")
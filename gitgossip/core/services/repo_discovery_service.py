@@ -3,59 +3,154 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
 
 from git import Repo
 from git.exc import InvalidGitRepositoryError, NoSuchPathError
 
+from gitgossip.core.constants import DISCOVERY_SKIP_GLOBS
 from gitgossip.core.interfaces.repo_discover_service import IRepoDiscoveryService
+from gitgossip.core.storage.discovery_cache import DiscoveryCache
+from gitgossip.utils.profiler import phase
 
 
-class RepoDiscoveryService(IRepoDiscoveryService):
-    """Locates Git repositories in a given directory path."""
+def is_repository(path: str) -> bool:
+    """Return True for a working tree (``.git`` dir), a worktree/submodule (``.git`` file) or a bare repository."""
+    if os.path.exists(os.path.join(path, ".git")):
+        return True
+    return (
+        os.path.isfile(os.path.join(path, "HEAD"))
+        and os.path.isdir(os.path.join(path, "objects"))
+        and os.path.isdir(os.path.join(path, "refs"))
+    )
+
 
-    def __init__(self, base_dir: Path, recursive: bool = False) -> None:
+class RepoDiscoveryService(IRepoDiscoveryService):
+    """Locates Git repositories in a given directory path.
+
+    The walk uses ``os.scandir`` (one directory read per level, no per-entry
+    ``Path`` objects), never follows symlinks, does not descend into
+    non-repository directories matching ``skip_globs`` (a repository is kept
+    whatever its name) and does not descend into a repository once found. When
+    more than one top-level subtree needs descending, subtrees are walked on a
+    thread pool. With a `DiscoveryCache`, a previous walk is reused as long as
+    none of the inspected directories changed.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        recursive: bool = False,
+        max_depth: int | None = None,
+        skip_globs: Iterable[str] = DISCOVERY_SKIP_GLOBS,
+        workers: int = 8,
+        cache: DiscoveryCache | None = None,
+    ) -> None:
         """Initialize the discovery service.
 
         Args:
             base_dir (Path): The directory to discover Git repositories from.
             recursive: Whether to search subdirectories recursively.
+            max_depth: How many directory levels below ``base_dir`` to search
+                (1 = direct children). Defaults to 1, or unlimited when ``recursive``.
+            skip_globs: Globs for non-repository directory names that are never descended into.
+            workers: Threads used to walk top-level subtrees in parallel.
+            cache: Optional manifest cache revalidated by directory mtimes.
         """
         self._base_dir = base_dir
         self.recursive = recursive
+        self.max_depth = max_depth if max_depth is not None else (None if recursive else 1)
+        self._skip_globs = tuple(skip_globs)
+        self._workers = max(1, workers)
+        self._cache = cache
 
     def find_repositories(self) -> List[Path]:
         """Find Git repositories inside the given directory.
 
         Returns:
-            A list of Paths representing valid Git repositories.
+            A sorted list of Paths representing valid Git repositories.
         """
+        with phase("discovery"):
+            return self._find_repositories()
+
+    def _find_repositories(self) -> List[Path]:
+        """Walk (or reuse the cached walk of) ``base_dir``; see `find_repositories`."""
         if not self._base_dir.exists():
             raise FileNotFoundError(f"Path does not exist: {self._base_dir}")
 
         if not self._base_dir.is_dir():
             raise NotADirectoryError(f"Expected directory, got file: {self._base_dir}")
 
-        repos: list[Path] = []
-
         # Case 1: if this directory itself is a repo
-        if (self._base_dir / ".git").exists():
-            repos.append(self._base_dir)
-            return repos
+        if is_repository(str(self._base_dir)):
+            return [self._base_dir]
 
         # Case 2: look for nested repos
-        for sub in self._base_dir.iterdir():
-            if (sub / ".git").exists():
-                repos.append(sub)
-            elif self.recursive and sub.is_dir():
-                for root, dirs, _ in os.walk(sub):
-                    if ".git" in dirs:
-                        repos.append(Path(root))
-                        dirs.clear()  # stop recursion below this repo
-                        break
-
-        return repos
+        key = f"{self._base_dir}|{self.max_depth}|{','.join(sorted(self._skip_globs))}"
+        if self._cache is not None:
+            cached = self._cache.load(key, is_repository)
+            if cached is not None:
+                return cached
+
+        dir_mtimes = {str(self._base_dir): os.stat(self._base_dir).st_mtime_ns}
+        repos, subdirs = self._scan(str(self._base_dir), dir_mtimes)
+        if subdirs and (self.max_depth is None or self.max_depth > 1):
+            if self._workers > 1 and len(subdirs) > 1:
+                with ThreadPoolExecutor(max_workers=min(self._workers, len(subdirs))) as pool:
+                    results = list(pool.map(self._walk, subdirs))
+            else:
+                results = [self._walk(subdir) for subdir in subdirs]
+            for sub_repos, sub_mtimes in results:
+                repos.extend(sub_repos)
+                dir_mtimes.update(sub_mtimes)
+
+        found = sorted(Path(repo) for repo in repos)
+        if self._cache is not None:
+            self._cache.store(key, found, dir_mtimes)
+        return found
+
+    def _walk(self, root: str) -> tuple[list[str], dict[str, int]]:
+        """Depth-first walk of one top-level subtree (``root`` sits at depth 1)."""
+        repos: list[str] = []
+        dir_mtimes: dict[str, int] = {}
+        stack = [(root, 2)]
+        while stack:
+            path, depth = stack.pop()
+            found, subdirs = self._scan(path, dir_mtimes)
+            repos.extend(found)
+            if self.max_depth is None or depth < self.max_depth:
+                stack.extend((subdir, depth + 1) for subdir in subdirs)
+        return repos, dir_mtimes
+
+    def _scan(self, path: str, dir_mtimes: dict[str, int]) -> tuple[list[str], list[str]]:
+        """List one directory: return child repositories and the non-repository children worth descending.
+
+        Records the mtime of every non-repository child so a later cache check
+        notices repositories created, removed or renamed underneath it.
+        """
+        repos: list[str] = []
+        subdirs: list[str] = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        if is_repository(entry.path):
+                            repos.append(entry.path)
+                            continue
+                        if any(fnmatch(entry.name, pattern) for pattern in self._skip_globs):
+                            continue
+                        dir_mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime_ns
+                    except OSError:
+                        continue
+                    subdirs.append(entry.path)
+        except OSError:
+            pass  # unreadable directory: keep whatever was listed
+        return repos, subdirs
 
     def is_valid_repo(self) -> bool:
         """Check whether the given path is a valid Git repository."""
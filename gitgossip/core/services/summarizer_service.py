@@ -9,16 +9,34 @@ from rich.progress import Progress
 
 from gitgossip.core.interfaces.commit_parser import ICommitParser
 from gitgossip.core.interfaces.llm_analyzer import ILLMAnalyzer
+from gitgossip.utils.diff_spool import DEFAULT_MAX_MEMORY, DiffSpool
+from gitgossip.utils.profiler import phase
+from gitgossip.utils.tracing import annotate, span
 
 
 class SummarizerService:
     """Generates structured commit summaries for one or more repositories."""
 
-    def __init__(self, commit_parser: ICommitParser, llm_analyzer: ILLMAnalyzer, chunk_size: int = 8000) -> None:
-        """Initialize summarizer service with injected dependencies."""
+    def __init__(
+        self,
+        commit_parser: ICommitParser,
+        llm_analyzer: ILLMAnalyzer,
+        chunk_size: int = 8000,
+        max_diff_memory: int = DEFAULT_MAX_MEMORY,
+        show_progress: bool = True,
+    ) -> None:
+        """Initialize summarizer service with injected dependencies.
+
+        ``chunk_size`` and ``max_diff_memory`` are in UTF-8 bytes. ``max_diff_memory``
+        caps how much of a merge request diff is buffered in memory; larger diffs
+        are spooled to a temporary file and read back through ``mmap``.
+        ``show_progress`` toggles the chunk progress bar (off for machine-readable output).
+        """
         self.__commit_parser = commit_parser
         self.__llm_analyzer = llm_analyzer
         self.__chunk_size = chunk_size
+        self.__max_diff_memory = max_diff_memory
+        self.__show_progress = show_progress
         self.__logger = logging.getLogger(self.__class__.__name__)
 
     def summarize_repository(
@@ -27,28 +45,43 @@ class SummarizerService:
         since: str | None = None,
         limit: int = 100,
     ) -> str:
-        """Summarize commits for a single repository."""
-        return self.__llm_analyzer.analyze_commits(
-            self.__commit_parser.get_commits(author=author, since=since, limit=limit)
-        )
+        """Summarize commits for a single repository (an empty string when no commits match)."""
+        with span("summarize.repository", author=author, since=since, limit=limit) as current:
+            commits = self.__commit_parser.get_commits(author=author, since=since, limit=limit)
+            current.set(commit_count=len(commits))
+            if not commits:
+                return ""
+            return self.__llm_analyzer.analyze_commits(commits)
 
     def summarize_for_merge_request(self, target_branch: str) -> tuple[str, str]:
         """Compare current branch with the target branch and generate a Merge Request title & description."""
-        diff_text = self.__commit_parser.repo_provider.get_diff_between_branches(target_branch)
-
-        if not diff_text.strip():
-            return (
-                "No code changes detected",
-                "There are no differences between the current branch and the target branch.",
-            )
-
-        # Always use chunk-based summarization for diffs
-        if len(diff_text) <= self.__chunk_size:
-            self.__logger.debug("Small diff detected (%d chars), summarizing directly", len(diff_text))
-            chunk_summaries = [self.__llm_analyzer.summarize_diff_chunk(diff_text, metadata="[Single Chunk]")]
-        else:
-            self.__logger.debug("Large diff detected (%d chars), splitting into chunks", len(diff_text))
-            chunk_summaries = self._summarize_diff_in_chunks(diff_text)
+        with span("summarize.merge_request", target_branch=target_branch):
+            return self.__summarize_for_merge_request(target_branch)
+
+    def __summarize_for_merge_request(self, target_branch: str) -> tuple[str, str]:
+        """Do the work of `summarize_for_merge_request`, decoding at most one diff chunk at a time."""
+        with DiffSpool(self.__max_diff_memory) as spool:
+            self.__commit_parser.repo_provider.write_diff_between_branches(target_branch, spool)
+            annotate(diff_bytes=spool.size, diff_spilled=spool.spilled)
+
+            # Always use chunk-based summarization for diffs
+            if spool.size <= self.__chunk_size:
+                diff_text = spool.read()
+                if not diff_text.strip():
+                    return (
+                        "No code changes detected",
+                        "There are no differences between the current branch and the target branch.",
+                    )
+                self.__logger.debug("Small diff detected (%d bytes), summarizing directly", spool.size)
+                with span("summarize.chunk", chunk_index=1, chunk_count=1, chunk_bytes=spool.size):
+                    chunk_summaries = [self.__llm_analyzer.summarize_diff_chunk(diff_text, metadata="[Single Chunk]")]
+            else:
+                self.__logger.debug(
+                    "Large diff detected (%d bytes, %s), splitting into chunks",
+                    spool.size,
+                    "spilled to disk" if spool.spilled else "in memory",
+                )
+                chunk_summaries = self.__summarize_chunks(spool)
 
         # First, merge all chunk summaries into a readable combined summary
         merged_summary = "\n".join(chunk_summaries)
@@ -64,41 +97,27 @@ class SummarizerService:
         # Pass combined summary to final MR generator
         return self.__llm_analyzer.generate_mr_summary(final_text)
 
-    def _summarize_diff_in_chunks(self, diff_text: str) -> List[str]:
-        """Split a large diff into chunks and summarize each."""
-        chunks = self._split_diff(diff_text)
-        summaries: List[str] = []
+    def __summarize_chunks(self, spool: DiffSpool) -> List[str]:
+        """Summarize the spooled diff chunk by chunk, decoding each chunk only when it is sent.
 
-        with Progress(transient=True) as progress:
-            task = progress.add_task("[cyan]Summarizing diff chunks...", total=len(chunks))
+        Chunks are views into the spool's mapping; counting them first (one
+        ``rfind`` per chunk) lets every prompt say which part of how many it is.
+        """
+        with phase("chunk"):
+            total = spool.count_chunks(self.__chunk_size)
+        summaries: List[str] = []
 
-            for idx, chunk in enumerate(chunks, start=1):
-                summary = self.__llm_analyzer.summarize_diff_chunk(
-                    diff_chunk=chunk, metadata=f"[Part {idx}/{len(chunks)}]"
-                )
+        with Progress(transient=True, disable=not self.__show_progress) as progress:
+            task = progress.add_task("[cyan]Summarizing diff chunks...", total=total)
+            for idx, chunk in enumerate(spool.chunks(self.__chunk_size), start=1):
+                with chunk, span("summarize.chunk", chunk_index=idx, chunk_count=total, chunk_bytes=chunk.nbytes):
+                    with phase("chunk"):
+                        text = str(chunk, "utf-8", "replace")
+                    summary = self.__llm_analyzer.summarize_diff_chunk(
+                        diff_chunk=text, metadata=f"[Part {idx}/{total}]"
+                    )
                 summaries.append(summary)
                 progress.update(task, advance=1)
 
+        self.__logger.debug("Summarized diff in %d chunks", total)
         return summaries
-
-    def _split_diff(self, diff_text: str) -> List[str]:
-        """Split large diff text into size-safe chunks preserving line boundaries."""
-        lines = diff_text.splitlines()
-        chunks: List[str] = []
-        current_chunk: list[str] = []
-        current_len = 0
-
-        for line in lines:
-            line_len = len(line) + 1
-            if current_len + line_len > self.__chunk_size:
-                chunks.append("\n".join(current_chunk))
-                current_chunk = []
-                current_len = 0
-            current_chunk.append(line)
-            current_len += line_len
-
-        if current_chunk:
-            chunks.append("\n".join(current_chunk))
-
-        self.__logger.debug("Split diff into %d chunks", len(chunks))
-        return chunks
@@ -0,0 +1 @@
+"""Rebuildable on-disk caches kept under ``CACHE_DIR`` (discovery manifests, ...)."""
@@ -0,0 +1,234 @@
+"""Persistent per-repository index of who committed when."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any
+
+from gitgossip.core.constants import CACHE_DIR
+from gitgossip.core.models.author import AuthorActivity
+from gitgossip.utils.git_stream import git_output, is_ancestor, iter_git_records
+from gitgossip.utils.profiler import phase
+
+# Per commit: SHA, raw author (what `git log --author` matches), mailmap-resolved author, committer timestamp.
+_LOG_FORMAT = "--format=%H%x00%an%x00%ae%x00%aN%x00%aE%x00%ct"
+
+
+class _Identity:
+    """Commits of one raw author identity, kept sorted by timestamp."""
+
+    __slots__ = ("name", "email", "timestamps", "shas")
+
+    def __init__(self, name: str, email: str, timestamps: list[int] | None = None, shas: list[str] | None = None):
+        self.name = name
+        self.email = email
+        self.timestamps: list[int] = timestamps or []
+        self.shas: list[str] = shas or []
+
+    def since(self, since_ts: int | None) -> int:
+        """Return the position of the first commit at or after ``since_ts``."""
+        return bisect_left(self.timestamps, since_ts) if since_ts is not None else 0
+
+
+class AuthorIndex:
+    """Author identity → sorted commit timestamps and SHAs for the history reachable from HEAD.
+
+    The index is built with one ``git log`` pass and stored as JSON under
+    ``CACHE_DIR/authors``. `refresh` only reads ``<indexed tip>..HEAD`` when the
+    old tip is still an ancestor of HEAD; rewritten history, a switched branch
+    or an edited ``.mailmap`` trigger a full rebuild. Queries are then plain
+    bisects over in-memory lists instead of history walks.
+    """
+
+    DEFAULT_DIR = CACHE_DIR / "authors"
+    VERSION = 1
+
+    def __init__(self, repo: Path, index_dir: Path | None = None) -> None:
+        """Initialize the index for ``repo`` (a working tree or bare repository path)."""
+        self._repo = repo.expanduser().resolve()
+        digest = hashlib.sha1(str(self._repo).encode("utf-8")).hexdigest()[:16]
+        self._path = (index_dir or self.DEFAULT_DIR) / f"{digest}.json"
+        self._tip: str | None = None
+        self._mailmap: list[int] | None = None
+        self._identities: dict[str, _Identity] = {}
+        self._status: str | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def tip(self) -> str | None:
+        """SHA of the most recent commit covered by the index."""
+        return self._tip
+
+    @property
+    def status(self) -> str | None:
+        """How the last `refresh` went: "current" (nothing new), "extended" or "rebuilt"; None before any."""
+        return self._status
+
+    def refresh(self) -> AuthorIndex:
+        """Bring the index up to date with HEAD, reading only new commits when possible.
+
+        Raises:
+            GitCommandError: If HEAD cannot be resolved (not a repository, unborn branch).
+        """
+        with phase("ingestion"):
+            return self._refresh()
+
+    def _refresh(self) -> AuthorIndex:
+        """Do the work of `refresh`."""
+        head = git_output(self._repo, "rev-parse", "--verify", "HEAD")
+        self._load()
+        mailmap = self._mailmap_signature()
+        if self._tip == head and self._mailmap == mailmap:
+            self._status = "current"
+            return self
+
+        if self._tip and self._mailmap == mailmap and is_ancestor(self._repo, self._tip, head):
+            self._logger.debug("Extending author index for %s from %s", self._repo, self._tip[:8])
+            self._ingest(f"{self._tip}..{head}")
+            self._status = "extended"
+        else:
+            self._logger.debug("Building author index for %s", self._repo)
+            self._identities = {}
+            self._ingest(head)
+            self._status = "rebuilt"
+        self._tip = head
+        self._mailmap = mailmap
+        self._save()
+        return self
+
+    def activity(self, since_ts: int | None = None) -> list[AuthorActivity]:
+        """Return commit counts and first/last timestamps per mailmap-resolved identity since ``since_ts``."""
+        merged: dict[tuple[str, str], list[int]] = {}
+        for identity in self._identities.values():
+            start = identity.since(since_ts)
+            if start == len(identity.timestamps):
+                continue
+            count = len(identity.timestamps) - start
+            first, last = identity.timestamps[start], identity.timestamps[-1]
+            seen = merged.get((identity.name, identity.email))
+            if seen is None:
+                merged[(identity.name, identity.email)] = [count, first, last]
+            else:
+                seen[0] += count
+                seen[1] = min(seen[1], first)
+                seen[2] = max(seen[2], last)
+        return [AuthorActivity(name, email, *stats) for (name, email), stats in merged.items()]
+
+    def commits_by(self, author: str, since_ts: int | None = None, limit: int | None = None) -> list[str]:
+        """Return SHAs (newest first) whose author matches ``author`` exactly as ``git log --author`` would.
+
+        git applies the pattern itself (POSIX regular expressions, honouring
+        ``grep.patternType``) to one commit per indexed identity with
+        ``git log --no-walk``, so no history is walked.
+
+        Raises:
+            GitCommandError: If git rejects the pattern.
+        """
+        if not self._identities:
+            return []
+        representatives = {identity.shas[-1]: identity for identity in self._identities.values()}
+        matching = git_output(
+            self._repo,
+            "log",
+            "--no-walk",
+            "--stdin",
+            f"--author={author}",
+            "--format=%H",
+            stdin="\n".join(representatives) + "\n",
+        ).split()
+        matches: list[tuple[int, str]] = []
+        for identity in (representatives[sha] for sha in matching):
+            start = identity.since(since_ts)
+            matches.extend(zip(identity.timestamps[start:], identity.shas[start:]))
+        matches.sort(reverse=True)
+        return [sha for _, sha in matches[:limit]]
+
+    def _ingest(self, revision_range: str) -> None:
+        """Add every commit in ``revision_range`` to the in-memory index.
+
+        Records are matched to identities on their raw bytes, so each distinct
+        author is decoded (and interned) once rather than once per commit.
+        """
+        args = ["git", "-C", str(self._repo), "log", "-z", _LOG_FORMAT, revision_range]
+        by_bytes: dict[tuple[bytes, bytes], _Identity] = {}
+        touched: set[_Identity] = set()
+        for sha, an, ae, name, email, timestamp in iter_git_records(args, width=6):
+            identity = by_bytes.get((an, ae))
+            if identity is None:
+                raw = f"{_decode(an)} <{_decode(ae)}>"
+                identity = self._identities.get(raw)
+                if identity is None:
+                    identity = _Identity(_decode(name), _decode(email))
+                    self._identities[raw] = identity
+                by_bytes[(an, ae)] = identity
+            identity.timestamps.append(int(timestamp))
+            identity.shas.append(sha.decode("ascii"))
+            touched.add(identity)
+        for identity in touched:
+            pairs = sorted(zip(identity.timestamps, identity.shas))
+            identity.timestamps = [ts for ts, _ in pairs]
+            identity.shas = [sha for _, sha in pairs]
+
+    def _load(self) -> None:
+        """Load the stored index; a missing, corrupt or outdated file leaves an empty index."""
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return
+        try:
+            identities = {
+                raw: _Identity(entry["name"], entry["email"], entry["t"], _split_shas(entry["h"], len(entry["t"])))
+                for raw, entry in data["authors"].items()
+            }
+        except (KeyError, TypeError, AttributeError):
+            return
+        self._tip = data.get("tip")
+        self._mailmap = data.get("mailmap")
+        self._identities = identities
+
+    def _save(self) -> None:
+        """Persist the index atomically (SHAs are stored as one concatenated string to keep the file compact)."""
+        data: dict[str, Any] = {
+            "version": self.VERSION,
+            "repo": str(self._repo),
+            "tip": self._tip,
+            "mailmap": self._mailmap,
+            "authors": {
+                raw: {"name": i.name, "email": i.email, "t": i.timestamps, "h": "".join(i.shas)}
+                for raw, i in self._identities.items()
+            },
+        }
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self._path)
+        except OSError as e:
+            self._logger.debug("Could not write author index %s: %s", self._path, e)
+
+    def _mailmap_signature(self) -> list[int] | None:
+        """Return ``[mtime_ns, size]`` of the working tree ``.mailmap`` (``None`` if absent)."""
+        try:
+            stat = (self._repo / ".mailmap").stat()
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+
+def _decode(raw: bytes) -> str:
+    """Decode an identity field and intern it (the same names recur across commits and repositories)."""
+    return sys.intern(raw.decode("utf-8", "replace"))
+
+
+def _split_shas(joined: str, count: int) -> list[str]:
+    """Split a concatenated run of ``count`` equal-length SHAs (40 hex chars, or 64 for SHA-256 repositories)."""
+    width = len(joined) // count if count else 0
+    return [joined[i : i + width] for i in range(0, width * count, width)]
@@ -0,0 +1,57 @@
+"""Commit messages remembered per staged tree, so an unchanged index never goes back to the model."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from pathlib import Path
+
+from gitgossip.core.constants import CACHE_DIR
+from gitgossip.core.storage.json_entries import read_entries, write_entries
+
+
+class CommitMessageCache:
+    """Maps a staged state to the last commit message generated (or edited) for it.
+
+    Entries are keyed by `key`: the index tree hash from ``git write-tree``
+    (identical staged content gives the same tree in any worktree), a
+    fingerprint of the model configuration and one of the commit prompt
+    template, so switching models or editing the template never serves a stale
+    message. Only the ``MAX_ENTRIES`` most recently stored entries are kept. Any
+    read or write problem is treated as a cache miss; the cache is never
+    required for correctness.
+    """
+
+    DEFAULT_PATH = CACHE_DIR / "commit_messages.json"
+    VERSION = 1
+    MAX_ENTRIES = 256
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the cache backed by a JSON file (default: ``~/.gitgossip/cache/commit_messages.json``)."""
+        self._path = path or self.DEFAULT_PATH
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def key(tree: str, model: str, template: str) -> str:
+        """Return the cache key for a staged tree hash, model fingerprint and template fingerprint."""
+        return hashlib.sha256("\0".join((tree, model, template)).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the message stored for ``key``, or ``None``."""
+        message = read_entries(self._path, self.VERSION).get(key)
+        if not isinstance(message, str):
+            return None
+        self._logger.debug("Commit message cache hit for %s", key[:12])
+        return message
+
+    def put(self, key: str, message: str) -> None:
+        """Store ``message`` for ``key``, evicting the oldest entries beyond ``MAX_ENTRIES``."""
+        entries = read_entries(self._path, self.VERSION)
+        entries.pop(key, None)
+        entries[key] = message
+        for stale in list(entries)[: max(0, len(entries) - self.MAX_ENTRIES)]:
+            del entries[stale]
+        try:
+            write_entries(self._path, self.VERSION, entries)
+        except OSError as e:
+            self._logger.debug("Could not write commit message cache %s: %s", self._path, e)
@@ -0,0 +1,129 @@
+"""SQLite store backing the incremental activity digest."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from types import TracebackType
+from typing import Iterable, NamedTuple
+
+from gitgossip.core.constants import CACHE_DIR
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS repo_tips (
+    repo TEXT PRIMARY KEY,
+    tip TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS commits (
+    repo TEXT NOT NULL,
+    sha TEXT NOT NULL,
+    author TEXT NOT NULL,
+    email TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    PRIMARY KEY (repo, sha)
+);
+CREATE INDEX IF NOT EXISTS commits_by_time ON commits (repo, ts);
+CREATE TABLE IF NOT EXISTS day_summaries (
+    repo TEXT NOT NULL,
+    email TEXT NOT NULL,
+    day TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    PRIMARY KEY (repo, email, day)
+);
+"""
+
+
+class CommitRow(NamedTuple):
+    """One ingested commit (``day`` is the local ISO date of ``ts``)."""
+
+    sha: str
+    author: str
+    email: str
+    ts: int
+    day: str
+    subject: str
+
+
+class DigestStore:
+    """Per-commit metadata and per-author-per-day summaries, keyed by repository path.
+
+    Each repository remembers the tip it was last ingested at, so only new
+    commits are read on the next run. Day summaries carry a fingerprint of the
+    commits they were generated from and are reused while it still matches.
+    """
+
+    DEFAULT_PATH = CACHE_DIR / "digest.sqlite3"
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Open (and create if needed) the store at ``path`` (default: ``~/.gitgossip/cache/digest.sqlite3``)."""
+        self._path = path or self.DEFAULT_PATH
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self._path)
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self) -> DigestStore:
+        """Return the open store."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the database connection."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    def tip(self, repo: str) -> str | None:
+        """Return the last ingested tip of ``repo``."""
+        row = self._db.execute("SELECT tip FROM repo_tips WHERE repo = ?", (repo,)).fetchone()
+        return row[0] if row else None
+
+    def add_commits(self, repo: str, rows: Iterable[CommitRow], tip: str, reset: bool = False) -> int:
+        """Store new commits and move the tip in one transaction; ``reset`` drops the repository's commits first."""
+        with self._db:
+            if reset:
+                self._db.execute("DELETE FROM commits WHERE repo = ?", (repo,))
+            before = self._db.total_changes
+            self._db.executemany(
+                "INSERT OR IGNORE INTO commits (repo, sha, author, email, ts, day, subject) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((repo, *row) for row in rows),
+            )
+            added = self._db.total_changes - before
+            self._db.execute(
+                "INSERT INTO repo_tips (repo, tip) VALUES (?, ?) ON CONFLICT(repo) DO UPDATE SET tip = excluded.tip",
+                (repo, tip),
+            )
+        return added
+
+    def commits_since(self, repo: str, since_ts: int) -> list[CommitRow]:
+        """Return commits of ``repo`` at or after ``since_ts``, oldest first."""
+        cursor = self._db.execute(
+            "SELECT sha, author, email, ts, day, subject FROM commits WHERE repo = ? AND ts >= ? ORDER BY ts, sha",
+            (repo, since_ts),
+        )
+        return [CommitRow(*row) for row in cursor]
+
+    def summary(self, repo: str, email: str, day: str, fingerprint: str) -> str | None:
+        """Return the cached summary for a bucket if it was generated from the same commits."""
+        row = self._db.execute(
+            "SELECT summary FROM day_summaries WHERE repo = ? AND email = ? AND day = ? AND fingerprint = ?",
+            (repo, email, day, fingerprint),
+        ).fetchone()
+        return row[0] if row else None
+
+    def save_summary(self, repo: str, email: str, day: str, fingerprint: str, summary: str) -> None:
+        """Store (or replace) the summary for a bucket."""
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO day_summaries (repo, email, day, fingerprint, summary) VALUES (?, ?, ?, ?, ?)",
+                (repo, email, day, fingerprint, summary),
+            )
@@ -0,0 +1,57 @@
+"""Manifest cache for repository discovery, revalidated by directory mtimes."""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import Callable
+
+from gitgossip.core.constants import CACHE_DIR
+from gitgossip.core.storage.json_entries import read_entries, write_entries
+
+
+class DiscoveryCache:
+    """Remembers which repositories a discovery walk found and which directories it inspected.
+
+    An entry is reused only if every inspected directory still has the mtime
+    recorded at scan time (adding, removing or renaming a child changes its
+    parent's mtime) and every cached repository still looks like one. A single
+    ``stat`` per directory replaces a full walk. Any read or write problem is
+    treated as a cache miss; the cache is never required for correctness.
+    """
+
+    DEFAULT_PATH = CACHE_DIR / "discovery.json"
+    VERSION = 2
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the cache backed by a JSON file (default: ``~/.gitgossip/cache/discovery.json``)."""
+        self._path = path or self.DEFAULT_PATH
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def load(self, key: str, is_repository: Callable[[str], bool]) -> list[Path] | None:
+        """Return cached repositories for ``key`` if the manifest is still valid, else ``None``."""
+        entry = read_entries(self._path, self.VERSION).get(key)
+        if not isinstance(entry, dict):
+            return None
+        dirs: dict[str, int] = entry.get("dirs", {})
+        repos: list[str] = entry.get("repos", [])
+        for directory, mtime_ns in dirs.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime_ns:
+                    return None
+            except OSError:
+                return None
+        if not all(is_repository(repo) for repo in repos):
+            return None
+        self._logger.debug("Discovery cache hit for %s (%d repositories)", key, len(repos))
+        return [Path(repo) for repo in repos]
+
+    def store(self, key: str, repos: list[Path], dir_mtimes: dict[str, int]) -> None:
+        """Record a completed walk for ``key``."""
+        entries = read_entries(self._path, self.VERSION)
+        entries[key] = {"dirs": dir_mtimes, "repos": [str(repo) for repo in repos]}
+        try:
+            write_entries(self._path, self.VERSION, entries)
+        except OSError as e:
+            self._logger.debug("Could not write discovery cache %s: %s", self._path, e)
@@ -0,0 +1,35 @@
+"""Versioned JSON entry files shared by the on-disk caches."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def read_entries(path: Path, version: int) -> dict[str, Any]:
+    """Load the entries stored at ``path``, or an empty mapping when the file is missing, corrupt or outdated."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != version:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def write_entries(path: Path, version: int, entries: dict[str, Any]) -> None:
+    """Atomically replace the file at ``path`` with ``entries`` under ``version``.
+
+    The file is written to a per-process temporary name and renamed into place,
+    so concurrent writers never leave a partial file behind (the last one wins).
+
+    Raises:
+        OSError: If the directory or file cannot be written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"version": version, "entries": entries}), encoding="utf-8")
+    os.replace(tmp, path)
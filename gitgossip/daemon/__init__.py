@@ -0,0 +1 @@
+"""Long-running ``gitgossip serve`` daemon and the thin client the CLI uses to reach it."""
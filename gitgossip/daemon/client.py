@@ -0,0 +1,133 @@
+"""Client side of the daemon protocol — deliberately free of heavy imports.
+
+The CLI calls `run_in_daemon` before importing any command module. When a
+daemon answers, the command runs there (warm imports, config and HTTP pools)
+and its output is replayed locally; otherwise the caller runs it in-process.
+
+Protocol: one JSON request line ``{"command": ..., "args": {...}, "terminal":
+{"stdout": <isatty>, "stderr": <isatty>, "width": <columns>}}`` followed by
+JSON frames ``{"stream": "stdout"|"stderr", "data": ...}`` and a final
+``{"exit": <code>}``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+from gitgossip.core.constants import DAEMON_SOCKET
+
+SOCKET_ENV = "GITGOSSIP_SOCKET"
+DISABLE_ENV = "GITGOSSIP_NO_DAEMON"
+
+# Arguments holding filesystem paths; resolved here because the daemon has its own working directory.
+_PATH_ARGS = ("path", "hook_file", "stats_json")
+_CONNECT_TIMEOUT = 0.5
+
+# Commands taking a ``git_env`` argument: the caller's GIT_* variables, applied to every git call they make.
+_GIT_ENV_COMMANDS = ("commit-hook",)
+
+# Variables that point git at another repository, work tree or index (set by hooks, ``git commit -a``, worktrees).
+# While any is set, commands that cannot honour them run in-process, where git inherits them directly.
+_REPOSITORY_ENV = (
+    "GIT_DIR",
+    "GIT_WORK_TREE",
+    "GIT_INDEX_FILE",
+    "GIT_COMMON_DIR",
+    "GIT_OBJECT_DIRECTORY",
+    "GIT_ALTERNATE_OBJECT_DIRECTORIES",
+    "GIT_NAMESPACE",
+)
+
+
+def resolve_socket_path() -> Path:
+    """Return the daemon socket path (``$GITGOSSIP_SOCKET`` or ``~/.gitgossip/gitgossip.sock``)."""
+    override = os.environ.get(SOCKET_ENV)
+    return Path(override).expanduser() if override else DAEMON_SOCKET
+
+
+def run_in_daemon(
+    command: str, args: dict[str, Any], path: Path | None = None, timeout: float | None = None
+) -> int | None:
+    """Run ``command`` on the daemon and return its exit code, or None when it should run in-process.
+
+    None means no daemon answered (not running, stale socket, disabled via
+    ``GITGOSSIP_NO_DAEMON``), it went away or missed ``timeout`` seconds
+    before producing any output, or the caller's git environment cannot be
+    honoured there, so running the command locally is still safe. The
+    daemon has its own environment: commands in ``_GIT_ENV_COMMANDS`` get the
+    caller's ``GIT_*`` variables as ``git_env``, and every other command stays
+    in-process while a variable from ``_REPOSITORY_ENV`` is set.
+    """
+    if os.environ.get(DISABLE_ENV):
+        return None
+    args = _absolute_paths(args)
+    if command in _GIT_ENV_COMMANDS:
+        args["git_env"] = {name: value for name, value in os.environ.items() if name.startswith("GIT_")}
+    elif any(name in os.environ for name in _REPOSITORY_ENV):
+        return None
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    except (AttributeError, OSError):  # no AF_UNIX on this platform
+        return None
+
+    with sock:
+        try:
+            sock.settimeout(_CONNECT_TIMEOUT)
+            sock.connect(str(path or resolve_socket_path()))
+            sock.settimeout(timeout)
+            request = {"command": command, "args": args, "terminal": _terminal()}
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        except OSError:
+            return None
+        return _replay(sock)
+
+
+def _replay(sock: socket.socket) -> int | None:
+    """Copy the daemon's output frames to this process's stdout/stderr and return the exit code.
+
+    A read timeout counts as the daemon going away (`socket.timeout` is an `OSError`).
+    """
+    wrote = False
+    try:
+        for line in sock.makefile("r", encoding="utf-8"):
+            frame = json.loads(line)
+            if "exit" in frame:
+                return int(frame["exit"])
+            stream = sys.stderr if frame.get("stream") == "stderr" else sys.stdout
+            stream.write(frame.get("data", ""))
+            stream.flush()
+            wrote = True
+    except (OSError, ValueError):
+        pass
+    if not wrote:
+        return None
+    sys.stderr.write("gitgossip: lost connection to the daemon\n")
+    return 1
+
+
+def _terminal() -> dict[str, Any]:
+    """Describe this process's stdout and stderr so the daemon can match colour, live displays and width."""
+
+    def isatty(stream: Any) -> bool:
+        try:
+            return bool(stream.isatty())
+        except (AttributeError, ValueError):
+            return False
+
+    return {"stdout": isatty(sys.stdout), "stderr": isatty(sys.stderr), "width": shutil.get_terminal_size().columns}
+
+
+def _absolute_paths(args: dict[str, Any]) -> dict[str, Any]:
+    """Return ``args`` with relative path arguments made absolute against the current directory."""
+    resolved = dict(args)
+    for key in _PATH_ARGS:
+        value = resolved.get(key)
+        if isinstance(value, str) and value:
+            resolved[key] = str(Path(value).expanduser().absolute())
+    return resolved
@@ -0,0 +1,260 @@
+"""Unix socket server that runs GitGossip commands inside one warm process."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import threading
+from pathlib import Path
+from typing import IO, Any, Callable, cast
+
+import click
+from rich.console import Console
+
+from gitgossip.commands.commit import commit_cmd
+from gitgossip.commands.commit_hook import hook_cmd
+from gitgossip.commands.digest import digest_cmd
+from gitgossip.commands.list_authors import list_all_authors
+from gitgossip.commands.summarize import summarize_cmd
+from gitgossip.commands.summarize_mr import summarize_mr_cmd
+from gitgossip.core.factories.llm_analyzer_factory import LLMAnalyzerFactory
+
+# Commands the daemon runs; interactive ones (init, prompt-driven commit) always stay in the caller's terminal.
+COMMANDS: dict[str, Callable[..., None]] = {
+    "summarize": summarize_cmd,
+    "summarize-mr": summarize_mr_cmd,
+    "list-authors": list_all_authors,
+    "digest": digest_cmd,
+    "commit": commit_cmd,
+    "commit-hook": hook_cmd,
+}
+
+_local = threading.local()
+
+
+class _OutputRouter(io.TextIOBase):
+    """Replacement for ``sys.stdout``/``sys.stderr`` that sends a request thread's output to its client.
+
+    Commands print through module-level Rich consoles and ``typer.echo``, which
+    all resolve ``sys.stdout`` at write time, so swapping the stream once lets
+    concurrent requests each see only their own output. Threads not serving a
+    request (the accept loop, the daemon's own logging) write to the original stream.
+    """
+
+    encoding = "utf-8"
+
+    def __init__(self, name: str, fallback: IO[str] | None) -> None:
+        super().__init__()
+        self._name = name
+        self.fallback = fallback
+
+    def write(self, text: str) -> int:
+        sink: Callable[[str, str], None] | None = getattr(_local, "sink", None)
+        if sink is not None:
+            sink(self._name, text)
+        elif self.fallback is not None:
+            self.fallback.write(text)
+        return len(text)
+
+    def flush(self) -> None:
+        if getattr(_local, "sink", None) is None and self.fallback is not None:
+            self.fallback.flush()
+
+    def isatty(self) -> bool:
+        return False
+
+    def writable(self) -> bool:
+        return True
+
+
+class _ClientStream(io.TextIOBase):
+    """One client's stdout or stderr, writable from any thread (Rich refreshes live displays from its own)."""
+
+    encoding = "utf-8"
+
+    def __init__(self, name: str, sink: Callable[[str, str], None], tty: bool) -> None:
+        super().__init__()
+        self._name = name
+        self._sink = sink
+        self._tty = tty
+
+    def write(self, text: str) -> int:
+        self._sink(self._name, text)
+        return len(text)
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def writable(self) -> bool:
+        return True
+
+
+class _ConsoleRouter:
+    """Replacement for a command module's Rich console that forwards to the current request's own console.
+
+    Module-level consoles detect colour and terminal support once, at import,
+    from the daemon's own stdio, and live displays (``console.status``) started
+    on one shared console by concurrent requests would interleave. Each request
+    instead gets consoles matching its client's terminal (see `_client_consoles`).
+    """
+
+    def __init__(self, name: str, fallback: Console) -> None:
+        self._name = name
+        self.fallback = fallback
+
+    def __getattr__(self, attr: str) -> Any:
+        consoles: dict[str, Console] | None = getattr(_local, "consoles", None)
+        return getattr(consoles[self._name] if consoles else self.fallback, attr)
+
+
+def _client_consoles(sink: Callable[[str, str], None], terminal: dict[str, Any]) -> dict[str, Console]:
+    """Build a request's stdout and stderr consoles: colour and live displays only where the client has a terminal."""
+    width = terminal.get("width")
+    consoles = {}
+    for name in ("stdout", "stderr"):
+        tty = bool(terminal.get(name))
+        consoles[name] = Console(
+            file=cast(IO[str], _ClientStream(name, sink, tty)),
+            force_terminal=tty,
+            width=width if isinstance(width, int) and width > 0 else None,
+        )
+    return consoles
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Runs one command per connection and streams its output back as JSON frames."""
+
+    def handle(self) -> None:
+        lock = threading.Lock()
+
+        def send(frame: dict[str, Any]) -> None:
+            data = json.dumps(frame).encode("utf-8") + b"\n"
+            with lock:
+                try:
+                    self.wfile.write(data)
+                    self.wfile.flush()
+                except OSError:
+                    pass  # client went away; keep running so side effects complete consistently
+
+        try:
+            request = json.loads(self.rfile.readline())
+            command, args = request["command"], dict(request.get("args") or {})
+            terminal = dict(request.get("terminal") or {})
+        except (ValueError, KeyError, TypeError):
+            send({"stream": "stderr", "data": "gitgossip: malformed daemon request\n"})
+            send({"exit": 2})
+            return
+
+        def sink(stream: str, text: str) -> None:
+            send({"stream": stream, "data": text})
+
+        _local.sink = sink
+        _local.consoles = _client_consoles(sink, terminal)
+        try:
+            send({"exit": _run(command, args)})
+        finally:
+            _local.sink = None
+            _local.consoles = None
+
+
+def _run(command: str, args: dict[str, Any]) -> int:
+    """Run one command in this thread and map its outcome to a process exit code."""
+    if command == "ping":
+        return 0
+    func = COMMANDS.get(command)
+    if func is None or (command == "commit" and not (args.get("print_only") or args.get("hook_file"))):
+        sys.stderr.write(f"gitgossip: the daemon does not run '{command}' interactively\n")
+        return 2
+    return _exit_code(command, func, args)
+
+
+def _exit_code(command: str, func: Callable[..., None], args: dict[str, Any]) -> int:
+    """Call ``func(**args)`` and map how it ended to a process exit code."""
+    try:
+        func(**args)
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except click.exceptions.Abort:
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception as e:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+        # One failing request must not take the daemon down.
+        logging.getLogger("gitgossip.daemon").debug("Command %s failed", command, exc_info=True)
+        sys.stderr.write(f"gitgossip: {command} failed: {e}\n")
+        return 1
+    return 0
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server; each connection is one command run.
+
+    Chat clients are shared across requests (see
+    `LLMAnalyzerFactory.keep_clients_warm`) so their HTTP connections stay
+    open between commands. The socket is only accessible by the current user.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Path) -> None:
+        """Bind ``path``, replacing a stale socket left by a daemon that did not exit cleanly.
+
+        Raises:
+            OSError: If another daemon is already listening on ``path``.
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists() or path.is_symlink():
+            if _is_listening(path):
+                raise OSError(f"A gitgossip daemon is already listening on {path}")
+            path.unlink()
+        LLMAnalyzerFactory.keep_clients_warm()
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """Serve until `shutdown`, routing each request's stdout/stderr and Rich consoles to its client."""
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout = _OutputRouter("stdout", stdout)
+        sys.stderr = _OutputRouter("stderr", stderr)
+        consoles = [
+            (module, name, value)
+            for module in {sys.modules[func.__module__] for func in COMMANDS.values()}
+            for name, value in vars(module).items()
+            if isinstance(value, Console)
+        ]
+        for module, name, value in consoles:
+            setattr(module, name, _ConsoleRouter("stderr" if value.stderr else "stdout", value))
+        try:
+            super().serve_forever(poll_interval)
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+            for module, name, value in consoles:
+                setattr(module, name, value)
+
+    def server_close(self) -> None:
+        """Close the listening socket and remove its file."""
+        super().server_close()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
+def _is_listening(path: Path) -> bool:
+    """Return True when something accepts connections on the socket at ``path``."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.settimeout(0.5)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            return False
+    return True
@@ -0,0 +1 @@
+"""Test and benchmark helpers shipped with GitGossip (fake LLM endpoints, synthetic fixtures)."""
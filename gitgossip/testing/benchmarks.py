@@ -0,0 +1,342 @@
+"""Benchmark suite for GitGossip's git-heavy hot paths, run against synthetic repositories.
+
+Each benchmark times one code path against repositories from
+`gitgossip.testing.synthetic_repo`, using `MockLLMAnalyzer` where an analyzer
+is needed so that no model is involved. Results are written as JSON and can be
+compared with a stored baseline; a benchmark whose median slows down by more
+than ``--tolerance`` counts as a regression, and any regression makes the run
+exit with status 1:
+
+    python -m gitgossip.testing.benchmarks --out bench.json --baseline .benchmarks/baseline.json
+    python -m gitgossip.testing.benchmarks --save-baseline .benchmarks/baseline.json
+
+Generated repositories are cached under ``--workdir`` by spec, so only the
+first run pays for generation. ``--scale`` shrinks or grows every fixture.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+import typer
+from pydantic import BaseModel, Field
+
+from gitgossip.testing.synthetic_repo import SyntheticRepoSpec, generate_repo, generate_tree
+
+DEFAULT_WORKDIR = Path(".benchmarks") / "repos"
+DEFAULT_TOLERANCE = 0.25
+
+
+class BenchmarkResult(BaseModel):
+    """Timings for one benchmark (seconds per round)."""
+
+    name: str
+    rounds: int
+    min_s: float
+    median_s: float
+    mean_s: float
+    max_s: float
+    params: dict[str, Any] = Field(default_factory=dict, description="Fixture sizes the timings were taken with")
+
+
+class BenchmarkRun(BaseModel):
+    """One execution of the suite, with enough environment detail to judge comparability."""
+
+    created_at: datetime
+    python: str
+    platform: str
+    git: str
+    scale: float
+    results: list[BenchmarkResult]
+
+
+class Regression(NamedTuple):
+    """A benchmark whose median got slower than the baseline allows."""
+
+    name: str
+    baseline_s: float
+    current_s: float
+
+    @property
+    def ratio(self) -> float:
+        """Current median divided by the baseline median."""
+        return self.current_s / self.baseline_s if self.baseline_s else float("inf")
+
+
+class _Benchmark(NamedTuple):
+    """A registered benchmark: ``setup(fixtures)`` returns the callable to time and its parameters."""
+
+    name: str
+    setup: Callable[[_Fixtures], tuple[Callable[[], object], dict[str, Any]]]
+
+
+class _Fixtures:
+    """Builds (or reuses) synthetic repositories under ``workdir``, sized by ``scale``."""
+
+    def __init__(self, workdir: Path, scale: float) -> None:
+        self.workdir = workdir
+        self.scale = scale
+
+    def size(self, value: int) -> int:
+        """Scale a fixture size, keeping it at least 1."""
+        return max(1, round(value * self.scale))
+
+    def repo(self, **fields: Any) -> Path:
+        """Return a repository generated from ``fields`` (cached by spec)."""
+        spec = SyntheticRepoSpec(**fields)
+        return self.__cached("repo", spec, lambda path: generate_repo(path, spec))
+
+    def tree(self, repos: int, depth: int) -> Path:
+        """Return the root of a nested tree holding ``repos`` small repositories (cached by shape)."""
+        spec = SyntheticRepoSpec(commits=3, files=3, file_lines=10)
+        return self.__cached(f"tree-{repos}-{depth}", spec, lambda path: generate_tree(path, repos, depth, spec=spec))
+
+    def __cached(self, kind: str, spec: SyntheticRepoSpec, build: Callable[[Path], object]) -> Path:
+        """Build into a temporary directory and rename it into place, so an interrupted build is never reused."""
+        digest = hashlib.sha1(f"{kind}|{spec.model_dump_json()}".encode()).hexdigest()[:12]
+        path = self.workdir / f"{kind}-{digest}"
+        if path.exists():
+            return path
+        partial = path.with_name(f"{path.name}.partial")
+        shutil.rmtree(partial, ignore_errors=True)
+        build(partial)
+        partial.rename(path)
+        return path
+
+
+_REGISTRY: list[_Benchmark] = []
+
+
+def _benchmark(name: str) -> Callable[[Callable[[_Fixtures], Any]], Callable[[_Fixtures], Any]]:
+    """Register a benchmark setup function under ``name``."""
+
+    def register(setup: Callable[[_Fixtures], Any]) -> Callable[[_Fixtures], Any]:
+        _REGISTRY.append(_Benchmark(name, setup))
+        return setup
+
+    return register
+
+
+@_benchmark("commit_parser.get_commits")
+def _bench_get_commits(fixtures: _Fixtures) -> tuple[Callable[[], object], dict[str, Any]]:
+    """Parse the latest commits (stats plus structured per-file diffs) of a long linear history."""
+    from gitgossip.core.parsers.commit_parser import CommitParser
+    from gitgossip.core.providers.git_repo_provider import GitRepoProvider
+
+    commits, limit = fixtures.size(2000), fixtures.size(100)
+    repo = fixtures.repo(commits=commits)
+    parser = CommitParser(GitRepoProvider(repo))
+    return lambda: parser.get_commits(limit=limit), {"commits": commits, "limit": limit}
+
+
+@_benchmark("commit_parser.get_commits_large_diffs")
+def _bench_large_diffs(fixtures: _Fixtures) -> tuple[Callable[[], object], dict[str, Any]]:
+    """Parse commits whose large per-file diffs make hunk splitting and summarizing dominate."""
+    from gitgossip.core.parsers.commit_parser import CommitParser
+    from gitgossip.core.providers.git_repo_provider import GitRepoProvider
+
+    commits = fixtures.size(200)
+    repo = fixtures.repo(commits=commits, files_per_commit=10, lines_per_change=20)
+    parser = CommitParser(GitRepoProvider(repo))
+    return lambda: parser.get_commits(limit=commits), {"commits": commits}
+
+
+@_benchmark("diff_spool.spill_and_chunk")
+def _bench_spool_chunks(fixtures: _Fixtures) -> tuple[Callable[[], object], dict[str, Any]]:
+    """Spill a large diff to disk, then count and slice it into size-bounded chunks as the MR summary does."""
+    from gitgossip.utils.diff_spool import DiffSpool
+
+    commits = fixtures.size(200)
+    repo = fixtures.repo(commits=commits, files_per_commit=10, lines_per_change=20)
+    diff = _git_output(repo, "log", "-p", "--format=", f"-{commits}").encode("utf-8")
+    chunk_size = 8000  # SummarizerService default
+
+    def chunk() -> int:
+        with DiffSpool(max_memory=0) as spool:
+            spool.write(diff)
+            total = spool.count_chunks(chunk_size)
+            for view in spool.chunks(chunk_size):
+                with view:
+                    str(view, "utf-8", "replace")
+            return total
+
+    return chunk, {"diff_bytes": len(diff), "chunk_size": chunk_size}
+
+
+@_benchmark("repo_discovery.find_repositories")
+def _bench_discovery(fixtures: _Fixtures) -> tuple[Callable[[], object], dict[str, Any]]:
+    """Walk a nested tree of repositories (uncached)."""
+    from gitgossip.core.services.repo_discovery_service import RepoDiscoveryService
+
+    repos = fixtures.size(60)
+    root = fixtures.tree(repos=repos, depth=3)
+    service = RepoDiscoveryService(root, recursive=True)
+    return service.find_repositories, {"repos": repos, "depth": 3}
+
+
+@_benchmark("git_repo_provider.write_diff_between_branches")
+def _bench_branch_diff(fixtures: _Fixtures) -> tuple[Callable[[], object], dict[str, Any]]:
+    """Spool a feature branch's diff against main, commit by commit."""
+    from gitgossip.core.providers.git_repo_provider import GitRepoProvider
+    from gitgossip.utils.diff_spool import DiffSpool
+
+    feature_commits = fixtures.size(50)
+    repo = fixtures.repo(commits=fixtures.size(500), branch_shape="feature", feature_commits=feature_commits)
+    provider = GitRepoProvider(repo)
+
+    def spool_diff() -> int:
+        with DiffSpool() as spool:
+            provider.write_diff_between_branches("main", spool)
+            return spool.size
+
+    return spool_diff, {"feature_commits": feature_commits}
+
+
+@_benchmark("summarizer.summarize_repository")
+def _bench_summarize(fixtures: _Fixtures) -> tuple[Callable[[], object], dict[str, Any]]:
+    """End to end: read and parse commits from a history with merges and summarize them with the mock analyzer."""
+    from gitgossip.core.llm.mock_llm_analyzer import MockLLMAnalyzer
+    from gitgossip.core.parsers.commit_parser import CommitParser
+    from gitgossip.core.providers.git_repo_provider import GitRepoProvider
+    from gitgossip.core.services.summarizer_service import SummarizerService
+
+    commits, limit = fixtures.size(1000), fixtures.size(100)
+    repo = fixtures.repo(commits=commits, branch_shape="merges")
+    service = SummarizerService(CommitParser(GitRepoProvider(repo)), MockLLMAnalyzer())
+    return lambda: service.summarize_repository(limit=limit), {"commits": commits, "limit": limit}
+
+
+def benchmark_names() -> list[str]:
+    """Return the names of all registered benchmarks, in run order."""
+    return [bench.name for bench in _REGISTRY]
+
+
+def run_benchmarks(
+    workdir: Path = DEFAULT_WORKDIR,
+    rounds: int = 5,
+    scale: float = 1.0,
+    only: str | None = None,
+) -> BenchmarkRun:
+    """Run every benchmark whose name contains ``only`` (all when None) and return the timings.
+
+    Each benchmark gets one untimed warm-up round, then ``rounds`` timed ones.
+    """
+    fixtures = _Fixtures(workdir, scale)
+    results: list[BenchmarkResult] = []
+    for bench in _REGISTRY:
+        if only and only not in bench.name:
+            continue
+        func, params = bench.setup(fixtures)
+        func()
+        timings: list[float] = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        results.append(
+            BenchmarkResult(
+                name=bench.name,
+                rounds=rounds,
+                min_s=min(timings),
+                median_s=statistics.median(timings),
+                mean_s=statistics.fmean(timings),
+                max_s=max(timings),
+                params=params,
+            )
+        )
+    return BenchmarkRun(
+        created_at=datetime.now(timezone.utc),
+        python=platform.python_version(),
+        platform=platform.platform(),
+        git=_git_output(Path.cwd(), "--version").strip(),
+        scale=scale,
+        results=results,
+    )
+
+
+def compare(current: BenchmarkRun, baseline: BenchmarkRun, tolerance: float = DEFAULT_TOLERANCE) -> list[Regression]:
+    """Return benchmarks whose median exceeds the baseline median by more than ``tolerance`` (0.25 = 25%).
+
+    Benchmarks missing from the baseline, or measured with different fixture
+    parameters, are not compared.
+    """
+    previous = {result.name: result for result in baseline.results}
+    regressions: list[Regression] = []
+    for result in current.results:
+        before = previous.get(result.name)
+        if before is None or before.params != result.params:
+            continue
+        if result.median_s > before.median_s * (1 + tolerance):
+            regressions.append(Regression(result.name, before.median_s, result.median_s))
+    return regressions
+
+
+def load_run(path: Path) -> BenchmarkRun:
+    """Read a results or baseline file written by this module."""
+    return BenchmarkRun.model_validate_json(path.read_text(encoding="utf-8"))
+
+
+def save_run(run: BenchmarkRun, path: Path) -> None:
+    """Write ``run`` as indented JSON, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(run.model_dump(mode="json"), indent=2) + "\n", encoding="utf-8")
+
+
+def _git_output(path: Path, *args: str) -> str:
+    """Return the stdout of a git command run in ``path``."""
+    return subprocess.run(["git", "-C", str(path), *args], capture_output=True, text=True, check=True).stdout
+
+
+def main(
+    out: Path | None = typer.Option(None, "--out", help="Write this run's results as JSON to the given file."),
+    baseline: Path | None = typer.Option(None, "--baseline", help="Compare against this results file."),
+    save_baseline: Path | None = typer.Option(None, "--save-baseline", help="Store this run as the new baseline."),
+    tolerance: float = typer.Option(DEFAULT_TOLERANCE, "--tolerance", help="Allowed median slowdown (0.25 = 25%)."),
+    rounds: int = typer.Option(5, "--rounds", min=1, help="Timed rounds per benchmark."),
+    scale: float = typer.Option(1.0, "--scale", min=0.01, help="Multiply every fixture size by this factor."),
+    only: str | None = typer.Option(None, "--only", help="Run only benchmarks whose name contains this text."),
+    workdir: Path = typer.Option(DEFAULT_WORKDIR, "--workdir", help="Where generated repositories are cached."),
+) -> None:
+    """Run the benchmark suite, print a summary and fail on regressions against a baseline."""
+    run = run_benchmarks(workdir=workdir, rounds=rounds, scale=scale, only=only)
+    previous = load_run(baseline) if baseline is not None and baseline.exists() else None
+    before = {r.name: r.median_s for r in previous.results} if previous else {}
+    for result in run.results:
+        line = f"{result.name:<48} median {result.median_s * 1000:9.2f} ms  min {result.min_s * 1000:9.2f} ms"
+        if result.name in before:
+            line += f"  baseline {before[result.name] * 1000:9.2f} ms"
+        typer.echo(line)
+
+    if out is not None:
+        save_run(run, out)
+    if save_baseline is not None:
+        save_run(run, save_baseline)
+        typer.echo(f"Baseline saved to {save_baseline}")
+    if baseline is not None and previous is None:
+        typer.echo(f"No baseline at {baseline}; nothing to compare.", err=True)
+    if previous is None:
+        return
+
+    regressions = compare(run, previous, tolerance)
+    for regression in regressions:
+        typer.echo(
+            f"REGRESSION {regression.name}: {regression.baseline_s * 1000:.2f} ms -> "
+            f"{regression.current_s * 1000:.2f} ms ({regression.ratio:.2f}x)",
+            err=True,
+        )
+    if regressions:
+        raise typer.Exit(code=1)
+    typer.echo(f"No regressions beyond {tolerance:.0%} of {baseline}.")
+
+
+if __name__ == "__main__":
+    typer.run(main)
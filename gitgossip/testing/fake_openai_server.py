@@ -0,0 +1,315 @@
+"""Local stand-in for an OpenAI-compatible ``/v1/chat/completions`` endpoint.
+
+Point ``llm.base_url`` (or ``OpenAIChatClient(base_url=...)``) at this server to
+exercise the full client, retry and concurrency stack without a real model:
+
+    python -m gitgossip.testing.fake_openai_server --port 8000 --latency-ms 800 --tokens-per-second 40
+
+Responses are deterministic for a given prompt and seed, and are shaped so
+that every analyzer operation (including the ``Title:`` parsing of MR
+summaries) gets something plausible back.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Literal
+
+import typer
+from pydantic import BaseModel, Field
+
+_WORDS = (
+    "refactor update handler parser config cache client service module request response retry "
+    "timeout summary diff commit branch review logging error path test fixture option command"
+).split()
+
+
+class FakeServerSettings(BaseModel):
+    """Behavior knobs for `FakeOpenAIServer`."""
+
+    latency_distribution: Literal["fixed", "uniform", "lognormal"] = Field(
+        default="fixed", description="How the pre-response latency is sampled"
+    )
+    latency_ms: float = Field(default=0.0, description="Fixed latency, uniform centre, or lognormal median (ms)")
+    latency_jitter_ms: float = Field(default=0.0, description="Half-width of the uniform distribution (ms)")
+    latency_sigma: float = Field(default=0.5, description="Sigma of the lognormal distribution")
+    tokens_per_second: float | None = Field(
+        default=None, description="Generation speed, streamed or not; None answers instantly"
+    )
+    completion_words: int = Field(default=24, description="Approximate completion length in words")
+    error_rate: float = Field(default=0.0, description="Fraction of requests answered with HTTP 500")
+    rate_limit_rate: float = Field(default=0.0, description="Fraction of requests answered with HTTP 429")
+    response: str | None = Field(default=None, description="Fixed completion text instead of generated text")
+    seed: int = Field(default=0, description="Seed for latency and failure sampling")
+    prefix_cache: bool = Field(default=True, description="Report prompt-prefix reuse as cached_tokens")
+
+
+class FakeOpenAIServer:
+    """Threaded HTTP server speaking enough of the OpenAI chat API for load tests.
+
+    Use as a context manager (or call `start`/`stop`); ``port=0`` picks a free port.
+    """
+
+    def __init__(self, settings: FakeServerSettings | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Create the server bound to ``host:port`` without starting it."""
+        self.settings = settings or FakeServerSettings()
+        self.request_count = 0
+        self.__rng = random.Random(self.settings.seed)
+        self.__lock = threading.Lock()
+        self.__last_prompt = ""
+        self.__httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.__httpd.daemon_threads = True
+        self.__thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI-style base URL, e.g. ``http://127.0.0.1:54321/v1``."""
+        host, port = self.__httpd.server_address[:2]
+        return f"http://{host!s}:{port}/v1"
+
+    def start(self) -> FakeOpenAIServer:
+        """Serve requests on a background thread."""
+        self.__thread = threading.Thread(
+            target=self.__httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="fake-openai", daemon=True
+        )
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self.__httpd.shutdown()
+        self.__httpd.server_close()
+        if self.__thread is not None:
+            self.__thread.join(timeout=5)
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted."""
+        self.__httpd.serve_forever()
+
+    def __enter__(self) -> FakeOpenAIServer:
+        """Start the server for the duration of a ``with`` block."""
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the server when the ``with`` block exits."""
+        self.stop()
+
+    def next_outcome(self) -> tuple[float, int | None]:
+        """Sample the latency (seconds) and an optional forced HTTP error status for one request."""
+        settings = self.settings
+        with self.__lock:
+            self.request_count += 1
+            roll = self.__rng.random()
+            if settings.latency_distribution == "uniform":
+                jitter = self.__rng.uniform(-settings.latency_jitter_ms, settings.latency_jitter_ms)
+                latency_ms = settings.latency_ms + jitter
+            elif settings.latency_distribution == "lognormal" and settings.latency_ms > 0:
+                latency_ms = self.__rng.lognormvariate(0.0, settings.latency_sigma) * settings.latency_ms
+            else:
+                latency_ms = settings.latency_ms
+        status = None
+        if roll < settings.rate_limit_rate:
+            status = 429
+        elif roll < settings.rate_limit_rate + settings.error_rate:
+            status = 500
+        return max(latency_ms, 0.0) / 1000, status
+
+    def cached_prefix_tokens(self, messages: list[dict[str, Any]]) -> int:
+        """Simulate a provider prefix cache: tokens shared with the previous request's prompt."""
+        if not self.settings.prefix_cache:
+            return 0
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        with self.__lock:
+            previous, self.__last_prompt = self.__last_prompt, prompt
+        shared = 0
+        for ours, theirs in zip(prompt, previous):
+            if ours != theirs:
+                break
+            shared += 1
+        return shared // 4
+
+    def completion_for(self, messages: list[dict[str, Any]]) -> str:
+        """Return the deterministic completion text for a message list."""
+        if self.settings.response is not None:
+            return self.settings.response
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        digest = hashlib.sha256(f"{self.settings.seed}:{prompt}".encode("utf-8")).hexdigest()
+        rng = random.Random(digest)
+        words = [rng.choice(_WORDS) for _ in range(max(self.settings.completion_words, 3))]
+        bullets = [" ".join(words[i : i + 6]) for i in range(0, len(words), 6)]
+        return f"Title: Update {digest[:8]}\nDescription:\n" + "\n".join(f"- {b}" for b in bullets)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves the OpenAI-compatible endpoints of the `FakeOpenAIServer` bound by `_make_handler`."""
+
+    fake: FakeOpenAIServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        """Silence per-request logging."""
+
+    def do_GET(self) -> None:  # noqa: N802  # pylint: disable=invalid-name
+        """List a single fake model."""
+        if self.path.rstrip("/").endswith("/models"):
+            self._send_json(200, {"object": "list", "data": [{"id": "fake-model", "object": "model"}]})
+            return
+        self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self) -> None:  # noqa: N802  # pylint: disable=invalid-name
+        """Route by path: chat completions are answered, a malformed body is a 400 and other paths a 404."""
+        # The body is always drained so a kept-alive connection stays in step with the client.
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError:
+            request = None
+        if not isinstance(request, dict):
+            self._send_json(400, {"error": {"message": "invalid JSON body", "type": "invalid_request_error"}})
+            return
+        self._chat_completions(request)
+
+    def _chat_completions(self, request: dict[str, Any]) -> None:
+        """Answer a chat completion after the sampled latency, unless a 429 or 500 is injected instead."""
+        latency, status = self.fake.next_outcome()
+        time.sleep(latency)
+        if status == 429:
+            self._send_json(429, {"error": {"message": "rate limited", "type": "rate_limit"}}, retry_after="0")
+            return
+        if status == 500:
+            self._send_json(500, {"error": {"message": "injected failure", "type": "server_error"}})
+            return
+
+        messages = request.get("messages") or []
+        text = self.fake.completion_for(messages)
+        model = str(request.get("model") or "fake-model")
+        usage: dict[str, Any] = {
+            "prompt_tokens": sum(len(str(m.get("content", ""))) for m in messages) // 4,
+            "completion_tokens": len(text.split()),
+            "prompt_tokens_details": {"cached_tokens": self.fake.cached_prefix_tokens(messages)},
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+
+        if request.get("stream"):
+            include_usage = bool((request.get("stream_options") or {}).get("include_usage"))
+            self._stream(model, text, usage if include_usage else None)
+        else:
+            self._complete(model, text, usage)
+
+    def _complete(self, model: str, text: str, usage: dict[str, Any]) -> None:
+        """Send the whole completion as one ``chat.completion`` response."""
+        if self.fake.settings.tokens_per_second:
+            # A non-streaming reply arrives once the whole completion has been "generated".
+            time.sleep(usage["completion_tokens"] / self.fake.settings.tokens_per_second)
+        self._send_json(
+            200,
+            {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": usage,
+            },
+        )
+
+    def _stream(self, model: str, text: str, usage: dict[str, Any] | None) -> None:
+        """Emit the completion as server-sent events, one word per chunk."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        delay = 1 / self.fake.settings.tokens_per_second if self.fake.settings.tokens_per_second else 0.0
+        words = text.split(" ")
+        for index, word in enumerate(words):
+            if delay:
+                time.sleep(delay)
+            piece = word if index == 0 else f" {word}"
+            self._event(model, {"index": 0, "delta": {"content": piece}, "finish_reason": None})
+        self._event(model, {"index": 0, "delta": {}, "finish_reason": "stop"})
+        if usage is not None:
+            self._event(model, None, usage=usage)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+        self.close_connection = True
+
+    def _event(self, model: str, choice: dict[str, Any] | None, usage: dict[str, Any] | None = None) -> None:
+        """Write one ``chat.completion.chunk`` event."""
+        payload = {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [choice] if choice is not None else [],
+            "usage": usage,
+        }
+        self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def _send_json(self, status: int, payload: dict[str, Any], retry_after: str | None = None) -> None:
+        """Write a JSON response with a Content-Length so the connection can be kept alive."""
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if retry_after is not None:
+            self.send_header("Retry-After", retry_after)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _make_handler(server: FakeOpenAIServer) -> type[BaseHTTPRequestHandler]:
+    """Build a request handler class bound to ``server``."""
+
+    class _BoundHandler(_Handler):
+        fake = server
+
+    return _BoundHandler
+
+
+def main(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind."),
+    port: int = typer.Option(8000, "--port", help="Port to listen on."),
+    latency_distribution: str = typer.Option("fixed", "--latency-distribution", help="fixed | uniform | lognormal"),
+    latency_ms: float = typer.Option(0.0, "--latency-ms", help="Latency before responding (ms)."),
+    latency_jitter_ms: float = typer.Option(0.0, "--latency-jitter-ms", help="Uniform half-width (ms)."),
+    latency_sigma: float = typer.Option(0.5, "--latency-sigma", help="Lognormal sigma."),
+    tokens_per_second: float | None = typer.Option(None, "--tokens-per-second", help="Generation speed (tokens/s)."),
+    error_rate: float = typer.Option(0.0, "--error-rate", help="Fraction of HTTP 500 responses."),
+    rate_limit_rate: float = typer.Option(0.0, "--rate-limit-rate", help="Fraction of HTTP 429 responses."),
+    response: str | None = typer.Option(None, "--response", help="Fixed completion text."),
+    seed: int = typer.Option(0, "--seed", help="Random seed."),
+) -> None:
+    """Run the fake OpenAI-compatible server in the foreground."""
+    settings = FakeServerSettings.model_validate(
+        {
+            "latency_distribution": latency_distribution,
+            "latency_ms": latency_ms,
+            "latency_jitter_ms": latency_jitter_ms,
+            "latency_sigma": latency_sigma,
+            "tokens_per_second": tokens_per_second,
+            "error_rate": error_rate,
+            "rate_limit_rate": rate_limit_rate,
+            "response": response,
+            "seed": seed,
+        }
+    )
+    server = FakeOpenAIServer(settings, host=host, port=port)
+    typer.echo(f"Fake OpenAI server listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,266 @@
+"""Deterministic synthetic git repositories for benchmarks and tests.
+
+History is written with one ``git fast-import`` stream, so even thousands of
+commits take well under a second to create. Every input (file contents,
+authors, timestamps, the choice of touched files) derives from the spec and
+its seed, so the same spec always produces the same commit SHAs:
+
+    python -m gitgossip.testing.synthetic_repo /tmp/bench-repo --commits 2000 --branch-shape feature
+
+``generate_tree`` lays out many repositories in a nested directory tree
+(with skipped directories such as ``node_modules`` mixed in) to exercise
+repository discovery.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Literal
+
+import typer
+from pydantic import BaseModel, Field
+
+_EPOCH = 1_700_000_000
+_COMMIT_INTERVAL_S = 3600
+
+_EXTENSIONS = {"python": ".py", "go": ".go", "javascript": ".js", "typescript": ".ts", "java": ".java"}
+_FUNCTION_TEMPLATES = {
+    "python": ("def {name}(value):", "    return value + {n}"),
+    "go": ("func {name}(value int) int {{", "    return value + {n} }}"),
+    "javascript": ("function {name}(value) {{", "  return value + {n}; }}"),
+    "typescript": ("function {name}(value: number): number {{", "  return value + {n}; }}"),
+    "java": ("    public static int {name}(int value) {{", "        return value + {n}; }}"),
+}
+_WORDS = "cache client config handler parser request response retry service summary token worker".split()
+_VERBS = "add fix refactor update remove rename tune document".split()
+_SKIPPED_DIRS = ("node_modules", ".venv", "build")
+
+
+class SyntheticRepoSpec(BaseModel):
+    """Shape and size of a generated repository."""
+
+    commits: int = Field(default=200, ge=1, description="Commits on the main line (excluding merge side branches)")
+    files: int = Field(default=40, ge=1, description="Source files created by the initial commit")
+    file_lines: int = Field(default=200, ge=2, description="Lines per file in the initial commit")
+    files_per_commit: int = Field(default=3, ge=1, description="Files modified by each later commit")
+    lines_per_change: int = Field(default=8, ge=1, description="Lines rewritten in each modified file")
+    languages: list[Literal["python", "go", "javascript", "typescript", "java"]] = Field(
+        default_factory=lambda: ["python", "go", "javascript"], description="Languages files are spread across"
+    )
+    authors: int = Field(default=5, ge=1, description="Distinct commit authors")
+    branch_shape: Literal["linear", "feature", "merges"] = Field(
+        default="linear",
+        description="linear: one branch; feature: HEAD on a 'feature' branch off 'main'; "
+        "merges: side branches merged into 'main' every ``merge_every`` commits",
+    )
+    feature_commits: int = Field(default=20, ge=1, description="Commits on the feature branch ('feature' shape)")
+    merge_every: int = Field(default=10, ge=2, description="Main-line commits between merges ('merges' shape)")
+    seed: int = Field(default=0, description="Random seed")
+
+
+class _Builder:
+    """Accumulates a ``git fast-import`` stream and the current contents of every file."""
+
+    def __init__(self, spec: SyntheticRepoSpec) -> None:
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.chunks: list[bytes] = []
+        self.mark = 0
+        self.tick = 0
+        self.paths = [self.__path(i) for i in range(spec.files)]
+
+    def commit(
+        self,
+        branch: str,
+        files: dict[str, list[str]],
+        changed: list[str],
+        parent: int | None,
+        merge: int | None = None,
+    ) -> int:
+        """Emit one commit on ``branch`` writing ``changed`` paths from ``files``; return its mark."""
+        self.mark += 1
+        self.tick += 1
+        author = self.rng.randrange(self.spec.authors)
+        when = f"{_EPOCH + self.tick * _COMMIT_INTERVAL_S} +0000"
+        ident = f"Dev {author} <dev{author}@example.com> {when}"
+        if merge is not None:
+            message = f"Merge side branch into {branch}"
+        else:
+            scope = Path(changed[0]).parts[0] if changed else "repo"
+            message = f"{self.rng.choice(_VERBS)} {scope} {self.rng.choice(_WORDS)} ({self.tick})"
+        out = [f"commit refs/heads/{branch}", f"mark :{self.mark}", f"author {ident}", f"committer {ident}"]
+        self.chunks.append(("\n".join(out) + "\n").encode())
+        self.__data(message)
+        if parent is not None:
+            self.chunks.append(f"from :{parent}\n".encode())
+        if merge is not None:
+            self.chunks.append(f"merge :{merge}\n".encode())
+        for path in changed:
+            self.chunks.append(f"M 100644 inline {path}\n".encode())
+            self.__data("\n".join(files[path]) + "\n")
+        self.chunks.append(b"\n")
+        return self.mark
+
+    def initial_files(self) -> dict[str, list[str]]:
+        """Return the contents of every file in the initial commit."""
+        return {path: self.__lines(path, self.spec.file_lines) for path in self.paths}
+
+    def modify(self, files: dict[str, list[str]]) -> list[str]:
+        """Rewrite a few lines in ``files_per_commit`` random files (in place); return the touched paths."""
+        count = min(self.spec.files_per_commit, len(self.paths))
+        touched = sorted(self.rng.sample(self.paths, count))
+        for path in touched:
+            lines = files[path]
+            start = self.rng.randrange(max(1, len(lines) - self.spec.lines_per_change))
+            fresh = self.__lines(path, self.spec.lines_per_change)
+            lines[start : start + self.spec.lines_per_change] = fresh
+        return touched
+
+    def stream(self) -> bytes:
+        """Return the complete fast-import stream."""
+        return b"".join(self.chunks) + b"done\n"
+
+    def __path(self, index: int) -> str:
+        """Spread files across languages and a few package directories."""
+        language = self.spec.languages[index % len(self.spec.languages)]
+        return f"pkg{index % 4}/{language}/module_{index}{_EXTENSIONS[language]}"
+
+    def __lines(self, path: str, count: int) -> list[str]:
+        """Generate ``count`` lines of plausible source for ``path``'s language (functions every other line)."""
+        language = next(lang for lang, ext in _EXTENSIONS.items() if path.endswith(ext))
+        head, body = _FUNCTION_TEMPLATES[language]
+        lines: list[str] = []
+        while len(lines) < count:
+            name = f"{self.rng.choice(_WORDS)}_{self.rng.randrange(10_000)}"
+            lines.append(head.format(name=name))
+            lines.append(body.format(n=self.rng.randrange(1000)))
+        return lines[:count]
+
+    def __data(self, text: str) -> None:
+        """Emit a fast-import ``data`` block."""
+        payload = text.encode()
+        self.chunks.append(f"data {len(payload)}\n".encode() + payload + b"\n")
+
+
+def generate_repo(path: Path, spec: SyntheticRepoSpec | None = None) -> Path:
+    """Create a repository at ``path`` (which must not exist or be empty) following ``spec``; return ``path``.
+
+    Raises:
+        FileExistsError: If ``path`` is a non-empty directory.
+        subprocess.CalledProcessError: If git fails.
+    """
+    spec = spec or SyntheticRepoSpec()
+    if path.exists() and any(path.iterdir()):
+        raise FileExistsError(f"Refusing to generate into non-empty directory: {path}")
+    path.mkdir(parents=True, exist_ok=True)
+
+    builder = _Builder(spec)
+    files = builder.initial_files()
+    head = builder.commit("main", files, builder.paths, parent=None)
+    for index in range(1, spec.commits):
+        if spec.branch_shape == "merges" and index % spec.merge_every == 0:
+            # Two commits on a side branch, then a merge commit whose tree is the side branch's.
+            first = builder.modify(files)
+            side = builder.commit("side", files, first, parent=head)
+            second = builder.modify(files)
+            side = builder.commit("side", files, second, parent=side)
+            head = builder.commit("main", files, sorted(set(first) | set(second)), parent=head, merge=side)
+            continue
+        head = builder.commit("main", files, builder.modify(files), parent=head)
+
+    checkout = "main"
+    if spec.branch_shape == "feature":
+        checkout = "feature"
+        feature = head
+        for _ in range(spec.feature_commits):
+            feature = builder.commit("feature", files, builder.modify(files), parent=feature)
+
+    _git(path, "init", "--quiet")
+    _git(path, "fast-import", "--quiet", "--done", stdin=builder.stream())
+    _git(path, "symbolic-ref", "HEAD", f"refs/heads/{checkout}")
+    _git(path, "reset", "--quiet", "--hard")
+    return path
+
+
+def generate_tree(
+    root: Path,
+    repos: int = 20,
+    depth: int = 3,
+    fanout: int = 3,
+    spec: SyntheticRepoSpec | None = None,
+) -> list[Path]:
+    """Spread ``repos`` copies of one generated repository across a nested tree under ``root``.
+
+    Repositories sit at depths 1..``depth`` below ``root`` in directories with
+    up to ``fanout`` children each; every tree also gets skipped directories
+    (``node_modules``, ``.venv``, ``build``) containing a repository that
+    discovery should ignore. Returns the repository paths discovery should
+    find, sorted.
+    """
+    spec = spec or SyntheticRepoSpec(commits=5, files=5, file_lines=20)
+    template = generate_repo(root / ".template", spec)
+    rng = random.Random(spec.seed)
+    found: list[Path] = []
+    for index in range(repos):
+        level = 1 + index % depth
+        parts = [f"group{rng.randrange(fanout)}" for _ in range(level - 1)]
+        target = root.joinpath(*parts, f"repo{index}")
+        shutil.copytree(template, target, symlinks=True)
+        found.append(target)
+    for name in _SKIPPED_DIRS:
+        shutil.copytree(template, root / "group0" / name / "vendored", symlinks=True)
+    shutil.rmtree(template)
+    return sorted(found)
+
+
+def _git(path: Path, *args: str, stdin: bytes | None = None) -> None:
+    """Run git in ``path`` with global and system config ignored so the output does not depend on the machine."""
+    env = {**os.environ, "GIT_CONFIG_NOSYSTEM": "1", "GIT_CONFIG_GLOBAL": os.devnull}
+    subprocess.run(
+        ["git", "-c", "init.defaultBranch=main", "-C", str(path), *args],
+        input=stdin,
+        capture_output=True,
+        check=True,
+        env=env,
+    )
+
+
+def main(
+    path: Path = typer.Argument(..., help="Directory to create (must not exist or be empty)."),
+    commits: int = typer.Option(200, "--commits", help="Commits on the main line."),
+    files: int = typer.Option(40, "--files", help="Source files."),
+    file_lines: int = typer.Option(200, "--file-lines", help="Lines per file."),
+    files_per_commit: int = typer.Option(3, "--files-per-commit", help="Files modified per commit."),
+    languages: str = typer.Option("python,go,javascript", "--languages", help="Comma-separated languages."),
+    authors: int = typer.Option(5, "--authors", help="Distinct authors."),
+    branch_shape: str = typer.Option("linear", "--branch-shape", help="linear | feature | merges"),
+    tree: int = typer.Option(0, "--tree", help="Instead of one repository, lay out this many in a nested tree."),
+    seed: int = typer.Option(0, "--seed", help="Random seed."),
+) -> None:
+    """Generate a synthetic repository (or a nested tree of them)."""
+    spec = SyntheticRepoSpec.model_validate(
+        {
+            "commits": commits,
+            "files": files,
+            "file_lines": file_lines,
+            "files_per_commit": files_per_commit,
+            "languages": [lang.strip() for lang in languages.split(",") if lang.strip()],
+            "authors": authors,
+            "branch_shape": branch_shape,
+            "seed": seed,
+        }
+    )
+    if tree:
+        created = generate_tree(path, repos=tree, spec=spec)
+        typer.echo(f"Created {len(created)} repositories under {path}")
+    else:
+        generate_repo(path, spec)
+        typer.echo(f"Created {path}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,219 @@
+"""Byte spool for large diffs: git output goes straight to a temporary file that is read back through ``mmap``."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import subprocess
+import tempfile
+from functools import partial
+from types import TracebackType
+from typing import IO, Iterator, Protocol
+
+DEFAULT_MAX_MEMORY = 16 * 2**20
+
+_READ_BLOCK = 2**20
+
+
+class _Searchable(Protocol):
+    """A byte buffer with ``find``/``rfind`` (``bytes``, ``bytearray`` and ``mmap`` all qualify)."""
+
+    def find(self, sub: bytes, start: int = ..., end: int = ...) -> int:
+        """Return the lowest index of ``sub`` in ``[start, end)``, or -1."""
+
+    def rfind(self, sub: bytes, start: int = ..., end: int = ...) -> int:
+        """Return the highest index of ``sub`` in ``[start, end)``, or -1."""
+
+
+class DiffSpool:
+    """Collects a diff as UTF-8 bytes and hands it back as zero-copy `memoryview` chunks.
+
+    Up to ``max_memory`` bytes are buffered in memory; past that the contents
+    move to an anonymous temporary file, and `write_command` then lets git
+    write into that file directly. Reading maps the file with ``mmap``, so
+    `chunks` slices the page cache rather than Python strings and no chunk is
+    copied until the caller decodes it. Once read, the spool is frozen: further
+    writes raise `ValueError`.
+
+    Chunk views must be released (``with chunk: ...``) before the spool closes.
+    """
+
+    def __init__(self, max_memory: int = DEFAULT_MAX_MEMORY) -> None:
+        """Open an empty spool that moves to disk once more than ``max_memory`` bytes are written."""
+        self.max_memory = max_memory
+        self.size = 0
+        self.__buffer: bytearray | None = bytearray()
+        self.__file: IO[bytes] | None = None
+        self.__map: mmap.mmap | None = None
+        self.__view: memoryview | None = None
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the contents live in a temporary file."""
+        return self.__file is not None
+
+    def write(self, data: str | bytes) -> int:
+        """Append ``data`` (text is encoded as UTF-8); return the number of bytes written."""
+        self.__check_writable()
+        payload = data.encode("utf-8") if isinstance(data, str) else data
+        if self.__buffer is not None and self.size + len(payload) > self.max_memory:
+            self.__spill()
+        if self.__buffer is not None:
+            self.__buffer += payload
+        else:
+            assert self.__file is not None
+            self.__file.write(payload)
+        self.size += len(payload)
+        return len(payload)
+
+    def write_command(self, args: list[str], strip_trailing_newline: bool = False) -> int:
+        """Append the stdout of the command ``args``; return the number of bytes kept.
+
+        Once spilled, the command writes into the spool file itself; before
+        that, its output is copied over in blocks. ``strip_trailing_newline``
+        drops one final newline, as GitPython does for command output.
+
+        Raises:
+            subprocess.CalledProcessError: If the command exits non-zero.
+        """
+        self.__check_writable()
+        before = self.size
+        # stderr goes to a file rather than a second pipe: reading stdout to the end while git
+        # blocks on a full stderr pipe would deadlock.
+        with tempfile.TemporaryFile("w+b") as errors:
+            if self.__file is not None:
+                self.__file.flush()
+                returncode = subprocess.run(args, stdout=self.__file, stderr=errors, check=False).returncode
+                self.size = self.__file.seek(0, os.SEEK_END)
+            else:
+                with subprocess.Popen(args, stdout=subprocess.PIPE, stderr=errors) as process:
+                    stdout = process.stdout
+                    assert stdout is not None
+                    for block in iter(partial(stdout.read, _READ_BLOCK), b""):
+                        self.write(block)
+                returncode = process.returncode
+            errors.seek(0)
+            stderr = errors.read()
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, args, stderr=stderr)
+        if strip_trailing_newline and self.size > before and self.__last_byte() == b"\n":
+            self.__truncate(self.size - 1)
+        return self.size - before
+
+    def read(self) -> str:
+        """Return the whole spool as text (meant for small diffs)."""
+        return str(self.view(), "utf-8", "replace")
+
+    def view(self) -> memoryview:
+        """Return a read-only view of the whole spool, mapping the file on first use."""
+        if self.__view is None:
+            if self.__file is not None:
+                self.__file.flush()
+                self.__map = mmap.mmap(self.__file.fileno(), self.size, access=mmap.ACCESS_READ)
+                self.__view = memoryview(self.__map)
+            else:
+                self.__view = memoryview(self.__buffer if self.__buffer is not None else b"").toreadonly()
+        return self.__view
+
+    def chunks(self, max_size: int) -> Iterator[memoryview]:
+        """Yield views of consecutive chunks of at most ``max_size`` bytes, split at line boundaries.
+
+        Packing matches a greedy pass over the lines (each costing its length
+        plus one for the newline); the newline between chunks is dropped, and
+        a single line longer than ``max_size`` becomes a chunk of its own.
+        """
+        view = self.view()
+        for start, end in chunk_bounds(self.__searchable(), self.size, max_size):
+            yield view[start:end]
+
+    def count_chunks(self, max_size: int) -> int:
+        """Return how many chunks `chunks` would yield, without creating any views."""
+        self.view()
+        return sum(1 for _ in chunk_bounds(self.__searchable(), self.size, max_size))
+
+    def close(self) -> None:
+        """Release the mapping and the buffer (deleting the temporary file, if any)."""
+        if self.__view is not None:
+            self.__view.release()
+            self.__view = None
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
+        if self.__file is not None:
+            self.__file.close()
+        self.__buffer = None
+
+    def __enter__(self) -> DiffSpool:
+        """Return the spool itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the spool."""
+        self.close()
+
+    def __searchable(self) -> _Searchable:
+        """Return the object backing `view` (the mapping or the in-memory buffer)."""
+        if self.__map is not None:
+            return self.__map
+        return self.__buffer if self.__buffer is not None else b""
+
+    def __spill(self) -> None:
+        """Move the in-memory buffer to an anonymous temporary file."""
+        assert self.__buffer is not None
+        self.__file = tempfile.TemporaryFile("w+b")
+        self.__file.write(self.__buffer)
+        self.__buffer = None
+
+    def __check_writable(self) -> None:
+        """Refuse writes once the spool has been read (a live mapping cannot grow)."""
+        if self.__view is not None:
+            raise ValueError("DiffSpool is read-only once it has been viewed.")
+
+    def __last_byte(self) -> bytes:
+        """Return the final byte written."""
+        if self.__buffer is not None:
+            return bytes(self.__buffer[-1:])
+        assert self.__file is not None
+        self.__file.seek(-1, os.SEEK_END)
+        last = self.__file.read(1)
+        self.__file.seek(0, os.SEEK_END)
+        return last
+
+    def __truncate(self, size: int) -> None:
+        """Shrink the spool to ``size`` bytes."""
+        if self.__buffer is not None:
+            del self.__buffer[size:]
+        else:
+            assert self.__file is not None
+            self.__file.truncate(size)
+            self.__file.seek(0, os.SEEK_END)
+        self.size = size
+
+
+def chunk_bounds(buffer: _Searchable, size: int, max_size: int) -> Iterator[tuple[int, int]]:
+    """Yield ``(start, end)`` byte offsets of line-aligned chunks of ``buffer[:size]``; see `DiffSpool.chunks`.
+
+    Runs one ``rfind`` per chunk rather than visiting every line, so it stays
+    cheap on multi-hundred-megabyte buffers.
+    """
+    start = 0
+    text_end = size - 1 if size and buffer.find(b"\n", size - 1, size) != -1 else size
+    while start < size:
+        # Lines cost their length plus one, so the rest fits if its text (sans final newline) is below max_size.
+        if text_end - start < max_size:
+            yield start, text_end
+            return
+        newline = buffer.rfind(b"\n", start, start + max_size)
+        if newline == -1:
+            # The first line alone exceeds max_size: it becomes a chunk of its own.
+            newline = buffer.find(b"\n", start, size)
+            if newline == -1:
+                yield start, size
+                return
+        yield start, newline
+        start = newline + 1
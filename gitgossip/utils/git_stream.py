@@ -0,0 +1,73 @@
+"""Helpers for running ``git`` directly: streaming NUL-delimited records and short queries."""
+
+from __future__ import annotations
+
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+from git.exc import GitCommandError
+
+_READ_SIZE = 1 << 16
+
+
+def iter_git_records(args: list[str], width: int) -> Iterator[tuple[bytes, ...]]:
+    """Run ``args`` and yield tuples of ``width`` NUL-separated fields from its stdout.
+
+    Meant for ``git log -z --format=%x%x00%y...`` style output, where every
+    field (and every record) is NUL-terminated. Output is read in 64 KiB blocks,
+    so memory stays flat regardless of history size.
+
+    Raises:
+        GitCommandError: If git exits non-zero (raised once the stream is drained).
+    """
+    # stderr goes to a file rather than a second pipe: reading stdout to the end while git
+    # blocks on a full stderr pipe would deadlock.
+    with tempfile.TemporaryFile("w+b") as errors, subprocess.Popen(args, stdout=subprocess.PIPE, stderr=errors) as proc:
+        try:
+            fields: list[bytes] = []
+            pending = b""
+            while proc.stdout is not None and (block := proc.stdout.read(_READ_SIZE)):
+                tokens = (pending + block).split(b"\0")
+                pending = tokens.pop()
+                fields.extend(tokens)
+                usable = len(fields) - len(fields) % width
+                for i in range(0, usable, width):
+                    yield tuple(fields[i : i + width])
+                del fields[:usable]
+            if pending:
+                fields.append(pending)
+            if len(fields) == width:
+                yield tuple(fields)
+            proc.wait()
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+        errors.seek(0)
+        stderr = errors.read()
+    if proc.returncode != 0:
+        raise GitCommandError(args, proc.returncode, stderr.decode("utf-8", "replace").strip())
+
+
+def git_output(repo: Path, *args: str, stdin: str | None = None) -> str:
+    """Run a short git command in ``repo`` (feeding it ``stdin``, if given) and return its stripped stdout.
+
+    Raises:
+        GitCommandError: If git exits non-zero.
+    """
+    command = ["git", "-C", str(repo), *args]
+    result = subprocess.run(command, input=stdin, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        raise GitCommandError(command, result.returncode, result.stderr.strip())
+    return result.stdout.strip()
+
+
+def is_ancestor(repo: Path, ancestor: str, head: str) -> bool:
+    """Return True when ``ancestor`` is reachable from ``head`` (False also when ``ancestor`` no longer exists)."""
+    result = subprocess.run(
+        ["git", "-C", str(repo), "merge-base", "--is-ancestor", ancestor, head],
+        capture_output=True,
+        check=False,
+    )
+    return result.returncode == 0
@@ -0,0 +1,87 @@
+"""Machine-readable command output: one JSON record per result, written as soon as it is ready.
+
+``--format ndjson`` writes one object per line. ``--format json`` streams a
+single JSON array, so consumers that parse incrementally still see each
+record as it is flushed and the file is valid JSON once the run ends.
+Records go to ``sys.stdout`` (resolved at write time, so the daemon can
+route them); everything meant for humans goes to stderr in these modes.
+
+Only the standard library is imported here: ``gitgossip.cli`` validates the
+format before any command module loads.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from types import TracebackType
+from typing import IO, TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from gitgossip.core.models.llm_call import LLMCallStats
+
+FORMATS = ("text", "json", "ndjson")
+
+
+class RecordWriter:
+    """Writes records to stdout (or ``stream``) in ``json`` or ``ndjson`` form, flushing each one."""
+
+    def __init__(self, fmt: str, stream: IO[str] | None = None) -> None:
+        """Open a writer for ``fmt`` (``"json"`` or ``"ndjson"``).
+
+        Raises:
+            ValueError: If ``fmt`` is not a machine-readable format.
+        """
+        if fmt not in FORMATS[1:]:
+            raise ValueError(f"Unknown output format '{fmt}'. Use one of: {', '.join(FORMATS[1:])}.")
+        self.fmt = fmt
+        self.count = 0
+        self.__stream = stream
+
+    def emit(self, record: dict[str, Any]) -> None:
+        """Write one record and flush it."""
+        line = json.dumps(record, default=str, ensure_ascii=False)
+        if self.fmt == "json":
+            line = ("[\n" if not self.count else ",\n") + line
+        else:
+            line += "\n"
+        stream = self.__stream or sys.stdout
+        stream.write(line)
+        stream.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        """Terminate the JSON array (an empty run still yields ``[]``); a no-op for NDJSON."""
+        if self.fmt != "json":
+            return
+        stream = self.__stream or sys.stdout
+        stream.write("[]\n" if not self.count else "\n]\n")
+        stream.flush()
+
+    def __enter__(self) -> RecordWriter:
+        """Return the writer itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the writer, even when the command fails, so the JSON array stays well-formed."""
+        self.close()
+
+
+def llm_usage(calls: Iterable[LLMCallStats]) -> dict[str, Any]:
+    """Summarize LLM calls as a record's ``timings`` and ``cache`` fields."""
+    calls = list(calls)
+    prompt_tokens = sum(c.prompt_tokens or 0 for c in calls)
+    cached_tokens = sum(c.cached_tokens or 0 for c in calls)
+    return {
+        "timings": {"llm_ms": round(sum(c.wall_ms for c in calls), 2), "llm_calls": len(calls)},
+        "cache": {
+            "prompt_tokens": prompt_tokens,
+            "cached_tokens": cached_tokens,
+            "hit": cached_tokens > 0,
+        },
+    }
@@ -0,0 +1,186 @@
+"""Opt-in phase profiler behind the global ``--profile`` option.
+
+Code marks its expensive sections with ``with phase("parse"): ...``. While no
+profiler is running, `phase` returns one shared no-op context manager, so an
+instrumented section costs one attribute lookup. While one is running, each
+phase accumulates call count plus *self* wall and CPU time (time spent in
+nested phases is charged to the inner phase only), per thread, so the
+breakdown adds up even when phases nest.
+
+With ``memory=True`` (``--mem-report``) the profiler also runs `tracemalloc`
+and records, per phase, the peak of traced Python allocations seen while the
+phase was open. Peaks are process-wide: a phase running concurrently on
+another thread is charged with whatever the other threads allocated meanwhile.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import threading
+import time
+import tracemalloc
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+_NOOP: AbstractContextManager[None] = nullcontext()
+
+
+class PhaseTiming(NamedTuple):
+    """Accumulated self time for one named phase."""
+
+    name: str
+    calls: int
+    wall_s: float
+    cpu_s: float
+    peak_bytes: int | None = None
+
+
+class _Frame:
+    """One open phase on a thread's stack."""
+
+    __slots__ = ("name", "wall", "cpu", "child_wall", "child_cpu", "peak")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.peak = 0
+
+
+class PhaseProfiler:
+    """Collects per-phase timings for one run and, optionally, peak memory and a cProfile dump of the main thread."""
+
+    def __init__(self, cprofile_path: Path | None = None, memory: bool = False) -> None:
+        """Start the run clock (plus cProfile when ``cprofile_path`` is given and tracemalloc when ``memory``)."""
+        self.cprofile_path = cprofile_path
+        self.memory = memory
+        self.__timings: dict[str, list[float]] = {}  # name -> [calls, self wall, self cpu, peak bytes]
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__started = time.perf_counter()
+        self.__cpu_started = time.process_time()
+        self.__elapsed: tuple[float, float] | None = None
+        self.__peak = 0
+        self.__owns_tracemalloc = memory and not tracemalloc.is_tracing()
+        if self.__owns_tracemalloc:
+            tracemalloc.start()
+        self.__cprofile = cProfile.Profile() if cprofile_path else None
+        if self.__cprofile is not None:
+            self.__cprofile.enable()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Charge the enclosed block's self wall and CPU time to ``name``."""
+        stack: list[_Frame] = self.__local.__dict__.setdefault("stack", [])
+        if self.memory:
+            # Hand the peak so far to the enclosing phase, then measure this one from a fresh peak.
+            self.__charge_peak(stack[-1] if stack else None)
+            tracemalloc.reset_peak()
+        frame = _Frame(name)
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            wall = time.perf_counter() - frame.wall
+            cpu = time.thread_time() - frame.cpu
+            if self.memory:
+                self.__charge_peak(frame)
+            if stack:
+                stack[-1].child_wall += wall
+                stack[-1].child_cpu += cpu
+                stack[-1].peak = max(stack[-1].peak, frame.peak)
+            with self.__lock:
+                totals = self.__timings.setdefault(name, [0, 0.0, 0.0, 0])
+                totals[0] += 1
+                totals[1] += wall - frame.child_wall
+                totals[2] += cpu - frame.child_cpu
+                totals[3] = max(totals[3], frame.peak)
+
+    def stop(self) -> None:
+        """Freeze the run clock and write the cProfile dump, if one was requested."""
+        if self.__elapsed is not None:
+            return
+        self.__elapsed = (time.perf_counter() - self.__started, time.process_time() - self.__cpu_started)
+        if self.memory:
+            self.__charge_peak(None)
+            if self.__owns_tracemalloc:
+                tracemalloc.stop()
+        if self.__cprofile is not None and self.cprofile_path is not None:
+            self.__cprofile.disable()
+            self.cprofile_path.parent.mkdir(parents=True, exist_ok=True)
+            self.__cprofile.dump_stats(str(self.cprofile_path))
+
+    @property
+    def elapsed(self) -> tuple[float, float]:
+        """Run ``(wall, cpu)`` seconds — final after `stop`, running totals before."""
+        if self.__elapsed is not None:
+            return self.__elapsed
+        return time.perf_counter() - self.__started, time.process_time() - self.__cpu_started
+
+    @property
+    def peak_bytes(self) -> int | None:
+        """Peak traced memory over the whole run (None unless ``memory``)."""
+        if not self.memory:
+            return None
+        if self.__elapsed is None:
+            self.__charge_peak(None)
+        return self.__peak
+
+    def timings(self) -> list[PhaseTiming]:
+        """Return phases sorted by self wall time, slowest first."""
+        with self.__lock:
+            rows = [
+                PhaseTiming(name, int(calls), wall, cpu, int(peak) if self.memory else None)
+                for name, (calls, wall, cpu, peak) in self.__timings.items()
+            ]
+        return sorted(rows, key=lambda t: t.wall_s, reverse=True)
+
+    def __charge_peak(self, frame: _Frame | None) -> None:
+        """Fold tracemalloc's current peak into ``frame`` (when given) and the run-wide peak."""
+        if not tracemalloc.is_tracing():
+            return
+        _, peak = tracemalloc.get_traced_memory()
+        if frame is not None:
+            frame.peak = max(frame.peak, peak)
+        self.__peak = max(self.__peak, peak)
+
+
+class _Running:
+    """Holds the process-wide running profiler; every thread sees the same one, so it is not a ContextVar."""
+
+    __slots__ = ("profiler",)
+
+    def __init__(self) -> None:
+        self.profiler: PhaseProfiler | None = None
+
+
+_running = _Running()
+
+
+def phase(name: str) -> AbstractContextManager[None]:
+    """Time the enclosed block as ``name`` when profiling is on; a shared no-op otherwise."""
+    profiler = _running.profiler
+    return _NOOP if profiler is None else profiler.phase(name)
+
+
+def start(cprofile_path: Path | None = None, memory: bool = False) -> PhaseProfiler:
+    """Start profiling this process and return the profiler."""
+    profiler = _running.profiler = PhaseProfiler(cprofile_path, memory)
+    return profiler
+
+
+def stop() -> PhaseProfiler | None:
+    """Stop profiling and return the finished profiler (None if none was running)."""
+    profiler, _running.profiler = _running.profiler, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+def active() -> PhaseProfiler | None:
+    """Return the running profiler, if any."""
+    return _running.profiler
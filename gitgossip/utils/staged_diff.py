@@ -0,0 +1,85 @@
+"""Staged changes from a single ``git diff --cached`` call: per-file status and line counts plus the patch.
+
+One invocation asks for ``--raw`` (status letters), ``--numstat`` (added and
+deleted lines) and the unified patch together; with ``-z`` the first two
+sections are NUL-terminated records followed by an empty field, after which
+the patch text runs unchanged. Only the standard library is used so the
+``prepare-commit-msg`` hook can import this without GitPython.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+# Arguments after ``git``; the patch section matches plain ``git diff --cached --unified=3``.
+STAGED_DIFF_ARGS = ("diff", "--cached", "--raw", "--numstat", "-z", "--unified=3")
+
+
+class StagedFile(NamedTuple):
+    """One staged path with its status letter and line counts (None for binary files)."""
+
+    path: str
+    status: str
+    added: int | None
+    deleted: int | None
+    old_path: str | None = None
+
+    def describe(self) -> str:
+        """Return a one-line summary such as ``M gitgossip/cli.py (+12 -3)``."""
+        name = f"{self.old_path} -> {self.path}" if self.old_path else self.path
+        counts = "binary" if self.added is None or self.deleted is None else f"+{self.added} -{self.deleted}"
+        return f"{self.status} {name} ({counts})"
+
+
+class StagedDiff(NamedTuple):
+    """Everything staged: the files and the unified patch."""
+
+    files: list[StagedFile]
+    patch: str
+
+    @property
+    def paths(self) -> list[str]:
+        """Return the staged paths (new names for renames and copies)."""
+        return [f.path for f in self.files]
+
+    @property
+    def statuses(self) -> dict[str, str]:
+        """Map each staged path to its status letter."""
+        return {f.path: f.status for f in self.files}
+
+    def file_summary(self) -> str:
+        """Return one `StagedFile.describe` line per file, for the commit-message prompt."""
+        return "\n".join(f.describe() for f in self.files)
+
+
+def parse_staged_diff(output: str) -> StagedDiff:
+    """Parse the output of ``git`` + `STAGED_DIFF_ARGS` (a trailing newline may already be stripped)."""
+    fields = output.split("\0")
+    statuses: list[tuple[str, str, str | None]] = []
+    counts: list[tuple[int | None, int | None]] = []
+    i = 0
+    while i < len(fields) and fields[i]:
+        field = fields[i]
+        if field.startswith(":"):
+            # ":<old mode> <new mode> <old sha> <new sha> <status>" then one path, or two for renames/copies.
+            status = field.rsplit(" ", 1)[-1][:1]
+            if status in "RC":
+                statuses.append((status, fields[i + 2], fields[i + 1]))
+                i += 3
+            else:
+                statuses.append((status, fields[i + 1], None))
+                i += 2
+            continue
+        # "<added>\t<deleted>\t<path>", with an empty path followed by two path fields for renames/copies.
+        added, deleted, path = field.split("\t", 2)
+        counts.append((None if added == "-" else int(added), None if deleted == "-" else int(deleted)))
+        i += 1 if path else 3
+
+    patch = "\0".join(fields[i + 1 :]) if i < len(fields) else ""
+    if patch.endswith("\n"):
+        patch = patch[:-1]
+    files = [
+        StagedFile(path, status, added, deleted, old_path)
+        for (status, path, old_path), (added, deleted) in zip(statuses, counts)
+    ]
+    return StagedDiff(files, patch)
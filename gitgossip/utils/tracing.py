@@ -0,0 +1,250 @@
+"""Opt-in structured tracing behind the global ``--trace`` option.
+
+Code opens spans with ``with span("llm.complete", operation=...) as s: ...``
+and may add attributes later with ``s.set(...)`` or, from code that does not
+hold the span, `annotate`. The current span lives in a context variable, so
+nesting (and threads started with a copied context) yields a parent/child
+tree. While no tracer is running, `span` returns one shared no-op context
+manager and `annotate` returns immediately.
+
+Finished spans go to a local file that can be inspected offline:
+
+- ``ndjson``: one JSON object per span, appended as soon as the span ends,
+  so a crashed or killed run still leaves the spans it completed.
+- ``otlp``: one OTLP/JSON ``ExportTraceServiceRequest`` per run, written when
+  tracing stops (the layout read by the OpenTelemetry Collector's
+  ``otlpjsonfile`` receiver and by OTLP-aware trace viewers).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Iterator
+
+FORMATS = ("ndjson", "otlp")
+
+AttributeValue = str | int | float | bool
+
+
+class Span:
+    """One timed unit of work with its attributes; created by `Tracer.span`."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error", "thread")
+
+    def __init__(self, name: str, trace_id: str, parent_id: str | None, attributes: dict[str, Any]) -> None:
+        """Open the span now, on the calling thread."""
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.attributes: dict[str, AttributeValue] = {}
+        self.error: str | None = None
+        self.thread = threading.current_thread().name
+        self.set(**attributes)
+
+    def set(self, **attributes: Any) -> None:
+        """Add or overwrite attributes (``None`` values are skipped, other non-scalars are stringified)."""
+        for key, value in attributes.items():
+            if value is None:
+                continue
+            self.attributes[key] = value if isinstance(value, (str, int, float, bool)) else str(value)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the span as a flat JSON-ready record (the ``ndjson`` line format)."""
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": end_ns,
+            "duration_ms": round((end_ns - self.start_ns) / 1e6, 3),
+            "status": "error" if self.error is not None else "ok",
+            "error": self.error,
+            "thread": self.thread,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Stand-in yielded by `span` while tracing is off."""
+
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> None:
+        """Discard the attributes."""
+
+
+_NOOP: AbstractContextManager[Span | _NoopSpan] = nullcontext(_NoopSpan())
+_CURRENT: ContextVar[Span | None] = ContextVar("gitgossip_span", default=None)
+
+
+class Tracer:
+    """Collects the spans of one run (one trace) and exports them to ``path`` in ``fmt``."""
+
+    def __init__(self, path: Path, fmt: str = "ndjson", resource: dict[str, Any] | None = None) -> None:
+        """Open the trace; with ``ndjson`` the output file is created (or appended to) right away.
+
+        Raises:
+            ValueError: If ``fmt`` is not one of `FORMATS`.
+            OSError: If the output file cannot be opened.
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown trace format '{fmt}'. Use one of: {', '.join(FORMATS)}.")
+        self.path = path
+        self.format = fmt
+        self.trace_id = os.urandom(16).hex()
+        self.resource: dict[str, Any] = {"service.name": "gitgossip", **(resource or {})}
+        self.__spans: list[Span] = []
+        self.__lock = threading.Lock()
+        self.__closed = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.__stream = self.path.open("a", encoding="utf-8") if fmt == "ndjson" else None
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Time the enclosed block as a child of the current span; exceptions mark it as failed and propagate."""
+        current = Span(name, self.trace_id, _current_span_id(), attributes)
+        token = _CURRENT.set(current)
+        try:
+            yield current
+        except BaseException as exc:
+            current.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            _CURRENT.reset(token)
+            current.end_ns = time.time_ns()
+            self.__finish(current)
+
+    def spans(self) -> list[Span]:
+        """Return the finished spans in the order they ended."""
+        with self.__lock:
+            return list(self.__spans)
+
+    def stop(self) -> None:
+        """Flush and close the output (for ``otlp``, write the whole trace now)."""
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            if self.__stream is not None:
+                self.__stream.close()
+                return
+            payload = _otlp_request(self.__spans, self.resource)
+        with self.path.open("a", encoding="utf-8") as out:
+            out.write(json.dumps(payload, separators=(",", ":")) + "\n")
+
+    def __finish(self, finished: Span) -> None:
+        """Record a finished span and, for ``ndjson``, append it to the file immediately."""
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__spans.append(finished)
+            if self.__stream is not None:
+                record = {**finished.as_dict(), "resource": self.resource}
+                self.__stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+                self.__stream.flush()
+
+
+class _Running:
+    """Holds the process-wide running tracer; unlike the current span it is shared by every thread and context."""
+
+    __slots__ = ("tracer",)
+
+    def __init__(self) -> None:
+        self.tracer: Tracer | None = None
+
+
+_running = _Running()
+
+
+def span(name: str, **attributes: Any) -> AbstractContextManager[Span | _NoopSpan]:
+    """Trace the enclosed block as ``name`` when tracing is on; a shared no-op otherwise."""
+    tracer = _running.tracer
+    return _NOOP if tracer is None else tracer.span(name, **attributes)
+
+
+def annotate(**attributes: Any) -> None:
+    """Add attributes to the span open in the current context, if any."""
+    current = _CURRENT.get()
+    if current is not None:
+        current.set(**attributes)
+
+
+def start(path: Path, fmt: str = "ndjson", resource: dict[str, Any] | None = None) -> Tracer:
+    """Start tracing this process into ``path`` and return the tracer."""
+    tracer = _running.tracer = Tracer(path, fmt, resource)
+    return tracer
+
+
+def stop() -> Tracer | None:
+    """Stop tracing, export what was collected and return the tracer (None if none was running)."""
+    tracer, _running.tracer = _running.tracer, None
+    if tracer is not None:
+        tracer.stop()
+    return tracer
+
+
+def active() -> Tracer | None:
+    """Return the running tracer, if any."""
+    return _running.tracer
+
+
+def _current_span_id() -> str | None:
+    """Return the id of the span open in the current context."""
+    current = _CURRENT.get()
+    return current.span_id if current is not None else None
+
+
+def _otlp_request(spans: list[Span], resource: dict[str, Any]) -> dict[str, Any]:
+    """Build an OTLP/JSON ``ExportTraceServiceRequest`` holding ``spans``."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _otlp_attributes(resource)},
+                "scopeSpans": [{"scope": {"name": "gitgossip"}, "spans": [_otlp_span(s) for s in spans]}],
+            }
+        ]
+    }
+
+
+def _otlp_span(finished: Span) -> dict[str, Any]:
+    """Convert a span to its OTLP/JSON form (64-bit nanosecond timestamps are strings, per the spec)."""
+    record: dict[str, Any] = {
+        "traceId": finished.trace_id,
+        "spanId": finished.span_id,
+        "name": finished.name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(finished.start_ns),
+        "endTimeUnixNano": str(finished.end_ns if finished.end_ns is not None else finished.start_ns),
+        "attributes": _otlp_attributes({**finished.attributes, "thread.name": finished.thread}),
+        "status": {"code": 2, "message": finished.error} if finished.error is not None else {"code": 1},
+    }
+    if finished.parent_id is not None:
+        record["parentSpanId"] = finished.parent_id
+    return record
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    """Convert a flat mapping to OTLP ``KeyValue`` entries."""
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    """Wrap a scalar in the matching OTLP ``AnyValue`` field (``intValue`` is a string, per the spec)."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
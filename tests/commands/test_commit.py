@@ -1,6 +1,7 @@
 """Unit tests for the commit command."""
 
 import subprocess
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
@@ -36,6 +37,26 @@ def clean_repo(tmp_path: Path) -> Path:
     return tmp_path
 
 
+@pytest.fixture()
+def conflicted_repo(tmp_path: Path) -> Path:
+    """Create a temp git repo mid-merge: a.txt is unmerged and b.txt is staged."""
+    _init_repo(tmp_path)
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", "-C", str(tmp_path), *args], check=False, capture_output=True)
+
+    git("checkout", "-b", "other")
+    (tmp_path / "a.txt").write_text("other\n", encoding="utf-8")
+    git("commit", "-am", "other")
+    git("checkout", "main")
+    (tmp_path / "a.txt").write_text("mine\n", encoding="utf-8")
+    git("commit", "-am", "mine")
+    git("merge", "other")
+    (tmp_path / "b.txt").write_text("new\n", encoding="utf-8")
+    git("add", "b.txt")
+    return tmp_path
+
+
 def _log_last_subject(repo: Path) -> str:
     result = subprocess.run(
         ["git", "-C", str(repo), "log", "-1", "--pretty=%s"], check=True, capture_output=True, text=True
@@ -87,6 +108,88 @@ class TestCommitCmd:
         # then
         assert _log_last_subject(staged_repo) == "fix(a): edited message"
 
+    @patch("gitgossip.commands.commit.Prompt.ask", side_effect=["r", "r", "a"])
+    def test_regenerate_takes_prefetched_candidates(self, _mock_ask, staged_repo: Path) -> None:
+        # given
+        def generate(diff_text: str, file_summary: str) -> str:
+            return f"feat: {threading.current_thread().name}"
+
+        # when
+        with patch("gitgossip.commands.commit.LLMAnalyzerFactory") as mock_factory_cls:
+            analyzer = mock_factory_cls.return_value.get_analyzer.return_value
+            analyzer.generate_commit_message.side_effect = generate
+            commit_cmd(path=str(staged_repo), print_only=False, hook_file=None, use_mock=False, candidates=2)
+
+        # then
+        assert _log_last_subject(staged_repo).startswith("feat: commit-candidate-")
+        assert analyzer.generate_commit_message.call_count == 4
+        assert mock_factory_cls.return_value.get_analyzer.call_args.kwargs["show_status"] is False
+
+
+class TestCommitMessageCache:
+    """Verify messages are reused for an unchanged staged tree."""
+
+    @staticmethod
+    def _run(repo: Path, fresh: bool = False) -> int:
+        """Run `commit --print` against a stub model and return how many times it was asked."""
+        with patch("gitgossip.commands.commit.LLMAnalyzerFactory") as mock_factory_cls:
+            analyzer = mock_factory_cls.return_value.get_analyzer.return_value
+            analyzer.generate_commit_message.return_value = "feat: from the model"
+            commit_cmd(path=str(repo), print_only=True, hook_file=None, use_mock=False, fresh=fresh)
+            return analyzer.generate_commit_message.call_count
+
+    def test_identical_staged_tree_skips_the_model(self, staged_repo: Path, capsys) -> None:
+        # given
+        self._run(staged_repo)
+        capsys.readouterr()
+
+        # when
+        calls = self._run(staged_repo)
+
+        # then
+        assert calls == 0
+        assert capsys.readouterr().out.strip() == "feat: from the model"
+
+    def test_fresh_and_changed_tree_ask_the_model_again(self, staged_repo: Path) -> None:
+        # given
+        self._run(staged_repo)
+
+        # when
+        fresh_calls = self._run(staged_repo, fresh=True)
+        (staged_repo / "a.txt").write_text("one\ntwo\nthree\n", encoding="utf-8")
+        subprocess.run(["git", "-C", str(staged_repo), "add", "a.txt"], check=True)
+        changed_calls = self._run(staged_repo)
+
+        # then
+        assert fresh_calls == 1
+        assert changed_calls == 1
+
+    @patch("gitgossip.commands.commit.click.edit", return_value="fix(a): edited message\n")
+    @patch("gitgossip.commands.commit.Prompt.ask", side_effect=["e", "q"])
+    def test_edited_message_is_offered_after_aborting(self, _mock_ask, _mock_edit, staged_repo: Path, capsys) -> None:
+        # given
+        with pytest.raises(typer.Exit):
+            commit_cmd(path=str(staged_repo), print_only=False, hook_file=None, use_mock=True)
+        capsys.readouterr()
+
+        # when
+        commit_cmd(path=str(staged_repo), print_only=True, hook_file=None, use_mock=True)
+
+        # then
+        assert capsys.readouterr().out.strip() == "fix(a): edited message"
+
+    def test_unmerged_index_skips_the_cache(self, conflicted_repo: Path, capsys) -> None:
+        # given
+        self._run(conflicted_repo)
+        capsys.readouterr()
+
+        # when
+        calls = self._run(conflicted_repo)
+
+        # then
+        assert calls == 1
+        assert capsys.readouterr().out.strip() == "feat: from the model"
+
 
 class TestCommitHookMode:
     """Verify prepare-commit-msg hook behavior: fill when empty, never break commits."""
@@ -121,7 +224,9 @@ class TestCommitHookMode:
         msg_file.write_text("", encoding="utf-8")
 
         # when: analyzer factory blows up — hook must not raise
-        with patch("gitgossip.commands.commit.LLMAnalyzerFactory", side_effect=RuntimeError("no config")):
+        with patch(
+            "gitgossip.core.factories.llm_analyzer_factory.LLMAnalyzerFactory", side_effect=RuntimeError("no config")
+        ):
             commit_cmd(path=str(staged_repo), print_only=False, hook_file=str(msg_file), use_mock=False)
 
         # then
@@ -137,3 +242,14 @@ class TestCommitHookMode:
 
         # then
         assert msg_file.read_text(encoding="utf-8") == ""
+
+    def test_hook_fills_message_with_an_unmerged_index(self, conflicted_repo: Path) -> None:
+        # given
+        msg_file = conflicted_repo / ".git" / "COMMIT_EDITMSG"
+        msg_file.write_text("# Conflicts:\n#\ta.txt\n", encoding="utf-8")
+
+        # when
+        commit_cmd(path=str(conflicted_repo), print_only=False, hook_file=str(msg_file), use_mock=True)
+
+        # then
+        assert msg_file.read_text(encoding="utf-8").startswith("chore: mock commit message")
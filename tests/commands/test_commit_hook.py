@@ -0,0 +1,190 @@
+"""Unit tests for the deadline-bounded commit hook."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gitgossip.commands.commit_hook import heuristic_message, hook_cmd, message_cache_key
+
+
+@pytest.fixture()
+def staged_repo(tmp_path: Path) -> Path:
+    """Create a temp git repo with a staged change to a.txt."""
+    subprocess.run(["git", "init", "-b", "main", str(tmp_path)], check=True, capture_output=True)
+    subprocess.run(["git", "-C", str(tmp_path), "config", "user.email", "t@t.com"], check=True)
+    subprocess.run(["git", "-C", str(tmp_path), "config", "user.name", "t"], check=True)
+    subprocess.run(["git", "-C", str(tmp_path), "config", "commit.gpgsign", "false"], check=True)
+    (tmp_path / "a.txt").write_text("one\n", encoding="utf-8")
+    subprocess.run(["git", "-C", str(tmp_path), "add", "a.txt"], check=True)
+    subprocess.run(["git", "-C", str(tmp_path), "commit", "-m", "init"], check=True, capture_output=True)
+    (tmp_path / "a.txt").write_text("one\ntwo\n", encoding="utf-8")
+    subprocess.run(["git", "-C", str(tmp_path), "add", "a.txt"], check=True)
+    return tmp_path
+
+
+def _slow_factory(seconds: float) -> MagicMock:
+    factory = MagicMock()
+    factory.return_value.get_analyzer.return_value.generate_commit_message.side_effect = lambda *_: (
+        time.sleep(seconds) or "feat: too late"
+    )
+    return factory
+
+
+class TestCommitHook:
+    """Verify the hook honours its deadline and falls back as configured."""
+
+    @patch("gitgossip.commands.commit_hook.ConfigService")
+    def test_missed_deadline_leaves_file_untouched(self, mock_config_cls, staged_repo: Path) -> None:
+        # given
+        mock_config_cls.return_value.load.return_value = {"commit": {"hook_deadline": 0.3}}
+        msg_file = staged_repo / ".git" / "COMMIT_EDITMSG"
+        msg_file.write_text("# template\n", encoding="utf-8")
+
+        # when
+        started = time.monotonic()
+        with patch("gitgossip.core.factories.llm_analyzer_factory.LLMAnalyzerFactory", _slow_factory(3)):
+            hook_cmd(hook_file=str(msg_file), path=str(staged_repo))
+        elapsed = time.monotonic() - started
+
+        # then
+        assert elapsed < 2
+        assert msg_file.read_text(encoding="utf-8") == "# template\n"
+
+    @patch("gitgossip.commands.commit_hook.ConfigService")
+    def test_missed_deadline_uses_heuristic_when_enabled(self, mock_config_cls, staged_repo: Path) -> None:
+        # given
+        mock_config_cls.return_value.load.return_value = {
+            "commit": {"hook_deadline": 0.3, "hook_fallback": "heuristic"}
+        }
+        msg_file = staged_repo / ".git" / "COMMIT_EDITMSG"
+        msg_file.write_text("", encoding="utf-8")
+
+        # when
+        with patch("gitgossip.core.factories.llm_analyzer_factory.LLMAnalyzerFactory", _slow_factory(3)):
+            hook_cmd(hook_file=str(msg_file), path=str(staged_repo))
+
+        # then
+        assert msg_file.read_text(encoding="utf-8").startswith("docs: update a.txt\n# gitgossip:")
+
+    @patch("gitgossip.commands.commit_hook.ConfigService")
+    def test_answer_within_deadline_is_written(self, mock_config_cls, staged_repo: Path) -> None:
+        # given
+        mock_config_cls.return_value.load.return_value = {}
+        msg_file = staged_repo / ".git" / "COMMIT_EDITMSG"
+        msg_file.write_text("", encoding="utf-8")
+
+        # when
+        hook_cmd(hook_file=str(msg_file), path=str(staged_repo), use_mock=True)
+
+        # then
+        assert msg_file.read_text(encoding="utf-8").startswith("chore: mock commit message (1 files changed)")
+
+    @patch("gitgossip.commands.commit_hook.ConfigService")
+    def test_git_env_selects_the_index(self, mock_config_cls, staged_repo: Path) -> None:
+        # given
+        mock_config_cls.return_value.load.return_value = {}
+        alt_index = staged_repo / ".git" / "alt-index"
+        alt_index.write_bytes((staged_repo / ".git" / "index").read_bytes())
+        (staged_repo / "b.txt").write_text("b\n", encoding="utf-8")
+        subprocess.run(
+            ["git", "-C", str(staged_repo), "add", "b.txt"],
+            check=True,
+            env={**os.environ, "GIT_INDEX_FILE": str(alt_index)},
+        )
+        msg_file = staged_repo / ".git" / "COMMIT_EDITMSG"
+        msg_file.write_text("", encoding="utf-8")
+
+        # when
+        hook_cmd(
+            hook_file=str(msg_file), path=str(staged_repo), use_mock=True, git_env={"GIT_INDEX_FILE": str(alt_index)}
+        )
+
+        # then
+        assert msg_file.read_text(encoding="utf-8").startswith("chore: mock commit message (2 files changed)")
+
+    @patch("gitgossip.commands.commit_hook.ConfigService")
+    def test_cached_message_skips_the_model(self, mock_config_cls, staged_repo: Path) -> None:
+        # given
+        mock_config_cls.return_value.load.return_value = {}
+        msg_file = staged_repo / ".git" / "COMMIT_EDITMSG"
+        msg_file.write_text("", encoding="utf-8")
+        hook_cmd(hook_file=str(msg_file), path=str(staged_repo), use_mock=True)
+        msg_file.write_text("# template\n", encoding="utf-8")
+
+        # when
+        with patch("gitgossip.core.factories.llm_analyzer_factory.LLMAnalyzerFactory", _slow_factory(3)) as factory:
+            hook_cmd(hook_file=str(msg_file), path=str(staged_repo), use_mock=True)
+
+        # then
+        assert not factory.called
+        assert msg_file.read_text(encoding="utf-8") == "chore: mock commit message (1 files changed)\n# template\n"
+
+    def test_hook_module_imports_stay_minimal(self) -> None:
+        # given
+        code = (
+            "import sys, gitgossip.commands.commit_hook; "
+            "print(sorted({m.split('.')[0] for m in sys.modules} & {'openai', 'httpx', 'git', 'rich', 'ruamel'}))"
+        )
+
+        # when
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[2],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # then
+        assert result.stdout.strip() == "[]"
+
+
+class TestMessageCacheKey:
+    """Verify which settings invalidate cached commit messages."""
+
+    LLM = {"provider": "openai", "model": "gpt-4o-mini", "base_url": "http://localhost:8000/v1", "timeout": 30}
+
+    def test_tuning_settings_keep_the_key(self) -> None:
+        # given
+        tuned = {**self.LLM, "timeout": 5, "pool_size": 8, "api_key": "sk-other"}
+
+        # when
+        before = message_cache_key("tree", {"llm": self.LLM}, use_mock=False)
+        after = message_cache_key("tree", {"llm": tuned}, use_mock=False)
+
+        # then
+        assert before == after
+
+    @pytest.mark.parametrize(
+        ("name", "value"), [("provider", "agent"), ("model", "gpt-4o"), ("base_url", "http://other/v1")]
+    )
+    def test_model_settings_change_the_key(self, name: str, value: str) -> None:
+        # when
+        before = message_cache_key("tree", {"llm": self.LLM}, use_mock=False)
+        after = message_cache_key("tree", {"llm": {**self.LLM, name: value}}, use_mock=False)
+
+        # then
+        assert before != after
+
+
+class TestHeuristicMessage:
+    """Verify the offline message guesses."""
+
+    @pytest.mark.parametrize(
+        ("statuses", "expected"),
+        [
+            ({"README.md": "M"}, "docs: update README.md"),
+            ({"tests/test_a.py": "A", "tests/test_b.py": "A"}, "test(tests): add test_a.py, test_b.py"),
+            ({"uv.lock": "M", "pyproject.toml": "M"}, "build: update uv.lock, pyproject.toml"),
+            ({"src/a.py": "D"}, "chore(src): remove a.py"),
+            ({f"pkg/m{i}.py": "M" for i in range(5)}, "chore(pkg): update 5 files"),
+        ],
+    )
+    def test_message_from_paths(self, statuses: dict[str, str], expected: str) -> None:
+        # given / when / then
+        assert heuristic_message(statuses) == expected
@@ -0,0 +1,96 @@
+"""Unit tests for the digest command."""
+
+import os
+import sqlite3
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import typer
+
+from gitgossip.commands.digest import digest_cmd
+
+
+def _init_repo(path: Path) -> None:
+    path.mkdir()
+    subprocess.run(["git", "init", "-b", "main", str(path)], check=True, capture_output=True)
+    subprocess.run(["git", "-C", str(path), "config", "user.email", "t@t.com"], check=True)
+    subprocess.run(["git", "-C", str(path), "config", "user.name", "t"], check=True)
+    subprocess.run(["git", "-C", str(path), "config", "commit.gpgsign", "false"], check=True)
+    (path / "a.txt").write_text("one\n", encoding="utf-8")
+    subprocess.run(["git", "-C", str(path), "add", "a.txt"], check=True)
+    subprocess.run(["git", "-C", str(path), "commit", "-m", "init"], check=True, capture_output=True)
+
+
+class TestDigestCommand:
+    """Verify digest output and reuse across runs."""
+
+    def test_second_run_reuses_summaries(self, tmp_path: Path, capsys) -> None:
+        # given
+        for name in ("alpha", "beta"):
+            _init_repo(tmp_path / name)
+
+        # when
+        digest_cmd(str(tmp_path), since="1days", use_mock=True)
+        first = capsys.readouterr().out
+        digest_cmd(str(tmp_path), since="1days", use_mock=True)
+        second = capsys.readouterr().out
+
+        # then
+        assert "2 new commits ingested from 2 repositories" in first
+        assert "2 summaries generated, 0 reused" in first
+        assert "0 new commits ingested" in second
+        assert "0 summaries generated, 2 reused" in second
+        assert "alpha" in second and "beta" in second
+
+    def test_oldest_day_is_whole_so_later_runs_reuse_it(self, tmp_path: Path, capsys, monkeypatch) -> None:
+        # given
+        _init_repo(tmp_path / "alpha")
+        day = (datetime.now() - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
+        for hour in (1, 23):
+            stamp = f"{int((day + timedelta(hours=hour)).timestamp())} +0000"
+            subprocess.run(
+                ["git", "-C", str(tmp_path / "alpha"), "commit", "--allow-empty", "-m", f"at {hour}"],
+                check=True,
+                capture_output=True,
+                env={**os.environ, "GIT_AUTHOR_DATE": stamp, "GIT_COMMITTER_DATE": stamp},
+            )
+        starts = iter([day + timedelta(minutes=30), day + timedelta(hours=2)])
+        monkeypatch.setattr("gitgossip.commands.digest.parse_since", lambda _since: next(starts).isoformat())
+
+        # when
+        digest_cmd(str(tmp_path), since="2days", use_mock=True)
+        first = capsys.readouterr().out
+        digest_cmd(str(tmp_path), since="2days", use_mock=True)
+        second = capsys.readouterr().out
+
+        # then
+        assert f"{day:%Y-%m-%d}" in first
+        assert "0 new commits ingested" in second
+        assert "0 summaries generated" in second
+        assert "2 commits" in second
+
+    def test_database_errors_are_reported(self, tmp_path: Path, capsys) -> None:
+        # given
+        _init_repo(tmp_path / "alpha")
+
+        # when
+        with (
+            patch("gitgossip.commands.digest.DigestStore", side_effect=sqlite3.OperationalError("database is locked")),
+            pytest.raises(typer.Exit) as exc_info,
+        ):
+            digest_cmd(str(tmp_path), since="1days", use_mock=True)
+
+        # then
+        assert exc_info.value.exit_code == 1
+        assert "database is locked" in capsys.readouterr().out
+
+    def test_invalid_author_pattern_is_a_usage_error(self, tmp_path: Path) -> None:
+        # given
+        _init_repo(tmp_path / "alpha")
+
+        # when / then
+        with pytest.raises(typer.BadParameter, match="Invalid regular expression"):
+            digest_cmd(str(tmp_path), since="1days", author="(unclosed", use_mock=True)
@@ -0,0 +1,147 @@
+"""Unit tests for the list-authors command and AuthorService."""
+
+import json
+import os
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import typer
+
+from gitgossip.commands.list_authors import list_all_authors
+from gitgossip.core.services.author_service import AuthorService
+from gitgossip.core.storage.author_index import AuthorIndex
+
+
+def _commit(repo: Path, name: str, email: str, filename: str) -> None:
+    (repo / filename).write_text(filename, encoding="utf-8")
+    subprocess.run(["git", "-C", str(repo), "add", filename], check=True)
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", f"user.name={name}", "-c", f"user.email={email}", "commit", "-m", filename],
+        check=True,
+        capture_output=True,
+    )
+
+
+def _init_repo(path: Path) -> Path:
+    path.mkdir(parents=True)
+    subprocess.run(["git", "init", "-b", "main", str(path)], check=True, capture_output=True)
+    subprocess.run(["git", "-C", str(path), "config", "commit.gpgsign", "false"], check=True)
+    return path
+
+
+@pytest.fixture()
+def workspace(tmp_path: Path) -> Path:
+    """Two repositories sharing one author under different spellings, merged by .mailmap."""
+    alpha = _init_repo(tmp_path / "alpha")
+    _commit(alpha, "Alice", "alice@example.com", "a1")
+    _commit(alpha, "alice-laptop", "alice@old.example.com", "a2")
+    (alpha / ".mailmap").write_text("Alice <alice@example.com> <alice@old.example.com>\n", encoding="utf-8")
+    beta = _init_repo(tmp_path / "beta")
+    _commit(beta, "Alice", "Alice@Example.com", "b1")
+    _commit(beta, "Bob", "bob@example.com", "b2")
+    return tmp_path
+
+
+class TestAuthorService:
+    """Verify author aggregation across repositories."""
+
+    def test_collect_merges_identities_and_counts_commits(self, workspace: Path) -> None:
+        # when
+        authors, errors = AuthorService().collect([workspace / "alpha", workspace / "beta"])
+
+        # then
+        assert errors == {}
+        assert [(a.name, a.email, a.commits, a.repositories) for a in authors] == [
+            ("Alice", "alice@example.com", 3, ["alpha", "beta"]),
+            ("Bob", "bob@example.com", 1, ["beta"]),
+        ]
+
+    def test_activity_tracks_first_and_last_seen(self, workspace: Path) -> None:
+        # given
+        repo = workspace / "beta"
+        for stamp in ("2024-01-01T00:00:00+00:00", "2024-06-01T00:00:00+00:00", "2024-03-01T00:00:00+00:00"):
+            (repo / "c").write_text(stamp, encoding="utf-8")
+            subprocess.run(["git", "-C", str(repo), "add", "c"], check=True)
+            subprocess.run(
+                [
+                    "git",
+                    "-C",
+                    str(repo),
+                    "-c",
+                    "user.name=Carol",
+                    "-c",
+                    "user.email=carol@example.com",
+                    "commit",
+                    "-m",
+                    stamp,
+                ],
+                check=True,
+                capture_output=True,
+                env={**os.environ, "GIT_COMMITTER_DATE": stamp},
+            )
+
+        # when
+        activity = {entry.email: entry for entry in AuthorIndex(repo).refresh().activity()}
+
+        # then
+        carol = activity["carol@example.com"]
+        assert carol.commits == 3
+        assert carol.first_seen == int(datetime.fromisoformat("2024-01-01T00:00:00+00:00").timestamp())
+        assert carol.last_seen == int(datetime.fromisoformat("2024-06-01T00:00:00+00:00").timestamp())
+        assert activity["bob@example.com"].commits == 1
+
+    def test_collect_reports_failing_repos_without_stopping(self, workspace: Path) -> None:
+        # given
+        empty = _init_repo(workspace / "empty")
+
+        # when
+        authors, errors = AuthorService().collect([workspace / "beta", empty])
+
+        # then
+        assert [a.name for a in authors] == ["Alice", "Bob"]
+        assert list(errors) == [empty]
+
+
+class TestListAuthorsCommand:
+    """Verify list-authors output for single and multiple repositories."""
+
+    def test_multi_repo_lists_authors_with_counts(self, workspace: Path, capsys) -> None:
+        # when
+        list_all_authors(str(workspace), since="15days", all_commits=True)
+
+        # then
+        output = capsys.readouterr().out
+        assert "All authors across 2 repositories" in output
+        assert "1. Alice <alice@example.com> — 3 commits, last " in output
+        assert " in alpha, beta" in output
+        assert "Total unique authors: 2" in output
+
+    def test_no_commits_in_range_exits_0(self, workspace: Path) -> None:
+        # when / then
+        with pytest.raises(typer.Exit) as exc_info:
+            list_all_authors(str(workspace / "beta"), since="2099-01-01", all_commits=False)
+        assert exc_info.value.exit_code == 0
+
+    def test_json_streams_repository_records_then_merged_authors(self, workspace: Path, capsys) -> None:
+        # when
+        list_all_authors(str(workspace), since="15days", all_commits=True, output_format="json")
+        first = json.loads(capsys.readouterr().out)
+        list_all_authors(str(workspace), since="15days", all_commits=True, output_format="json")
+        second = json.loads(capsys.readouterr().out)
+
+        # then
+        *repos, merged = first
+        assert [(r["type"], r["name"], r["status"]) for r in repos] == [
+            ("repository", "alpha", "ok"),
+            ("repository", "beta", "ok"),
+        ]
+        assert [(a["name"], a["commits"]) for a in repos[1]["authors"]] == [("Alice", 1), ("Bob", 1)]
+        assert merged["type"] == "authors"
+        assert [(a["email"], a["commits"]) for a in merged["authors"]] == [
+            ("alice@example.com", 3),
+            ("bob@example.com", 1),
+        ]
+        assert [r["cache"]["author_index"] for r in first[:-1]] == ["rebuilt", "rebuilt"]
+        assert [r["cache"]["author_index"] for r in second[:-1]] == ["current", "current"]
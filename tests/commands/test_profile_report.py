@@ -0,0 +1,44 @@
+"""Unit tests for the --profile report."""
+
+from rich.console import Console
+
+from gitgossip.commands.profile_report import report_profile
+from gitgossip.utils import profiler
+from gitgossip.utils.profiler import phase
+
+
+class TestReportProfile:
+    """Verify the rendered phase breakdown."""
+
+    def test_lists_phases_other_and_total(self) -> None:
+        # given
+        running = profiler.start()
+        with phase("discovery"):
+            pass
+        profiler.stop()
+        console = Console(record=True, width=120)
+
+        # when
+        report_profile(running, console)
+
+        # then
+        text = console.export_text()
+        assert "discovery" in text
+        assert "other" in text
+        assert "TOTAL" in text
+
+    def test_memory_column_appears_with_memory_tracking(self) -> None:
+        # given
+        running = profiler.start(memory=True)
+        with phase("chunk"):
+            pass
+        profiler.stop()
+        console = Console(record=True, width=120)
+
+        # when
+        report_profile(running, console)
+
+        # then
+        text = console.export_text()
+        assert "Peak (MiB)" in text
+        assert "tracemalloc" in text
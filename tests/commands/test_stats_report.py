@@ -0,0 +1,58 @@
+"""Unit tests for the LLM stats report."""
+
+import json
+from pathlib import Path
+
+from rich.console import Console
+
+from gitgossip.commands.stats_report import report_stats
+from gitgossip.core.llm.telemetry import LLMStatsRecorder
+
+
+def _recorder() -> LLMStatsRecorder:
+    recorder = LLMStatsRecorder()
+    with recorder.track("summarize_diff_chunk") as call:
+        call.wall_ms = 1500.0
+        call.prompt_tokens = 400
+        call.completion_tokens = 60
+    return recorder
+
+
+class TestReportStats:
+    """Verify table rendering and JSON-lines persistence."""
+
+    def test_table_lists_operations_and_total(self) -> None:
+        # given
+        console = Console(record=True, width=200)
+
+        # when
+        report_stats(_recorder(), console, command="summarize-mr", show_table=True, json_path=None)
+
+        # then
+        output = console.export_text()
+        assert "summarize_diff_chunk" in output
+        assert "TOTAL" in output
+        assert "40.0" in output  # 60 tokens / 1.5 s
+
+    def test_json_file_is_appended_per_run(self, tmp_path: Path) -> None:
+        # given
+        stats_file = tmp_path / "stats" / "runs.jsonl"
+
+        # when
+        report_stats(_recorder(), Console(), command="summarize-mr", show_table=False, json_path=str(stats_file))
+        report_stats(_recorder(), Console(), command="summarize-mr", show_table=False, json_path=str(stats_file))
+
+        # then
+        lines = stats_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        record = json.loads(lines[0])
+        assert record["command"] == "summarize-mr"
+        assert record["operations"][0]["completion_tokens"] == 60
+        assert record["calls"][0]["wall_ms"] == 1500.0
+
+    def test_no_recorder_is_noop(self, tmp_path: Path) -> None:
+        # when
+        report_stats(None, Console(), command="summarize", show_table=True, json_path=str(tmp_path / "x.jsonl"))
+
+        # then
+        assert not (tmp_path / "x.jsonl").exists()
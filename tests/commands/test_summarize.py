@@ -0,0 +1,123 @@
+"""Unit tests for the summarize command."""
+
+import json
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from gitgossip.commands.summarize import summarize_cmd
+from gitgossip.core.factories.llm_analyzer_factory import LLMAnalyzerFactory
+from gitgossip.core.interfaces.chat_client import IChatClient
+from gitgossip.core.llm import telemetry
+from gitgossip.core.llm.llm_analyzer import LLMAnalyzer
+from gitgossip.core.services.repo_discovery_service import RepoDiscoveryService
+
+
+def _init_repo(path: Path) -> None:
+    path.mkdir()
+    subprocess.run(["git", "init", "-b", "main", str(path)], check=True, capture_output=True)
+    subprocess.run(["git", "-C", str(path), "config", "user.email", "t@t.com"], check=True)
+    subprocess.run(["git", "-C", str(path), "config", "user.name", "t"], check=True)
+    subprocess.run(["git", "-C", str(path), "config", "commit.gpgsign", "false"], check=True)
+    (path / "a.txt").write_text("one\n", encoding="utf-8")
+    subprocess.run(["git", "-C", str(path), "add", "a.txt"], check=True)
+    subprocess.run(["git", "-C", str(path), "commit", "-m", "init"], check=True, capture_output=True)
+
+
+class _CachingChatClient(IChatClient):
+    """Chat client that reports a prefix-cache hit the way the OpenAI client does."""
+
+    def complete(self, system: str, user: str, temperature: float, max_tokens: int) -> str:
+        telemetry.record_usage(120, 30, model="m", cached_tokens=100)
+        return "- summary"
+
+
+def _factory() -> SimpleNamespace:
+    """Stand in for LLMAnalyzerFactory, building a real analyzer around `_CachingChatClient`."""
+    return SimpleNamespace(
+        get_analyzer=lambda use_mock, stats_recorder, show_status: LLMAnalyzer(
+            chat_client=_CachingChatClient(), stats_recorder=stats_recorder, show_status=show_status
+        )
+    )
+
+
+class TestSummarizeCommand:
+    """Verify multi-repo summarize wiring."""
+
+    def test_analyzer_is_built_once_for_all_repositories(self, tmp_path: Path) -> None:
+        # given
+        for name in ("alpha", "beta", "gamma"):
+            _init_repo(tmp_path / name)
+
+        # when
+        with (
+            patch("gitgossip.commands.summarize.LLMAnalyzerFactory", wraps=LLMAnalyzerFactory) as mock_factory_cls,
+            patch("gitgossip.commands.summarize.SummarizerService") as mock_service_cls,
+        ):
+            mock_service_cls.return_value.summarize_repository.return_value = "summary"
+            summarize_cmd(str(tmp_path), use_mock=True)
+
+        # then
+        assert mock_factory_cls.call_count == 1
+        assert mock_service_cls.call_count == 3
+        analyzers = {id(call.kwargs["llm_analyzer"]) for call in mock_service_cls.call_args_list}
+        assert len(analyzers) == 1
+
+    def test_jobs_summarizes_every_repository(self, tmp_path: Path, capsys) -> None:
+        # given
+        for name in ("alpha", "beta", "gamma"):
+            _init_repo(tmp_path / name)
+
+        # when
+        summarize_cmd(str(tmp_path), use_mock=True, jobs=3, ordered=True)
+
+        # then
+        output = capsys.readouterr().out
+        discovered = [repo.name for repo in RepoDiscoveryService(base_dir=tmp_path).find_repositories()]
+        positions = [output.index(f"AI Summary for {name}") for name in discovered]
+        assert positions == sorted(positions)
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_ndjson_emits_one_record_per_repository(self, tmp_path: Path, capsys, jobs: int) -> None:
+        # given
+        for name in ("alpha", "beta", "gamma"):
+            _init_repo(tmp_path / name)
+
+        # when
+        with patch("gitgossip.commands.summarize.LLMAnalyzerFactory", _factory):
+            summarize_cmd(str(tmp_path), since="2000-01-01", jobs=jobs, output_format="ndjson")
+
+        # then
+        captured = capsys.readouterr()
+        records = [json.loads(line) for line in captured.out.splitlines()]
+        assert sorted(r["name"] for r in records) == ["alpha", "beta", "gamma"]
+        assert {r["status"] for r in records} == {"ok"}
+        assert all(r["summary"] == "- summary" for r in records)
+        assert all(r["timings"]["llm_calls"] == 1 and r["timings"]["elapsed_ms"] >= 0 for r in records)
+        assert all(r["cache"] == {"prompt_tokens": 120, "cached_tokens": 100, "hit": True} for r in records)
+        assert "Found 3 repositories" in captured.err
+        assert "AI Summary" not in captured.out + captured.err
+
+    def test_empty_repository_is_reported_the_same_with_and_without_jobs(
+        self, tmp_path: Path, capsys, monkeypatch
+    ) -> None:
+        # given
+        monkeypatch.setenv("GIT_AUTHOR_DATE", "2001-01-01T00:00:00")
+        monkeypatch.setenv("GIT_COMMITTER_DATE", "2001-01-01T00:00:00")
+        _init_repo(tmp_path / "alpha")
+        records = {}
+
+        # when
+        for jobs in (1, 4):
+            summarize_cmd(str(tmp_path), since="2020-01-01", use_mock=True, jobs=jobs, output_format="ndjson")
+            records[jobs] = json.loads(capsys.readouterr().out)
+
+        # then
+        for record in records.values():
+            del record["timings"]["elapsed_ms"]
+        assert records[1] == records[4]
+        assert records[1]["status"] == "empty"
+        assert records[1]["summary"] == ""
@@ -1,5 +1,8 @@
 """Unit tests for ConfigService (GitGossip configuration persistence)."""
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -133,3 +136,88 @@ class TestConfigService:
         # then
         assert "llm" in result
         assert result["llm"]["provider"] == "local"
+
+    def test_repeated_loads_do_not_parse_yaml(self, temp_config_path: Path) -> None:
+        # given
+        ConfigService(config_path=temp_config_path).save({"llm": {"provider": "cloud"}})
+        ConfigService._memo.clear()
+        ConfigService(config_path=temp_config_path).load()  # served from the snapshot written by save
+
+        # when
+        service = ConfigService(config_path=temp_config_path)
+        loaded = service.load()
+
+        # then
+        assert loaded == {"llm": {"provider": "cloud"}}
+        assert service._yaml is None
+
+    def test_loads_return_independent_copies(self, temp_config_path: Path) -> None:
+        # given
+        service = ConfigService(config_path=temp_config_path)
+        service.save({"llm": {"provider": "cloud"}})
+
+        # when
+        service.load()["llm"]["provider"] = "mutated"
+
+        # then
+        assert service.load()["llm"]["provider"] == "cloud"
+
+    def test_edited_file_is_parsed_again(self, temp_config_path: Path) -> None:
+        # given
+        service = ConfigService(config_path=temp_config_path)
+        service.save({"llm": {"provider": "cloud"}})
+
+        # when
+        temp_config_path.write_text("llm:\n  provider: agent\n  agent_cli: codex\n", encoding="utf-8")
+
+        # then
+        assert service.load()["llm"] == {"provider": "agent", "agent_cli": "codex"}
+
+    def test_snapshot_is_private(self, temp_config_path: Path) -> None:
+        # given
+        service = ConfigService(config_path=temp_config_path)
+
+        # when
+        service.save({"llm": {"api_key": "sk-secret"}})
+
+        # then
+        snapshots = list(ConfigService.SNAPSHOT_DIR.glob("*.json"))
+        assert len(snapshots) == 1
+        assert snapshots[0].stat().st_mode & 0o777 == 0o600
+
+    def test_load_for_edit_keeps_comments(self, temp_config_path: Path) -> None:
+        # given
+        temp_config_path.write_text("llm:\n  provider: local  # keep me\n", encoding="utf-8")
+        service = ConfigService(config_path=temp_config_path)
+
+        # when
+        cfg = service.load_for_edit()
+        cfg["llm"]["model"] = "m"
+        service.save(cfg)
+
+        # then
+        assert "# keep me" in temp_config_path.read_text(encoding="utf-8")
+
+    def test_read_only_process_skips_ruamel(self, tmp_path: Path) -> None:
+        # given: a config already loaded once (which writes the snapshot)
+        code = (
+            "import sys; from gitgossip.config.config_service import ConfigService; "
+            "print(ConfigService().load()['llm']['provider'], 'ruamel.yaml' in sys.modules)"
+        )
+        config = tmp_path / ".gitgossip" / "config.yaml"
+        config.parent.mkdir()
+        config.write_text("llm:\n  provider: cloud\n", encoding="utf-8")
+        env = {**os.environ, "HOME": str(tmp_path)}
+        repo_root = Path(__file__).resolve().parents[2]
+
+        def run() -> str:
+            return subprocess.run(
+                [sys.executable, "-c", code], cwd=repo_root, env=env, capture_output=True, text=True, check=True
+            ).stdout.strip()
+
+        # when
+        first, second = run(), run()
+
+        # then
+        assert first == "cloud True"
+        assert second == "cloud False"
@@ -0,0 +1,25 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+from gitgossip.config.config_service import ConfigService
+from gitgossip.core.storage.author_index import AuthorIndex
+from gitgossip.core.storage.commit_message_cache import CommitMessageCache
+from gitgossip.core.storage.digest_store import DigestStore
+from gitgossip.core.storage.discovery_cache import DiscoveryCache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep on-disk caches (and any running daemon) out of the real ``~/.gitgossip`` during tests."""
+    cache_dir = tmp_path_factory.mktemp("gitgossip-cache")
+    monkeypatch.setattr(DiscoveryCache, "DEFAULT_PATH", cache_dir / "discovery.json")
+    monkeypatch.setattr(AuthorIndex, "DEFAULT_DIR", cache_dir / "authors")
+    monkeypatch.setattr(CommitMessageCache, "DEFAULT_PATH", cache_dir / "commit_messages.json")
+    monkeypatch.setattr(DigestStore, "DEFAULT_PATH", cache_dir / "digest.sqlite3")
+    monkeypatch.setattr(ConfigService, "SNAPSHOT_DIR", cache_dir / "config")
+    monkeypatch.setattr(ConfigService, "_memo", {})
+    monkeypatch.setenv("GITGOSSIP_SOCKET", str(cache_dir / "daemon.sock"))
+    return cache_dir
@@ -33,7 +33,16 @@ class TestLLMAnalyzerFactory:
 
         # then
         assert isinstance(analyzer, LLMAnalyzer)
-        mock_openai_client.assert_called_once_with(base_url="http://x/v1", model="qwen2.5-coder:1.5b", api_key="local")
+        mock_openai_client.assert_called_once_with(
+            base_url="http://x/v1",
+            model="qwen2.5-coder:1.5b",
+            api_key="local",
+            max_retries=2,
+            stream=False,
+            cache_hints={"cache_prompt": True, "keep_alive": "30m"},
+            pool_size=10,
+            keepalive_expiry=30.0,
+        )
 
     @patch("gitgossip.core.factories.llm_analyzer_factory.AgentCliChatClient")
     @patch("gitgossip.core.factories.llm_analyzer_factory.ConfigService")
@@ -74,3 +83,53 @@ class TestLLMAnalyzerFactory:
         # when / then
         with pytest.raises(ValueError, match="gitgossip init"):
             LLMAnalyzerFactory().get_analyzer()
+
+    @patch("gitgossip.core.factories.llm_analyzer_factory.HedgedChatClient")
+    @patch("gitgossip.core.factories.llm_analyzer_factory.OpenAIChatClient")
+    @patch("gitgossip.core.factories.llm_analyzer_factory.ConfigService")
+    def test_fallbacks_wrap_clients_in_hedged_client(self, mock_config_cls, mock_openai_client, mock_hedged) -> None:
+        # given
+        mock_config_cls.return_value.load.return_value = {
+            "llm": {
+                "provider": "local",
+                "model": "qwen2.5-coder:1.5b",
+                "base_url": "http://localhost:11434/v1",
+                "api_key": "local",
+                "hedge_after": 4,
+                "fallbacks": [
+                    {"provider": "cloud", "model": "gpt-4o-mini", "base_url": "https://api.openai.com/v1"},
+                ],
+            },
+            "paths": {"prompts": "/tmp/prompts"},
+        }
+
+        # when
+        LLMAnalyzerFactory().get_analyzer()
+
+        # then
+        assert mock_openai_client.call_count == 2
+        kwargs = mock_hedged.call_args.kwargs
+        assert len(kwargs["providers"]) == 2
+        assert kwargs["hedge_after"] == 4.0
+        assert kwargs["names"] == ["local:qwen2.5-coder:1.5b", "cloud:gpt-4o-mini"]
+
+    @patch("gitgossip.core.factories.llm_analyzer_factory.OpenAIChatClient")
+    @patch("gitgossip.core.factories.llm_analyzer_factory.ConfigService")
+    def test_warm_clients_are_reused_per_configuration(
+        self, mock_config_cls, mock_openai_client, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # given
+        monkeypatch.setattr(LLMAnalyzerFactory, "_warm_clients", None)
+        mock_config_cls.return_value.load.return_value = {
+            "llm": {"provider": "local", "model": "m", "base_url": "http://x/v1", "api_key": "local"},
+        }
+        LLMAnalyzerFactory.keep_clients_warm()
+
+        # when
+        LLMAnalyzerFactory().get_analyzer()
+        LLMAnalyzerFactory().get_analyzer()
+        mock_config_cls.return_value.load.return_value["llm"]["model"] = "other"
+        LLMAnalyzerFactory().get_analyzer()
+
+        # then
+        assert mock_openai_client.call_count == 2
@@ -0,0 +1,163 @@
+"""Unit tests for HedgedChatClient and LatencyHistogram."""
+
+import threading
+import time
+
+import pytest
+
+from gitgossip.core.interfaces.chat_client import IChatClient
+from gitgossip.core.llm import telemetry
+from gitgossip.core.llm.clients.hedged_chat_client import HedgedChatClient
+from gitgossip.core.llm.errors import ChatClientError
+from gitgossip.core.llm.latency_histogram import LatencyHistogram
+from gitgossip.core.llm.telemetry import LLMStatsRecorder
+
+
+class SlowChatClient(IChatClient):
+    """Chat client that sleeps before answering (or raising)."""
+
+    def __init__(self, reply: str, delay: float = 0.0, error: ChatClientError | None = None) -> None:
+        self.reply = reply
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.release = threading.Event()
+
+    def complete(self, system: str, user: str, temperature: float, max_tokens: int) -> str:
+        self.calls += 1
+        self.release.wait(self.delay)
+        if self.error:
+            raise self.error
+        return self.reply
+
+
+class ReportingChatClient(SlowChatClient):
+    """Slow chat client that reports a retry and its usage to telemetry before answering."""
+
+    def __init__(self, reply: str, delay: float = 0.0, prompt_tokens: int = 0) -> None:
+        super().__init__(reply, delay)
+        self.prompt_tokens = prompt_tokens
+        self.reported = threading.Event()
+
+    def complete(self, system: str, user: str, temperature: float, max_tokens: int) -> str:
+        reply = super().complete(system=system, user=user, temperature=temperature, max_tokens=max_tokens)
+        telemetry.record_retry()
+        telemetry.record_usage(self.prompt_tokens, 1, model=self.reply)
+        self.reported.set()
+        return reply
+
+
+class TestHedgedChatClient:
+    """Verify hedging, fallback, and latency tracking."""
+
+    def test_fast_primary_wins_without_hedging(self) -> None:
+        # given
+        primary = SlowChatClient("primary")
+        secondary = SlowChatClient("secondary")
+        client = HedgedChatClient([primary, secondary], hedge_after=1.0)
+
+        # when
+        result = client.complete(system="s", user="u", temperature=0.3, max_tokens=10)
+
+        # then
+        assert result == "primary"
+        assert secondary.calls == 0
+
+    def test_slow_primary_is_hedged_to_secondary(self) -> None:
+        # given
+        primary = SlowChatClient("primary", delay=5.0)
+        secondary = SlowChatClient("secondary")
+        client = HedgedChatClient([primary, secondary], hedge_after=0.05)
+
+        # when
+        started = time.perf_counter()
+        result = client.complete(system="s", user="u", temperature=0.3, max_tokens=10)
+        elapsed = time.perf_counter() - started
+        primary.release.set()
+
+        # then
+        assert result == "secondary"
+        assert elapsed < 2.0
+
+    def test_failing_primary_falls_back_immediately(self) -> None:
+        # given
+        primary = SlowChatClient("primary", error=ChatClientError("connection refused"))
+        secondary = SlowChatClient("secondary")
+        client = HedgedChatClient([primary, secondary], hedge_after=None)
+
+        # when
+        result = client.complete(system="s", user="u", temperature=0.3, max_tokens=10)
+
+        # then
+        assert result == "secondary"
+
+    def test_all_providers_failing_raises(self) -> None:
+        # given
+        client = HedgedChatClient(
+            [SlowChatClient("a", error=ChatClientError("down")), SlowChatClient("b", error=ChatClientError("busy"))],
+            names=["local", "cloud"],
+        )
+
+        # when / then
+        with pytest.raises(ChatClientError, match="local: down; cloud: busy"):
+            client.complete(system="s", user="u", temperature=0.3, max_tokens=10)
+
+    def test_hedge_delay_uses_observed_percentile_once_warm(self) -> None:
+        # given
+        client = HedgedChatClient([SlowChatClient("a"), SlowChatClient("b")], hedge_after=30.0, min_samples=3)
+        assert client.hedge_delay(0) == 30.0
+
+        # when
+        for _ in range(3):
+            client.complete(system="s", user="u", temperature=0.3, max_tokens=10)
+
+        # then
+        delay = client.hedge_delay(0)
+        assert delay is not None
+        assert delay < 1.0
+        assert client.histograms["provider-0"].count == 3
+
+    def test_only_the_winning_attempt_reaches_the_call_record(self) -> None:
+        # given
+        recorder = LLMStatsRecorder()
+        primary = ReportingChatClient("primary", delay=5.0, prompt_tokens=999)
+        secondary = ReportingChatClient("secondary", prompt_tokens=7)
+        client = HedgedChatClient([primary, secondary], hedge_after=0.05)
+
+        # when
+        with recorder.track("op") as call:
+            result = client.complete(system="s", user="u", temperature=0.3, max_tokens=10)
+        primary.release.set()
+        assert primary.reported.wait(2.0)
+
+        # then
+        assert result == "secondary"
+        assert (call.model, call.prompt_tokens, call.retries) == ("secondary", 7, 1)
+
+    def test_requires_at_least_one_provider(self) -> None:
+        # when / then
+        with pytest.raises(ValueError):
+            HedgedChatClient([])
+
+
+class TestLatencyHistogram:
+    """Verify percentile estimation and decay."""
+
+    def test_percentile_tracks_recent_observations(self) -> None:
+        # given
+        histogram = LatencyHistogram(decay=0.5)
+        for _ in range(10):
+            histogram.record(0.1)
+
+        # when
+        for _ in range(10):
+            histogram.record(20.0)
+
+        # then
+        percentile = histogram.percentile(0.5)
+        assert percentile is not None
+        assert percentile >= 20.0
+
+    def test_empty_histogram_has_no_percentile(self) -> None:
+        # then
+        assert LatencyHistogram().percentile(0.95) is None
@@ -7,6 +7,7 @@ from openai import APIConnectionError
 
 from gitgossip.core.llm.clients.openai_chat_client import OpenAIChatClient
 from gitgossip.core.llm.errors import ChatClientError
+from gitgossip.core.llm.telemetry import LLMStatsRecorder
 
 
 class TestOpenAIChatClient:
@@ -51,8 +52,83 @@ class TestOpenAIChatClient:
         # given
         mock_client = mock_openai_cls.return_value
         mock_client.chat.completions.create.side_effect = APIConnectionError(request=MagicMock())
-        client = OpenAIChatClient(base_url="http://x/v1", model="m")
+        client = OpenAIChatClient(base_url="http://x/v1", model="m", retry_backoff=0)
 
         # when / then
         with pytest.raises(ChatClientError):
             client.complete(system="s", user="u", temperature=0.3, max_tokens=100)
+
+    @patch("gitgossip.core.llm.clients.openai_chat_client.OpenAI")
+    def test_complete_retries_transient_errors_and_records_stats(self, mock_openai_cls) -> None:
+        # given
+        mock_client = mock_openai_cls.return_value
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = "ok"
+        mock_response.usage.prompt_tokens = 120
+        mock_response.usage.completion_tokens = 30
+        mock_response.model = "m"
+        mock_client.chat.completions.create.side_effect = [APIConnectionError(request=MagicMock()), mock_response]
+        client = OpenAIChatClient(base_url="http://x/v1", model="m", max_retries=2, retry_backoff=0)
+        recorder = LLMStatsRecorder()
+
+        # when
+        with recorder.track("op") as call:
+            result = client.complete(system="s", user="u", temperature=0.3, max_tokens=100)
+
+        # then
+        assert result == "ok"
+        assert call.retries == 1
+        assert call.prompt_tokens == 120
+        assert call.completion_tokens == 30
+
+    @patch("gitgossip.core.llm.clients.openai_chat_client.OpenAI")
+    def test_streaming_joins_deltas_and_records_ttft(self, mock_openai_cls) -> None:
+        # given
+        def chunk(content, usage=None):
+            item = MagicMock()
+            item.choices = [MagicMock()] if content is not None else []
+            if content is not None:
+                item.choices[0].delta.content = content
+            item.usage = usage
+            item.model = "m"
+            return item
+
+        usage = MagicMock(prompt_tokens=10, completion_tokens=2)
+        mock_openai_cls.return_value.chat.completions.create.return_value = iter(
+            [chunk("hel"), chunk("lo"), chunk(None, usage=usage)]
+        )
+        client = OpenAIChatClient(base_url="http://x/v1", model="m", stream=True)
+        recorder = LLMStatsRecorder()
+
+        # when
+        with recorder.track("op") as call:
+            result = client.complete(system="s", user="u", temperature=0.3, max_tokens=100)
+
+        # then
+        assert result == "hello"
+        assert call.ttft_ms is not None
+        assert call.completion_tokens == 2
+
+    @patch("gitgossip.core.llm.clients.openai_chat_client.OpenAI")
+    def test_cache_hints_are_sent_as_extra_body(self, mock_openai_cls) -> None:
+        # given
+        mock_client = mock_openai_cls.return_value
+        mock_client.chat.completions.create.return_value.choices[0].message.content = "ok"
+        client = OpenAIChatClient(base_url="http://x/v1", model="m", cache_hints={"cache_prompt": True})
+
+        # when
+        client.complete(system="s", user="u", temperature=0.3, max_tokens=100)
+
+        # then
+        assert mock_client.chat.completions.create.call_args.kwargs["extra_body"] == {"cache_prompt": True}
+
+    @patch("gitgossip.core.llm.clients.openai_chat_client.DefaultHttpxClient")
+    @patch("gitgossip.core.llm.clients.openai_chat_client.OpenAI")
+    def test_http_client_uses_configured_pool(self, mock_openai_cls, mock_http_client_cls) -> None:
+        # when
+        OpenAIChatClient(base_url="http://x/v1", model="m", pool_size=4, keepalive_expiry=12.5)
+
+        # then
+        limits = mock_http_client_cls.call_args.kwargs["limits"]
+        assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (4, 4, 12.5)
+        assert mock_openai_cls.call_args.kwargs["http_client"] is mock_http_client_cls.return_value
@@ -3,6 +3,7 @@
 from gitgossip.core.interfaces.chat_client import IChatClient
 from gitgossip.core.llm.errors import ChatClientError
 from gitgossip.core.llm.llm_analyzer import LLMAnalyzer
+from gitgossip.core.llm.telemetry import LLMStatsRecorder
 from gitgossip.core.models.commit import Commit
 
 
@@ -121,3 +122,31 @@ class TestLLMAnalyzerTransport:
         # then
         assert result.startswith("[LLM ERROR]")
         assert client.calls == []
+
+    def test_stats_recorder_tracks_each_call(self) -> None:
+        # given
+        recorder = LLMStatsRecorder()
+        analyzer = LLMAnalyzer(chat_client=FakeChatClient(reply="chunk summary"), stats_recorder=recorder)
+
+        # when
+        analyzer.summarize_diff_chunk("+ new line", metadata="[Part 1/1]")
+        analyzer.synthesize_chunk_summaries(["a", "b"])
+
+        # then
+        calls = recorder.calls
+        assert [c.operation for c in calls] == ["summarize_diff_chunk", "synthesize_chunk_summaries"]
+        assert all(c.ok and c.tokens_estimated for c in calls)
+        assert all(c.prompt_tokens and c.completion_tokens for c in calls)
+        assert recorder.aggregate()[-1]["calls"] == 2
+
+    def test_stats_recorder_marks_failed_calls(self) -> None:
+        # given
+        recorder = LLMStatsRecorder()
+        analyzer = LLMAnalyzer(chat_client=FakeChatClient(error=ChatClientError("boom")), stats_recorder=recorder)
+
+        # when
+        analyzer.generate_commit_message("diff --git a/w.py b/w.py\n+widget", "w.py")
+
+        # then
+        assert recorder.calls[0].ok is False
+        assert recorder.aggregate()[-1]["failures"] == 1
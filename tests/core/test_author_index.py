@@ -0,0 +1,117 @@
+"""Unit tests for the persistent AuthorIndex and its use by CommitParser."""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from git.exc import GitCommandError
+
+from gitgossip.core.parsers.commit_parser import CommitParser
+from gitgossip.core.providers.git_repo_provider import GitRepoProvider
+from gitgossip.core.storage import author_index
+from gitgossip.core.storage.author_index import AuthorIndex
+
+
+def _commit(repo: Path, name: str, email: str, timestamp: int) -> str:
+    (repo / "f.txt").write_text(f"{name} {timestamp}", encoding="utf-8")
+    subprocess.run(["git", "-C", str(repo), "add", "f.txt"], check=True)
+    date = f"@{timestamp} +0000"
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", f"user.name={name}", "-c", f"user.email={email}", "commit", "-m", name],
+        check=True,
+        capture_output=True,
+        env={**os.environ, "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date},
+    )
+    return subprocess.run(
+        ["git", "-C", str(repo), "rev-parse", "HEAD"], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    """A repository with commits by Alice (two) and Bob (one)."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    subprocess.run(["git", "init", "-b", "main", str(path)], check=True, capture_output=True)
+    subprocess.run(["git", "-C", str(path), "config", "commit.gpgsign", "false"], check=True)
+    _commit(path, "Alice", "alice@example.com", 1_700_000_000)
+    _commit(path, "Bob", "bob@example.com", 1_700_000_100)
+    _commit(path, "Alice", "alice@example.com", 1_700_000_200)
+    return path
+
+
+class TestAuthorIndex:
+    """Verify build, incremental refresh and queries."""
+
+    def test_activity_and_since_filter(self, repo: Path) -> None:
+        # when
+        index = AuthorIndex(repo).refresh()
+
+        # then
+        assert sorted(index.activity()) == [
+            ("Alice", "alice@example.com", 2, 1_700_000_000, 1_700_000_200),
+            ("Bob", "bob@example.com", 1, 1_700_000_100, 1_700_000_100),
+        ]
+        assert [a.name for a in index.activity(since_ts=1_700_000_150)] == ["Alice"]
+
+    def test_refresh_reads_only_new_commits(self, repo: Path) -> None:
+        # given
+        old_tip = AuthorIndex(repo).refresh().tip
+        new_tip = _commit(repo, "Carol", "carol@example.com", 1_700_000_300)
+
+        # when
+        with patch.object(author_index, "iter_git_records", wraps=author_index.iter_git_records) as spy:
+            index = AuthorIndex(repo).refresh()
+            AuthorIndex(repo).refresh()
+
+        # then
+        assert spy.call_count == 1
+        assert spy.call_args.args[0][-1] == f"{old_tip}..{new_tip}"
+        assert index.tip == new_tip
+        assert len(index.activity()) == 3
+
+    def test_rewritten_history_triggers_rebuild(self, repo: Path) -> None:
+        # given
+        AuthorIndex(repo).refresh()
+        subprocess.run(["git", "-C", str(repo), "reset", "--hard", "HEAD~2"], check=True, capture_output=True)
+        _commit(repo, "Dave", "dave@example.com", 1_700_000_400)
+
+        # when
+        index = AuthorIndex(repo).refresh()
+
+        # then
+        assert sorted(a.name for a in index.activity()) == ["Alice", "Dave"]
+
+    def test_commits_by_matches_like_git_author(self, repo: Path) -> None:
+        # when
+        index = AuthorIndex(repo).refresh()
+
+        # then
+        assert len(index.commits_by("alice@")) == 2
+        assert len(index.commits_by("Alice", limit=1)) == 1
+        assert index.commits_by("Bob", since_ts=1_700_000_150) == []
+
+    def test_commits_by_uses_git_pattern_semantics(self, repo: Path) -> None:
+        # given
+        index = AuthorIndex(repo).refresh()
+
+        # when / then
+        assert len(index.commits_by(r"\(Alice\|Bob\)")) == 3
+        assert index.commits_by("Al+ce") == []
+        assert index.commits_by("alice <") == []
+        with pytest.raises(GitCommandError):
+            index.commits_by("\\(")
+
+    def test_commit_parser_filters_author_through_index(self, repo: Path) -> None:
+        # given
+        parser = CommitParser(repo_provider=GitRepoProvider(path=repo))
+
+        # when
+        commits = parser.get_commits(author="Alice")
+
+        # then
+        assert [c.author for c in commits] == ["Alice", "Alice"]
+        assert commits[0].date > commits[1].date
+        assert any(AuthorIndex.DEFAULT_DIR.glob("*.json"))
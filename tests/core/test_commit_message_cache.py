@@ -0,0 +1,55 @@
+"""Unit tests for CommitMessageCache."""
+
+from pathlib import Path
+
+from gitgossip.core.storage.commit_message_cache import CommitMessageCache
+
+
+class TestCommitMessageCache:
+    """Validate keyed storage, eviction and tolerance of broken cache files."""
+
+    def test_stored_message_is_returned_for_the_same_key(self, tmp_path: Path) -> None:
+        # given
+        key = CommitMessageCache.key("tree", "model", "template")
+        CommitMessageCache(tmp_path / "cache.json").put(key, "feat: cached")
+
+        # when / then
+        cache = CommitMessageCache(tmp_path / "cache.json")
+        assert cache.get(key) == "feat: cached"
+        assert cache.get(CommitMessageCache.key("tree", "other-model", "template")) is None
+
+    def test_key_depends_on_every_part(self) -> None:
+        # given
+        base = CommitMessageCache.key("t", "m", "p")
+
+        # when / then
+        assert len({base, CommitMessageCache.key("t2", "m", "p"), CommitMessageCache.key("t", "m2", "p")}) == 3
+        assert CommitMessageCache.key("t", "m", "p2") != base
+
+    def test_oldest_entries_are_evicted(self, tmp_path: Path, monkeypatch) -> None:
+        # given
+        monkeypatch.setattr(CommitMessageCache, "MAX_ENTRIES", 2)
+        cache = CommitMessageCache(tmp_path / "cache.json")
+        cache.put("a", "first")
+        cache.put("b", "second")
+
+        # when
+        cache.put("a", "first again")
+        cache.put("c", "third")
+
+        # then
+        assert cache.get("b") is None
+        assert cache.get("a") == "first again"
+        assert cache.get("c") == "third"
+
+    def test_corrupt_file_is_a_miss(self, tmp_path: Path) -> None:
+        # given
+        path = tmp_path / "cache.json"
+        path.write_text("{not json", encoding="utf-8")
+        cache = CommitMessageCache(path)
+
+        # when
+        cache.put("k", "feat: recovered")
+
+        # then
+        assert cache.get("k") == "feat: recovered"
@@ -0,0 +1,141 @@
+"""Unit tests for CommitMessageCandidates prefetching and de-duplication."""
+
+import threading
+import time
+
+import pytest
+
+from gitgossip.core.services.commit_message_service import CommitMessageCandidates
+
+
+class _CountingAnalyzer:
+    """Analyzer stub returning numbered messages after a delay and tracking peak concurrency."""
+
+    def __init__(self, delay: float = 0.0, messages: list[str] | None = None) -> None:
+        self.delay = delay
+        self.messages = messages
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def generate_commit_message(self, diff_text: str, file_summary: str) -> str:
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if self.messages is not None:
+            return self.messages[min(call, len(self.messages)) - 1]
+        return f"feat: candidate {call}"
+
+
+class _SlowFirstAnalyzer:
+    """Analyzer stub whose first request is slow and every later one returns at once."""
+
+    def __init__(self, first_delay: float) -> None:
+        self.first_delay = first_delay
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def generate_commit_message(self, diff_text: str, file_summary: str) -> str:
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        if call == 1:
+            time.sleep(self.first_delay)
+        return f"feat: candidate {call}"
+
+
+class TestCommitMessageCandidates:
+    """Validate concurrent candidate generation for the interactive commit loop."""
+
+    def test_candidates_are_requested_concurrently_up_front(self) -> None:
+        # given
+        analyzer = _CountingAnalyzer(delay=0.2)
+
+        # when
+        with CommitMessageCandidates(analyzer, "diff", "M a.txt (+1 -0)", candidates=3) as pool:
+            started = time.perf_counter()
+            first = pool.next()
+            elapsed = time.perf_counter() - started
+
+        # then
+        assert first.startswith("feat: candidate")
+        assert analyzer.peak == 3
+        assert elapsed < 0.4
+
+    def test_next_candidate_is_prefetched_while_the_first_is_shown(self) -> None:
+        # given
+        analyzer = _CountingAnalyzer(delay=0.05)
+        pool = CommitMessageCandidates(analyzer, "diff", "", candidates=2)
+
+        # when
+        first = pool.next()
+        time.sleep(0.2)
+        ready = pool.ready
+        second = pool.next()
+
+        # then
+        assert ready
+        assert first != second
+        assert pool.requested == 3
+
+    def test_first_finished_candidate_is_taken_over_a_slower_earlier_one(self) -> None:
+        # given
+        analyzer = _SlowFirstAnalyzer(first_delay=1.0)
+        pool = CommitMessageCandidates(analyzer, "diff", "", candidates=2)
+
+        # when
+        started = time.perf_counter()
+        first = pool.next()
+        elapsed = time.perf_counter() - started
+        pool.close()
+
+        # then
+        assert first == "feat: candidate 2"
+        assert elapsed < 0.5
+
+    def test_single_candidate_generates_nothing_ahead(self) -> None:
+        # given
+        analyzer = _CountingAnalyzer()
+        pool = CommitMessageCandidates(analyzer, "diff", "", candidates=1)
+
+        # when
+        pool.next()
+        time.sleep(0.05)
+
+        # then
+        assert analyzer.calls == 1
+        assert not pool.ready
+        assert pool.next() == "feat: candidate 2"
+
+    def test_duplicates_of_shown_messages_are_skipped(self) -> None:
+        # given
+        analyzer = _CountingAnalyzer(messages=["feat: same", "feat: same", "fix: different"])
+        pool = CommitMessageCandidates(analyzer, "diff", "", candidates=3)
+
+        # when
+        messages = [pool.next(), pool.next()]
+
+        # then
+        assert sorted(messages) == ["feat: same", "fix: different"]
+
+    def test_closed_pool_refuses_next(self) -> None:
+        # given
+        pool = CommitMessageCandidates(_CountingAnalyzer(), "diff", "", candidates=2)
+
+        # when
+        pool.close()
+
+        # then
+        with pytest.raises(RuntimeError):
+            pool.next()
+
+    def test_rejects_fewer_than_one_candidate(self) -> None:
+        # when / then
+        with pytest.raises(ValueError):
+            CommitMessageCandidates(_CountingAnalyzer(), "diff", "", candidates=0)
@@ -0,0 +1,120 @@
+"""Unit tests for DigestService incremental ingestion and summary reuse."""
+
+import os
+import subprocess
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from gitgossip.core.services.digest_service import DigestService
+from gitgossip.core.storage.digest_store import DigestStore
+
+NOW = int(time.time())
+
+
+def _commit(repo: Path, name: str, subject: str, timestamp: int = NOW) -> None:
+    (repo / "f.txt").write_text(subject, encoding="utf-8")
+    subprocess.run(["git", "-C", str(repo), "add", "f.txt"], check=True)
+    date = f"@{timestamp} +0000"
+    subprocess.run(
+        [
+            "git",
+            "-C",
+            str(repo),
+            "-c",
+            f"user.name={name}",
+            "-c",
+            f"user.email={name.lower()}@example.com",
+            "commit",
+            "-m",
+            subject,
+        ],
+        check=True,
+        capture_output=True,
+        env={**os.environ, "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date},
+    )
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    """A repository with one commit by Alice and one by Bob today."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    subprocess.run(["git", "init", "-b", "main", str(path)], check=True, capture_output=True)
+    subprocess.run(["git", "-C", str(path), "config", "commit.gpgsign", "false"], check=True)
+    _commit(path, "Alice", "feat: first")
+    _commit(path, "Bob", "fix: second")
+    return path
+
+
+@pytest.fixture()
+def store(tmp_path: Path):
+    """A digest store in a temporary database."""
+    with DigestStore(tmp_path / "digest.sqlite3") as digest_store:
+        yield digest_store
+
+
+class TestDigestService:
+    """Verify that work per run follows new activity."""
+
+    def test_ingest_is_incremental(self, repo: Path, store: DigestStore) -> None:
+        # given
+        service = DigestService(store, MagicMock())
+
+        # when
+        first = service.ingest(repo)
+        unchanged = service.ingest(repo)
+        _commit(repo, "Alice", "feat: third")
+        extended = service.ingest(repo)
+
+        # then
+        assert (first, unchanged, extended) == (2, 0, 1)
+
+    def test_only_changed_buckets_are_summarized(self, repo: Path, store: DigestStore) -> None:
+        # given
+        analyzer = MagicMock()
+        analyzer.analyze_commits.side_effect = lambda commits: f"{len(commits)} by {commits[0].author}"
+        service = DigestService(store, analyzer)
+        service.ingest(repo)
+        service.build([repo], since_ts=NOW - 3600)
+        _commit(repo, "Alice", "feat: third")
+        service.ingest(repo)
+
+        # when
+        entries = service.build([repo], since_ts=NOW - 3600)
+
+        # then
+        assert analyzer.analyze_commits.call_count == 3
+        by_author = {entry.author: entry for entry in entries}
+        assert by_author["Alice"].summary == "2 by Alice" and not by_author["Alice"].cached
+        assert by_author["Bob"].summary == "1 by Bob" and by_author["Bob"].cached
+
+    def test_window_and_author_filter(self, repo: Path, store: DigestStore) -> None:
+        # given
+        _commit(repo, "Alice", "chore: old", timestamp=NOW - 30 * 86400)
+        analyzer = MagicMock()
+        analyzer.analyze_commits.return_value = "summary"
+        service = DigestService(store, analyzer)
+        service.ingest(repo)
+
+        # when
+        entries = service.build([repo], since_ts=NOW - 7 * 86400, author="alice")
+
+        # then
+        assert [(e.author, e.commits) for e in entries] == [("Alice", 1)]
+
+    def test_llm_errors_are_not_cached(self, repo: Path, store: DigestStore) -> None:
+        # given
+        analyzer = MagicMock()
+        analyzer.analyze_commits.return_value = "[LLM ERROR] down"
+        service = DigestService(store, analyzer)
+        service.ingest(repo)
+        service.build([repo], since_ts=NOW - 3600)
+
+        # when
+        service.build([repo], since_ts=NOW - 3600)
+
+        # then
+        assert analyzer.analyze_commits.call_count == 4
@@ -7,6 +7,8 @@ import pytest
 from git import Repo
 
 from gitgossip.core.providers.git_repo_provider import GitRepoProvider
+from gitgossip.testing.synthetic_repo import SyntheticRepoSpec, generate_repo
+from gitgossip.utils.diff_spool import DiffSpool
 
 
 class TestGitRepoProvider:
@@ -87,3 +89,83 @@ class TestStagedDiff:
         # when / then
         assert provider.get_staged_diff() == ""
         assert provider.get_staged_files() == []
+
+    def test_staged_changes_match_plain_git_diff_and_count_lines(self, staged_repo: Path) -> None:
+        # given
+        provider = GitRepoProvider(path=staged_repo)
+        plain = subprocess.run(
+            ["git", "-C", str(staged_repo), "diff", "--cached", "--unified=3"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+        # when
+        staged = provider.get_staged_changes()
+
+        # then
+        assert staged.patch == plain.removesuffix("\n")
+        assert staged.file_summary() == "M a.txt (+1 -0)\nA b.txt (+1 -0)"
+
+    def test_repo_is_built_once(self, staged_repo: Path) -> None:
+        # given
+        provider = GitRepoProvider(path=staged_repo)
+
+        # when / then
+        assert provider.get_repo() is provider.get_repo()
+
+
+class TestBranchDiff:
+    """Verify the spooled branch comparison matches git's own per-commit diffs."""
+
+    @pytest.mark.parametrize("max_memory", [2**20, 64])
+    def test_spooled_diff_matches_gitpython_output(self, tmp_path: Path, max_memory: int) -> None:
+        # given
+        spec = SyntheticRepoSpec(commits=5, files=4, branch_shape="feature", feature_commits=3)
+        provider = GitRepoProvider(generate_repo(tmp_path / "r", spec))
+        repo = provider.get_repo()
+        expected = "\n".join(
+            f"Commit: {c.hexsha}\n{repo.git.diff(f'{c.parents[0].hexsha}..{c.hexsha}', unified=3)}\n{'-' * 50}"
+            for c in repo.iter_commits("main..HEAD", no_merges=True)
+        )
+
+        # when
+        with DiffSpool(max_memory=max_memory) as spool:
+            count = provider.write_diff_between_branches("main", spool)
+            spilled = spool.spilled
+            text = spool.read()
+
+        # then
+        assert count == 3
+        assert spilled == (max_memory == 64)
+        assert text == expected
+
+    def test_initial_commit_is_labelled(self, tmp_path: Path) -> None:
+        # given
+        repo_dir = generate_repo(tmp_path / "r", SyntheticRepoSpec(commits=2, files=2))
+        provider = GitRepoProvider(repo_dir)
+        repo = provider.get_repo()
+        root = next(c for c in repo.iter_commits() if not c.parents)
+        with repo.config_writer() as config:
+            config.set_value("user", "name", "Dev").set_value("user", "email", "dev@example.com")
+        unrelated = repo.git.commit_tree("4b825dc642cb6eb9a060e54bf8d69288fbee4904", m="unrelated base")
+        repo.create_head("unrelated", unrelated)
+
+        # when
+        with DiffSpool() as spool:
+            count = provider.write_diff_between_branches("unrelated", spool)
+            text = spool.read()
+
+        # then
+        assert count == 2
+        root_section = text.split(f"Commit: {root.hexsha} (Initial commit)\n", 1)[1]
+        assert root_section == f"{repo.git.diff_tree(root.hexsha, unified=3, root=True)}\n{'-' * 50}"
+
+    def test_no_unique_commits_writes_nothing(self, tmp_path: Path) -> None:
+        # given
+        provider = GitRepoProvider(generate_repo(tmp_path / "r", SyntheticRepoSpec(commits=3, files=2)))
+
+        # when / then
+        with DiffSpool() as spool:
+            assert provider.write_diff_between_branches("main", spool) == 0
+            assert spool.size == 0
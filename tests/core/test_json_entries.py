@@ -0,0 +1,40 @@
+"""Unit tests for the versioned JSON entry files behind the on-disk caches."""
+
+from pathlib import Path
+
+import pytest
+
+from gitgossip.core.storage.json_entries import read_entries, write_entries
+
+
+class TestJsonEntries:
+    """Validate round-trips, atomic replacement and tolerance of broken files."""
+
+    def test_written_entries_are_read_back(self, tmp_path: Path) -> None:
+        # given
+        path = tmp_path / "nested" / "cache.json"
+
+        # when
+        write_entries(path, 1, {"a": {"repos": ["/r"]}, "b": "text"})
+
+        # then
+        assert read_entries(path, 1) == {"a": {"repos": ["/r"]}, "b": "text"}
+        assert [p.name for p in path.parent.iterdir()] == ["cache.json"]
+
+    @pytest.mark.parametrize("content", ["", "{not json", "[]", '{"version": 1, "entries": []}'])
+    def test_broken_files_read_as_empty(self, tmp_path: Path, content: str) -> None:
+        # given
+        path = tmp_path / "cache.json"
+        path.write_text(content, encoding="utf-8")
+
+        # when / then
+        assert read_entries(path, 1) == {}
+
+    def test_other_versions_and_missing_files_read_as_empty(self, tmp_path: Path) -> None:
+        # given
+        path = tmp_path / "cache.json"
+        write_entries(path, 1, {"a": "b"})
+
+        # when / then
+        assert read_entries(path, 2) == {}
+        assert read_entries(tmp_path / "missing.json", 1) == {}
@@ -0,0 +1,90 @@
+"""Unit tests for MultiRepoSummarizerService concurrency, ordering and failure isolation."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from gitgossip.core.models.commit import Commit
+from gitgossip.core.services.multi_repo_summarizer_service import MultiRepoSummarizerService
+
+
+class _SlowAnalyzer:
+    """Analyzer stub whose latency depends on the repository and which tracks peak concurrency."""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        self.delays = delays
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def analyze_commits(self, commits: list[Commit]) -> str:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delays[commits[0].hash])
+        with self.lock:
+            self.active -= 1
+        return f"summary of {commits[0].hash}"
+
+
+def _parser_for(repo: Path) -> MagicMock:
+    if repo.name == "broken":
+        raise ValueError("not a repository")
+    parser = MagicMock()
+    parser.get_commits.return_value = [Commit(hash=repo.name)]
+    return parser
+
+
+class TestMultiRepoSummarizerService:
+    """Validate the concurrent multi-repository pipeline."""
+
+    def test_results_stream_in_completion_order(self) -> None:
+        # given
+        analyzer = _SlowAnalyzer({"slow": 0.2, "fast": 0.0})
+        service = MultiRepoSummarizerService(analyzer, jobs=2, parser_factory=_parser_for)
+
+        # when
+        results = list(service.summarize_repositories([Path("slow"), Path("fast")]))
+
+        # then
+        assert [r.repo_path.name for r in results] == ["fast", "slow"]
+        assert results[1].summary == "summary of slow"
+        assert results[1].commit_count == 1
+
+    def test_ordered_results_follow_discovery_order(self) -> None:
+        # given
+        analyzer = _SlowAnalyzer({"slow": 0.2, "fast": 0.0})
+        service = MultiRepoSummarizerService(analyzer, jobs=2, parser_factory=_parser_for)
+
+        # when
+        results = list(service.summarize_repositories([Path("slow"), Path("fast")], ordered=True))
+
+        # then
+        assert [r.repo_path.name for r in results] == ["slow", "fast"]
+        assert [r.index for r in results] == [0, 1]
+
+    def test_failing_repo_does_not_stop_others(self) -> None:
+        # given
+        analyzer = _SlowAnalyzer({"a": 0.0, "b": 0.0})
+        service = MultiRepoSummarizerService(analyzer, jobs=2, parser_factory=_parser_for)
+
+        # when
+        results = list(service.summarize_repositories([Path("a"), Path("broken"), Path("b")], ordered=True))
+
+        # then
+        assert [r.summary for r in results] == ["summary of a", "", "summary of b"]
+        assert results[1].error and "not a repository" in results[1].error
+
+    def test_llm_calls_are_bounded(self) -> None:
+        # given
+        names = [f"r{i}" for i in range(6)]
+        analyzer = _SlowAnalyzer({name: 0.05 for name in names})
+        service = MultiRepoSummarizerService(analyzer, jobs=6, llm_concurrency=2, parser_factory=_parser_for)
+
+        # when
+        results = list(service.summarize_repositories([Path(name) for name in names]))
+
+        # then
+        assert len(results) == 6
+        assert analyzer.peak <= 2
@@ -114,3 +114,89 @@ class TestPromptBuilder:
 
         # then
         assert prompt == "CUSTOM hello"
+
+    def test_construction_does_not_create_user_dir(self, tmp_path: Path) -> None:
+        """Should not touch the filesystem when constructed."""
+        # given
+        user_dir = tmp_path / "not-created"
+
+        # when
+        PromptBuilder(user_dir=user_dir)
+
+        # then
+        assert not user_dir.exists()
+
+    def test_template_edit_is_picked_up(self, tmp_path: Path) -> None:
+        """Should reuse the cached template until the file changes on disk."""
+        # given
+        (tmp_path / "chunk.txt").write_text("FIRST {{content}}", encoding="utf-8")
+        builder = PromptBuilder(user_dir=tmp_path)
+        assert builder.build("chunk", content="x") == "FIRST x"
+
+        # when
+        (tmp_path / "chunk.txt").write_text("SECOND EDIT {{content}}", encoding="utf-8")
+        stat = (tmp_path / "chunk.txt").stat()
+        os.utime(tmp_path / "chunk.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # then
+        assert builder.build("chunk", content="x") == "SECOND EDIT x"
+
+    def test_template_is_read_once_across_builds(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should read a template from disk once and serve later builds from memory."""
+        # given
+        (tmp_path / "commit.txt").write_text("C {{content}} {{metadata}}", encoding="utf-8")
+        reads: list[Path] = []
+        original_read_text = Path.read_text
+
+        def counting_read_text(self: Path, *args, **kwargs) -> str:
+            reads.append(self)
+            return original_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+        # when
+        for idx in range(5):
+            PromptBuilder(user_dir=tmp_path).build("commit", content=f"diff {idx}", metadata="a.py")
+
+        # then
+        assert reads.count(tmp_path / "commit.txt") == 1
+
+    def test_placeholders_inside_content_are_not_substituted(self, tmp_path: Path) -> None:
+        """Should substitute placeholders in a single pass over the template only."""
+        # given
+        (tmp_path / "chunk.txt").write_text("{{context}} | {{content}}", encoding="utf-8")
+        builder = PromptBuilder(user_dir=tmp_path)
+
+        # when
+        prompt = builder.build("chunk", content="literal {{context}} in a diff", context="ctx")
+
+        # then
+        assert prompt == "ctx | literal {{context}} in a diff"
+
+    def test_default_templates_put_variable_content_last(self, tmp_path: Path) -> None:
+        """Should keep instructions as a stable prefix so provider prompt caches can hit."""
+        # given
+        builder = PromptBuilder(user_dir=tmp_path)
+
+        # when
+        first = builder.build("chunk", content="+ one", metadata="[Part 1/2]")
+        second = builder.build("chunk", content="+ two", metadata="[Part 2/2]")
+
+        # then
+        assert first.endswith("<DIFF_END>")
+        shared = first[: first.index("[Part")]
+        assert second.startswith(shared)
+        assert "Rules:" in shared
+
+    def test_fingerprint_follows_the_template_in_use(self, tmp_path: Path) -> None:
+        """Should change the fingerprint when a user template overrides the default."""
+        # given
+        builder = PromptBuilder(user_dir=tmp_path)
+        default = builder.fingerprint("commit")
+
+        # when
+        (tmp_path / "commit.txt").write_text("Custom {{content}}", encoding="utf-8")
+
+        # then
+        assert builder.fingerprint("commit") != default
+        assert builder.fingerprint("commit") == PromptBuilder(user_dir=tmp_path).fingerprint("commit")
@@ -1,11 +1,13 @@
 """Unit tests for RepoDiscoveryService."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from git import Repo
 
 from gitgossip.core.services.repo_discovery_service import RepoDiscoveryService
+from gitgossip.core.storage.discovery_cache import DiscoveryCache
 
 
 class TestRepoDiscoveryService:
@@ -50,3 +52,83 @@ class TestRepoDiscoveryService:
         # then
         with pytest.raises(FileNotFoundError):
             service.find_repositories()
+
+    def test_recursive_finds_sibling_repos_in_same_subtree(self, tmp_path: Path) -> None:
+        """Should keep walking after the first repo found under a top-level directory."""
+        # given
+        for name in ("group/a", "group/b", "group/deeper/c"):
+            (tmp_path / name).mkdir(parents=True)
+            Repo.init(tmp_path / name)
+        service = RepoDiscoveryService(base_dir=tmp_path, recursive=True)
+
+        # when
+        repos = service.find_repositories()
+
+        # then
+        assert [r.relative_to(tmp_path).as_posix() for r in repos] == ["group/a", "group/b", "group/deeper/c"]
+
+    def test_max_depth_and_skip_globs_prune_the_walk(self, tmp_path: Path) -> None:
+        """Should not look below max_depth or inside skipped directories."""
+        # given
+        for name in ("shallow", "x/y/too_deep", "node_modules/pkg"):
+            (tmp_path / name).mkdir(parents=True)
+            Repo.init(tmp_path / name)
+        service = RepoDiscoveryService(base_dir=tmp_path, max_depth=2)
+
+        # when
+        repos = service.find_repositories()
+
+        # then
+        assert repos == [tmp_path / "shallow"]
+
+    def test_repositories_named_like_skipped_directories_are_kept(self, tmp_path: Path) -> None:
+        """Should apply skip globs only to directories that are not repositories themselves."""
+        # given
+        Repo.init(tmp_path / "build")
+        Repo.init(tmp_path / "group" / "dist")
+        (tmp_path / "target" / "inner").mkdir(parents=True)
+        Repo.init(tmp_path / "target" / "inner")
+        service = RepoDiscoveryService(base_dir=tmp_path, max_depth=2)
+
+        # when
+        repos = service.find_repositories()
+
+        # then
+        assert repos == [tmp_path / "build", tmp_path / "group" / "dist"]
+
+    def test_detects_worktrees_and_bare_repos(self, tmp_path: Path) -> None:
+        """Should treat a `.git` file (worktree/submodule) and a bare repository as repositories."""
+        # given
+        worktree = tmp_path / "worktree"
+        worktree.mkdir()
+        (worktree / ".git").write_text("gitdir: /elsewhere/.git/worktrees/worktree\n", encoding="utf-8")
+        Repo.init(tmp_path / "mirror.git", bare=True)
+        service = RepoDiscoveryService(base_dir=tmp_path)
+
+        # when
+        repos = service.find_repositories()
+
+        # then
+        assert repos == [tmp_path / "mirror.git", worktree]
+
+    def test_cache_is_reused_until_a_directory_changes(self, tmp_path: Path) -> None:
+        """Should serve repeat walks from the manifest and rescan once the tree changes."""
+        # given
+        workspace = tmp_path / "ws"
+        (workspace / "group" / "a").mkdir(parents=True)
+        Repo.init(workspace / "group" / "a")
+        cache = DiscoveryCache(tmp_path / "discovery.json")
+        service = RepoDiscoveryService(base_dir=workspace, recursive=True, cache=cache)
+        first = service.find_repositories()
+
+        # when
+        with patch("gitgossip.core.services.repo_discovery_service.os.scandir") as mock_scandir:
+            cached = service.find_repositories()
+        (workspace / "group" / "b").mkdir()
+        Repo.init(workspace / "group" / "b")
+        rescanned = service.find_repositories()
+
+        # then
+        assert cached == first == [workspace / "group" / "a"]
+        mock_scandir.assert_not_called()
+        assert rescanned == [workspace / "group" / "a", workspace / "group" / "b"]
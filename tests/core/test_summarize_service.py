@@ -6,11 +6,36 @@ from unittest.mock import MagicMock
 
 from gitgossip.core.models.commit import Commit
 from gitgossip.core.services.summarizer_service import SummarizerService
+from gitgossip.utils.diff_spool import DiffSpool
+
+
+def _streams(diff_text: str):
+    """Stand in for ``write_diff_between_branches``, writing ``diff_text`` as one commit."""
+
+    def write_diff(_target_branch, spool):
+        spool.write(diff_text)
+        return 1
+
+    return write_diff
 
 
 class TestSummarizerService:
     """Validate chunk-based summarization and MR summary delegation."""
 
+    def test_summarize_repository_without_commits_skips_analyzer(self) -> None:
+        # given
+        mock_parser = MagicMock()
+        mock_analyzer = MagicMock()
+        mock_parser.get_commits.return_value = []
+        service = SummarizerService(mock_parser, mock_analyzer)
+
+        # when
+        result = service.summarize_repository(since="2days")
+
+        # then
+        assert result == ""
+        mock_analyzer.analyze_commits.assert_not_called()
+
     def test_summarize_repository_delegates_to_analyzer(self) -> None:
         # given (arrange)
         mock_parser = MagicMock()
@@ -47,7 +72,7 @@ class TestSummarizerService:
         mock_analyzer = MagicMock()
 
         # Create a fake diff of ~1000 lines
-        mock_parser.repo_provider.get_diff_between_branches.return_value = "+ added code line\n" * 1000
+        mock_parser.repo_provider.write_diff_between_branches.side_effect = _streams("+ added code line\n" * 1000)
 
         mock_analyzer.summarize_diff_chunk.side_effect = itertools.cycle(["chunk summary 1", "chunk summary 2"])
         mock_analyzer.synthesize_chunk_summaries.return_value = "merged synthesis"
@@ -83,7 +108,7 @@ class TestSummarizerService:
         # given
         mock_parser = MagicMock()
         mock_analyzer = MagicMock()
-        mock_parser.repo_provider.get_diff_between_branches.return_value = "   "
+        mock_parser.repo_provider.write_diff_between_branches.side_effect = _streams("   ")
 
         service = SummarizerService(mock_parser, mock_analyzer)
 
@@ -93,3 +118,32 @@ class TestSummarizerService:
         # then
         assert "No code changes" in title
         assert "no differences" in desc.lower()
+
+    def test_spilled_diff_is_chunked_like_the_in_memory_diff(self) -> None:
+        # given
+        diff_text = "".join(f"+ line {i} of a large diff\n" for i in range(300))
+        mock_parser = MagicMock()
+        mock_analyzer = MagicMock()
+        mock_parser.repo_provider.write_diff_between_branches.side_effect = _streams(diff_text)
+        mock_analyzer.summarize_diff_chunk.return_value = "chunk summary"
+        mock_analyzer.generate_mr_summary.return_value = ("Title", "- bullet")
+        service = SummarizerService(mock_parser, mock_analyzer, chunk_size=500, max_diff_memory=1000)
+
+        # when
+        service.summarize_for_merge_request(target_branch="main")
+
+        # then
+        with DiffSpool() as spool:
+            spool.write(diff_text)
+            count = spool.count_chunks(500)
+            expected = []
+            for chunk in spool.chunks(500):
+                with chunk:
+                    expected.append(str(chunk, "utf-8"))
+        calls = mock_analyzer.summarize_diff_chunk.call_args_list
+        assert [c.kwargs["diff_chunk"] for c in calls] == expected
+        assert [c.kwargs["metadata"] for c in calls] == [
+            f"[Part {i}/{len(expected)}]" for i in range(1, len(expected) + 1)
+        ]
+        assert count == len(expected) > 1
+        assert all(len(chunk) <= 500 for chunk in expected)
@@ -0,0 +1,201 @@
+"""Tests for the gitgossip daemon and its client."""
+
+import json
+import socket
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from rich.console import Console
+
+from gitgossip.commands import list_authors
+from gitgossip.daemon import client
+from gitgossip.daemon.client import run_in_daemon
+from gitgossip.daemon.server import DaemonServer
+
+
+def _init_repo(path: Path) -> None:
+    path.mkdir()
+    subprocess.run(["git", "init", "-b", "main", str(path)], check=True, capture_output=True)
+    subprocess.run(["git", "-C", str(path), "config", "user.email", "alice@example.com"], check=True)
+    subprocess.run(["git", "-C", str(path), "config", "user.name", "Alice"], check=True)
+    subprocess.run(["git", "-C", str(path), "config", "commit.gpgsign", "false"], check=True)
+    (path / "a.txt").write_text("one\n", encoding="utf-8")
+    subprocess.run(["git", "-C", str(path), "add", "a.txt"], check=True)
+    subprocess.run(["git", "-C", str(path), "commit", "-m", "init"], check=True, capture_output=True)
+
+
+@pytest.fixture()
+def fake_daemon(tmp_path_factory: pytest.TempPathFactory):
+    """A socket that records each request line and answers ``{"exit": 0}``."""
+    path = tmp_path_factory.mktemp("f") / "fake.sock"
+    requests: list[dict] = []
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(path))
+    listener.listen()
+
+    def serve() -> None:
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            with conn:
+                requests.append(json.loads(conn.makefile("r", encoding="utf-8").readline()))
+                conn.sendall(b'{"exit": 0}\n')
+
+    threading.Thread(target=serve, daemon=True).start()
+    yield path, requests
+    listener.close()
+
+
+@contextmanager
+def _serving(path: Path) -> Iterator[DaemonServer]:
+    server = DaemonServer(path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        thread.join()
+        server.server_close()
+
+
+@pytest.fixture()
+def daemon(tmp_path_factory: pytest.TempPathFactory):
+    """A daemon serving on a short temporary socket path."""
+    with _serving(tmp_path_factory.mktemp("d") / "gg.sock") as server:
+        yield server
+
+
+@pytest.fixture()
+def colour_daemon(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch):
+    """A daemon whose list-authors module console was created on a colour terminal."""
+    monkeypatch.setattr(list_authors, "console", Console(force_terminal=True, color_system="truecolor"))
+    with _serving(tmp_path_factory.mktemp("d") / "gg.sock") as server:
+        yield server
+
+
+class TestDaemon:
+    """Verify command dispatch, output replay and fallback."""
+
+    def test_runs_command_and_replays_output(self, daemon: DaemonServer, tmp_path: Path, capsys) -> None:
+        # given
+        _init_repo(tmp_path / "repo")
+
+        # when
+        code = run_in_daemon("list-authors", {"path": str(tmp_path / "repo"), "since": "1days"}, daemon.path)
+
+        # then
+        assert code == 0
+        assert "Alice <alice@example.com>" in capsys.readouterr().out
+
+    def test_piped_client_gets_no_escape_codes(self, colour_daemon: DaemonServer, tmp_path: Path, capsys) -> None:
+        # given
+        _init_repo(tmp_path / "repo")
+
+        # when
+        code = run_in_daemon("list-authors", {"path": str(tmp_path / "repo"), "since": "1days"}, colour_daemon.path)
+
+        # then
+        out = capsys.readouterr().out
+        assert code == 0
+        assert "Total unique authors: 1" in out
+        assert "\x1b[" not in out
+
+    def test_terminal_client_gets_colour(
+        self, daemon: DaemonServer, tmp_path: Path, capsys, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # given
+        _init_repo(tmp_path / "repo")
+        monkeypatch.setattr(client, "_terminal", lambda: {"stdout": True, "stderr": True, "width": 100})
+
+        # when
+        code = run_in_daemon("list-authors", {"path": str(tmp_path / "repo"), "since": "1days"}, daemon.path)
+
+        # then
+        assert code == 0
+        assert "\x1b[" in capsys.readouterr().out
+
+    def test_exit_codes_are_forwarded(self, daemon: DaemonServer, tmp_path: Path, capsys) -> None:
+        # given
+        (tmp_path / "empty").mkdir()
+
+        # when
+        code = run_in_daemon("list-authors", {"path": str(tmp_path / "empty"), "since": "1days"}, daemon.path)
+
+        # then
+        assert code == 1
+        assert "No Git repositories found" in capsys.readouterr().out
+
+    def test_interactive_commands_are_refused(self, daemon: DaemonServer, capsys) -> None:
+        # given / when
+        code = run_in_daemon("commit", {"path": ".", "print_only": False, "hook_file": None}, daemon.path)
+
+        # then
+        assert code == 2
+        assert "does not run 'commit'" in capsys.readouterr().err
+
+    def test_no_daemon_means_in_process(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        # given / when / then
+        assert run_in_daemon("ping", {}, tmp_path / "missing.sock") is None
+
+    def test_opt_out_env_skips_running_daemon(self, daemon: DaemonServer, monkeypatch: pytest.MonkeyPatch) -> None:
+        # given
+        monkeypatch.setenv("GITGOSSIP_NO_DAEMON", "1")
+
+        # when / then
+        assert run_in_daemon("ping", {}, daemon.path) is None
+
+    def test_commit_hook_forwards_the_git_environment(self, fake_daemon, monkeypatch: pytest.MonkeyPatch) -> None:
+        # given
+        path, requests = fake_daemon
+        monkeypatch.setenv("GIT_INDEX_FILE", "/repo/.git/index.lock")
+        monkeypatch.setenv("GIT_WORK_TREE", "/repo")
+
+        # when
+        code = run_in_daemon("commit-hook", {"hook_file": "/repo/.git/COMMIT_EDITMSG", "path": "/repo"}, path)
+
+        # then
+        assert code == 0
+        git_env = requests[0]["args"]["git_env"]
+        assert git_env["GIT_INDEX_FILE"] == "/repo/.git/index.lock"
+        assert git_env["GIT_WORK_TREE"] == "/repo"
+
+    def test_repository_env_keeps_other_commands_in_process(self, fake_daemon, monkeypatch: pytest.MonkeyPatch) -> None:
+        # given
+        path, requests = fake_daemon
+        monkeypatch.setenv("GIT_INDEX_FILE", "/repo/.git/index.lock")
+
+        # when
+        code = run_in_daemon("commit", {"path": "/repo", "print_only": True}, path)
+
+        # then
+        assert code is None
+        assert requests == []
+
+    def test_unresponsive_daemon_times_out_to_in_process(self, tmp_path_factory: pytest.TempPathFactory) -> None:
+        # given
+        path = tmp_path_factory.mktemp("w") / "wedged.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as wedged:
+            wedged.bind(str(path))
+            wedged.listen()
+
+            # when
+            started = time.monotonic()
+            code = run_in_daemon("commit-hook", {"hook_file": "/tmp/msg"}, path, timeout=0.3)
+            elapsed = time.monotonic() - started
+
+        # then
+        assert code is None
+        assert elapsed < 2
+
+    def test_refuses_to_replace_a_live_daemon(self, daemon: DaemonServer) -> None:
+        # given / when / then
+        with pytest.raises(OSError, match="already listening"):
+            DaemonServer(daemon.path)
@@ -0,0 +1,76 @@
+"""Startup budget for the CLI entry point, measured with ``python -X importtime``."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules that must only be imported by the subcommand that needs them.
+HEAVY_MODULES = ("openai", "httpx", "git", "pydantic", "ruamel", "psutil", "rich.logging", "gitgossip.commands")
+
+# Modules a ``commit --hook`` run must not import. httpx pulls in rich.console itself; Rich logging stays out.
+HOOK_EXCLUDED_MODULES = ("rich.logging", "rich.traceback", "git", "ruamel")
+
+# Cumulative import time of gitgossip.cli; about 80 ms locally, generous enough for slow CI machines.
+IMPORT_BUDGET_US = 500_000
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _import_times(code: str, env: dict[str, str] | None = None) -> dict[str, int]:
+    """Run ``code`` under ``-X importtime`` and return cumulative microseconds per imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, env=env
+    )
+    assert result.returncode == 0, result.stderr
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def _heavy(times: dict[str, int], modules: tuple[str, ...] = HEAVY_MODULES) -> list[str]:
+    return sorted(name for name in times if any(name == heavy or name.startswith(f"{heavy}.") for heavy in modules))
+
+
+class TestCliStartup:
+    """Verify the entry point stays light until a subcommand runs."""
+
+    def test_import_stays_within_budget(self) -> None:
+        # given / when
+        times = _import_times("import gitgossip.cli")
+
+        # then
+        assert _heavy(times) == []
+        assert times["gitgossip.cli"] < IMPORT_BUDGET_US
+
+    def test_help_does_not_import_commands(self) -> None:
+        # given / when
+        times = _import_times("from gitgossip.cli import app; app(['--help'])")
+
+        # then
+        assert "gitgossip.cli" in times
+        assert _heavy(times) == []
+
+    def test_commit_hook_does_not_import_rich_logging(self, tmp_path: Path) -> None:
+        # given
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+        (repo / "a.txt").write_text("a\n", encoding="utf-8")
+        subprocess.run(["git", "add", "a.txt"], cwd=repo, check=True)
+        msg_file = tmp_path / "COMMIT_EDITMSG"
+        msg_file.write_text("", encoding="utf-8")
+        args = ["commit", "--hook", str(msg_file), "--path", str(repo), "--use-mock"]
+
+        # when
+        times = _import_times(
+            f"from gitgossip.cli import app; app({args!r})", env={**os.environ, "HOME": str(tmp_path / "home")}
+        )
+
+        # then
+        assert _heavy(times, HOOK_EXCLUDED_MODULES) == []
+        assert msg_file.read_text(encoding="utf-8").startswith("chore: mock commit message")
@@ -0,0 +1,74 @@
+"""Tests for the benchmark harness and its baseline comparison."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from gitgossip.testing.benchmarks import (
+    BenchmarkResult,
+    BenchmarkRun,
+    benchmark_names,
+    compare,
+    load_run,
+    run_benchmarks,
+    save_run,
+)
+
+
+def _run(**medians: float) -> BenchmarkRun:
+    return BenchmarkRun(
+        created_at=datetime.now(timezone.utc),
+        python="3",
+        platform="p",
+        git="git",
+        scale=1.0,
+        results=[
+            BenchmarkResult(name=name, rounds=1, min_s=s, median_s=s, mean_s=s, max_s=s, params={"n": 1})
+            for name, s in medians.items()
+        ],
+    )
+
+
+class TestCompare:
+    """Verify regression detection against a baseline."""
+
+    def test_flags_only_slowdowns_beyond_tolerance(self) -> None:
+        # given
+        baseline = _run(fast=1.0, slow=1.0, same=1.0)
+        current = _run(fast=0.5, slow=1.5, same=1.2, new=9.0)
+
+        # when
+        regressions = compare(current, baseline, tolerance=0.25)
+
+        # then
+        assert [r.name for r in regressions] == ["slow"]
+        assert regressions[0].ratio == 1.5
+
+    def test_different_fixture_params_are_not_compared(self) -> None:
+        # given
+        baseline = _run(slow=1.0)
+        current = _run(slow=5.0)
+        current.results[0].params = {"n": 2}
+
+        # when / then
+        assert compare(current, baseline) == []
+
+
+class TestRunBenchmarks:
+    """Run the real suite on tiny fixtures."""
+
+    def test_runs_selected_benchmarks_and_round_trips_results(self, tmp_path: Path) -> None:
+        # given
+        workdir = tmp_path / "repos"
+
+        # when
+        run = run_benchmarks(workdir=workdir, rounds=2, scale=0.02, only="diff_spool")
+        save_run(run, tmp_path / "out" / "bench.json")
+        again = run_benchmarks(workdir=workdir, rounds=1, scale=0.02, only="diff_spool")
+
+        # then
+        assert [r.name for r in run.results] == ["diff_spool.spill_and_chunk"]
+        assert run.results[0].params["diff_bytes"] > 0
+        assert load_run(tmp_path / "out" / "bench.json") == run
+        assert len(list(workdir.iterdir())) == 1  # the fixture repository was reused
+        assert again.results[0].params == run.results[0].params
+        assert "commit_parser.get_commits" in benchmark_names()
@@ -0,0 +1,145 @@
+"""End-to-end tests driving OpenAIChatClient and SummarizerService against the fake server."""
+
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from gitgossip.core.llm.clients.openai_chat_client import OpenAIChatClient
+from gitgossip.core.llm.errors import ChatClientError
+from gitgossip.core.llm.llm_analyzer import LLMAnalyzer
+from gitgossip.core.llm.telemetry import LLMStatsRecorder
+from gitgossip.core.services.summarizer_service import SummarizerService
+from gitgossip.testing.fake_openai_server import FakeOpenAIServer, FakeServerSettings
+
+
+def _streams(diff_text: str):
+    """Stand in for ``write_diff_between_branches``, writing ``diff_text`` as one commit."""
+
+    def write_diff(_target_branch, spool):
+        spool.write(diff_text)
+        return 1
+
+    return write_diff
+
+
+class TestFakeOpenAIServer:
+    """Verify the fake endpoint is usable as an OpenAI base_url."""
+
+    def test_completion_is_deterministic_per_prompt(self) -> None:
+        # given
+        with FakeOpenAIServer() as server:
+            client = OpenAIChatClient(base_url=server.base_url, model="fake", api_key="x")
+
+            # when
+            first = client.complete(system="s", user="same prompt", temperature=0.3, max_tokens=50)
+            second = client.complete(system="s", user="same prompt", temperature=0.3, max_tokens=50)
+            other = client.complete(system="s", user="other prompt", temperature=0.3, max_tokens=50)
+
+        # then
+        assert first == second
+        assert first != other
+        assert first.startswith("Title: ")
+
+    def test_streaming_reports_usage_and_ttft(self) -> None:
+        # given
+        recorder = LLMStatsRecorder()
+        settings = FakeServerSettings(tokens_per_second=500, completion_words=10)
+        with FakeOpenAIServer(settings) as server:
+            client = OpenAIChatClient(base_url=server.base_url, model="fake", api_key="x", stream=True)
+
+            # when
+            with recorder.track("op") as call:
+                text = client.complete(system="s", user="u" * 400, temperature=0.3, max_tokens=50)
+
+        # then
+        assert text.startswith("Title: ")
+        assert call.ttft_ms is not None
+        assert call.prompt_tokens == 100
+        assert call.completion_tokens == len(text.split())
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_tokens_per_second_paces_both_reply_modes(self, stream: bool) -> None:
+        # given
+        response = " ".join(["word"] * 20)
+        with (
+            FakeOpenAIServer(FakeServerSettings(response=response, tokens_per_second=50)) as slow,
+            FakeOpenAIServer(FakeServerSettings(response=response)) as fast,
+        ):
+            slow_client = OpenAIChatClient(base_url=slow.base_url, model="fake", api_key="x", stream=stream)
+            fast_client = OpenAIChatClient(base_url=fast.base_url, model="fake", api_key="x", stream=stream)
+
+            # when
+            started = time.perf_counter()
+            slow_text = slow_client.complete(system="s", user="u", temperature=0.3, max_tokens=50)
+            slow_elapsed = time.perf_counter() - started
+            started = time.perf_counter()
+            fast_client.complete(system="s", user="u", temperature=0.3, max_tokens=50)
+            fast_elapsed = time.perf_counter() - started
+
+        # then
+        assert slow_text == response
+        assert slow_elapsed >= 20 / 50
+        assert fast_elapsed < 20 / 50
+
+    def test_rate_limits_are_retried_then_surface(self) -> None:
+        # given
+        recorder = LLMStatsRecorder()
+        with FakeOpenAIServer(FakeServerSettings(rate_limit_rate=1.0)) as server:
+            client = OpenAIChatClient(base_url=server.base_url, model="fake", api_key="x", retry_backoff=0)
+
+            # when / then
+            with recorder.track("op") as call, pytest.raises(ChatClientError):
+                client.complete(system="s", user="u", temperature=0.3, max_tokens=50)
+            assert server.request_count == 3
+
+        assert call.retries == 2
+
+    def test_summarizer_service_end_to_end(self) -> None:
+        # given
+        parser = MagicMock()
+        parser.repo_provider.write_diff_between_branches.side_effect = _streams("+ added code line\n" * 200)
+        with FakeOpenAIServer(FakeServerSettings(response="Title: Add lines\nDescription:\n- adds lines")) as server:
+            analyzer = LLMAnalyzer(OpenAIChatClient(base_url=server.base_url, model="fake", api_key="x"))
+            service = SummarizerService(parser, analyzer, chunk_size=1000)
+
+            # when
+            title, description = service.summarize_for_merge_request("main")
+
+            # then: 4 chunks + synthesis + final
+            assert server.request_count == 6
+
+        assert title == "Add lines"
+        assert description == "- adds lines"
+
+    def test_stable_prompt_prefix_is_reported_as_cached(self) -> None:
+        # given
+        recorder = LLMStatsRecorder()
+        with FakeOpenAIServer() as server:
+            analyzer = LLMAnalyzer(
+                OpenAIChatClient(base_url=server.base_url, model="fake", api_key="x"), stats_recorder=recorder
+            )
+
+            # when
+            analyzer.summarize_diff_chunk("+ first chunk", metadata="[Part 1/2]")
+            analyzer.summarize_diff_chunk("+ second chunk", metadata="[Part 2/2]")
+
+        # then: system prompt + rules are shared between consecutive chunk prompts
+        first, second = recorder.calls
+        assert not first.cached_tokens
+        assert second.cached_tokens and second.cached_tokens > 50
+
+    def test_bad_requests_are_rejected_without_dropping_the_connection(self) -> None:
+        # given
+        with FakeOpenAIServer() as server, httpx.Client(base_url=server.base_url) as http:
+            # when
+            malformed = http.post("/chat/completions", content=b"{not json")
+            unknown = http.post("/embeddings", content=b"{not json")
+            valid = http.post("/chat/completions", json={"messages": [{"role": "user", "content": "u"}]})
+
+        # then
+        assert malformed.status_code == 400
+        assert unknown.status_code == 404
+        assert valid.status_code == 200
+        assert server.request_count == 1
@@ -0,0 +1,79 @@
+"""Tests for the deterministic synthetic repository generator."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from gitgossip.core.services.repo_discovery_service import RepoDiscoveryService
+from gitgossip.testing.synthetic_repo import SyntheticRepoSpec, generate_repo, generate_tree
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", "-C", str(repo), *args], capture_output=True, text=True, check=True).stdout.strip()
+
+
+class TestGenerateRepo:
+    """Verify determinism and branch shapes."""
+
+    def test_same_spec_produces_same_history(self, tmp_path: Path) -> None:
+        # given
+        spec = SyntheticRepoSpec(commits=30, files=6, languages=["python", "go"], seed=7)
+
+        # when
+        first = generate_repo(tmp_path / "a", spec)
+        second = generate_repo(tmp_path / "b", spec)
+        other = generate_repo(tmp_path / "c", spec.model_copy(update={"seed": 8}))
+
+        # then
+        assert _git(first, "rev-parse", "HEAD") == _git(second, "rev-parse", "HEAD")
+        assert _git(first, "rev-parse", "HEAD") != _git(other, "rev-parse", "HEAD")
+        assert _git(first, "rev-list", "--count", "HEAD") == "30"
+        assert _git(first, "status", "--porcelain") == ""
+        assert {Path(f).suffix for f in _git(first, "ls-files").splitlines()} == {".py", ".go"}
+
+    def test_feature_shape_checks_out_a_branch_ahead_of_main(self, tmp_path: Path) -> None:
+        # given
+        spec = SyntheticRepoSpec(commits=10, files=4, branch_shape="feature", feature_commits=5)
+
+        # when
+        repo = generate_repo(tmp_path / "r", spec)
+
+        # then
+        assert _git(repo, "branch", "--show-current") == "feature"
+        assert _git(repo, "rev-list", "--count", "main..HEAD") == "5"
+
+    def test_merges_shape_creates_merge_commits_matching_the_side_branch(self, tmp_path: Path) -> None:
+        # given
+        spec = SyntheticRepoSpec(commits=25, files=4, branch_shape="merges", merge_every=10)
+
+        # when
+        repo = generate_repo(tmp_path / "r", spec)
+
+        # then
+        merges = _git(repo, "rev-list", "--merges", "HEAD").splitlines()
+        assert len(merges) == 2
+        assert _git(repo, "diff", f"{merges[0]}^2", merges[0]) == ""
+
+    def test_refuses_non_empty_directory(self, tmp_path: Path) -> None:
+        # given
+        (tmp_path / "file.txt").write_text("x")
+
+        # when / then
+        with pytest.raises(FileExistsError):
+            generate_repo(tmp_path)
+
+
+class TestGenerateTree:
+    """Verify nested trees match what discovery should find."""
+
+    def test_discovery_finds_exactly_the_generated_repositories(self, tmp_path: Path) -> None:
+        # given
+        expected = generate_tree(tmp_path / "tree", repos=7, depth=3)
+
+        # when
+        found = RepoDiscoveryService(tmp_path / "tree", recursive=True).find_repositories()
+
+        # then
+        assert found == expected
+        assert len({len(p.relative_to(tmp_path / "tree").parts) for p in found}) == 3
@@ -0,0 +1,137 @@
+"""Unit tests for the diff spool used by the merge request pipeline."""
+
+import random
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from gitgossip.utils.diff_spool import DiffSpool, chunk_bounds
+
+
+def _greedy_chunks(text: str, max_size: int) -> list[str]:
+    """Reference packing: greedy over lines, each costing its length plus one."""
+    chunks: list[list[str]] = []
+    current_len = 0
+    for line in text.split("\n")[:-1] if text.endswith("\n") else text.split("\n"):
+        if chunks and chunks[-1] and current_len + len(line) + 1 <= max_size:
+            chunks[-1].append(line)
+            current_len += len(line) + 1
+        else:
+            chunks.append([line])
+            current_len = len(line) + 1
+    return ["\n".join(chunk) for chunk in chunks] if text else []
+
+
+class TestDiffSpool:
+    """Verify buffering, spilling, command output and zero-copy read-back."""
+
+    def test_small_diff_stays_in_memory(self) -> None:
+        # given
+        with DiffSpool(max_memory=1024) as spool:
+            # when
+            spool.write("a\nb ✓\n")
+            spool.write(b"c")
+
+            # then
+            assert not spool.spilled
+            assert spool.size == len("a\nb ✓\nc".encode())
+            assert spool.read() == "a\nb ✓\nc"
+            assert [bytes(c) for c in spool.chunks(4)] == [b"a", "b ✓".encode(), b"c"]
+
+    def test_large_diff_spills_and_chunks_are_views_of_the_mapping(self) -> None:
+        # given
+        lines = [f"+line {i} ✓" for i in range(500)]
+
+        with DiffSpool(max_memory=100) as spool:
+            # when
+            for line in lines:
+                spool.write(line + "\n")
+            chunks = list(spool.chunks(200))
+
+            # then
+            assert spool.spilled
+            assert spool.size == sum(len(line.encode()) + 1 for line in lines)
+            assert all(isinstance(chunk, memoryview) and chunk.readonly for chunk in chunks)
+            assert all(chunk.nbytes <= 200 for chunk in chunks)
+            assert "\n".join(str(c, "utf-8") for c in chunks) == "\n".join(lines)
+            assert spool.count_chunks(200) == len(chunks)
+            for chunk in chunks:
+                chunk.release()
+
+    def test_writes_after_reading_are_rejected(self) -> None:
+        # given
+        with DiffSpool() as spool:
+            spool.write("a")
+            spool.read()
+
+            # when / then
+            with pytest.raises(ValueError, match="read-only"):
+                spool.write("b")
+
+    @pytest.mark.parametrize("max_memory", [1024, 8])
+    def test_command_output_is_appended_and_trailing_newline_stripped(self, max_memory: int) -> None:
+        # given
+        script = "import sys; sys.stdout.write('out ✓\\n' * 3)"
+
+        with DiffSpool(max_memory=max_memory) as spool:
+            # when
+            spool.write("head\n")
+            written = spool.write_command([sys.executable, "-c", script], strip_trailing_newline=True)
+            spool.write("|tail")
+
+            # then
+            assert written == len(("out ✓\n" * 3).encode()) - 1
+            assert spool.spilled == (max_memory == 8)
+            assert spool.read() == "head\nout ✓\nout ✓\nout ✓|tail"
+
+    def test_failing_command_raises(self) -> None:
+        # given
+        with DiffSpool() as spool:
+            # when / then
+            with pytest.raises(subprocess.CalledProcessError):
+                spool.write_command([sys.executable, "-c", "raise SystemExit(3)"])
+
+    @pytest.mark.parametrize("max_memory", [1024, 8])
+    def test_noisy_stderr_does_not_block_the_command(self, max_memory: int) -> None:
+        # given
+        script = "import sys; sys.stderr.write('warning\\n' * 2**17); sys.stdout.write('out\\n'); sys.exit(2)"
+        errors: list[subprocess.CalledProcessError] = []
+
+        def run() -> None:
+            with DiffSpool(max_memory=max_memory) as spool:
+                spool.write("head\n")
+                try:
+                    spool.write_command([sys.executable, "-c", script])
+                except subprocess.CalledProcessError as exc:
+                    errors.append(exc)
+
+        # when
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(timeout=20)
+
+        # then
+        assert not worker.is_alive()
+        assert errors[0].returncode == 2
+        assert len(errors[0].stderr) == len(b"warning\n") * 2**17
+
+
+class TestChunkBounds:
+    """Verify the offset packer against a straightforward greedy line packer."""
+
+    def test_matches_greedy_line_packing(self) -> None:
+        # given
+        rng = random.Random(7)
+        for _ in range(300):
+            lines = ["x" * rng.randrange(0, 30) for _ in range(rng.randrange(0, 20))]
+            text = "\n".join(lines) + rng.choice(["", "\n"])
+            max_size = rng.randrange(1, 60)
+            data = text.encode()
+
+            # when
+            chunks = [data[s:e].decode() for s, e in chunk_bounds(data, len(data), max_size)]
+
+            # then
+            assert chunks == _greedy_chunks(text, max_size), (text, max_size)
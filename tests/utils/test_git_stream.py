@@ -0,0 +1,51 @@
+"""Unit tests for streaming NUL-delimited git output."""
+
+import sys
+import threading
+
+import pytest
+from git.exc import GitCommandError
+
+from gitgossip.utils.git_stream import iter_git_records
+
+
+class TestIterGitRecords:
+    """Verify record splitting and error reporting for streamed commands."""
+
+    def test_yields_records_of_the_given_width(self) -> None:
+        # given
+        script = "import sys; sys.stdout.write('a\\0b\\0c\\0d\\0' * 3)"
+
+        # when
+        records = list(iter_git_records([sys.executable, "-c", script], width=2))
+
+        # then
+        assert records == [(b"a", b"b"), (b"c", b"d")] * 3
+
+    def test_noisy_stderr_does_not_block_the_command(self) -> None:
+        # given
+        script = "import sys; sys.stderr.write('warning\\n' * 2**17); sys.stdout.write('x\\0y\\0'); sys.exit(2)"
+        errors: list[GitCommandError] = []
+        records: list[tuple[bytes, ...]] = []
+
+        def run() -> None:
+            try:
+                records.extend(iter_git_records([sys.executable, "-c", script], width=2))
+            except GitCommandError as exc:
+                errors.append(exc)
+
+        # when
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(timeout=20)
+
+        # then
+        assert not worker.is_alive()
+        assert records == [(b"x", b"y")]
+        assert errors[0].status == 2
+        assert "warning" in errors[0].stderr
+
+    def test_failure_raises_after_the_stream_is_drained(self) -> None:
+        # when / then
+        with pytest.raises(GitCommandError, match="broken"):
+            list(iter_git_records([sys.executable, "-c", "import sys; sys.exit('broken')"], width=1))
@@ -0,0 +1,74 @@
+"""Unit tests for the --format json|ndjson record writer."""
+
+import io
+import json
+
+import pytest
+
+from gitgossip.core.models.llm_call import LLMCallStats
+from gitgossip.utils.output import RecordWriter, llm_usage
+
+
+class TestRecordWriter:
+    """Verify streaming JSON and NDJSON output."""
+
+    def test_ndjson_writes_one_line_per_record(self) -> None:
+        # given
+        out = io.StringIO()
+
+        # when
+        with RecordWriter("ndjson", out) as writer:
+            writer.emit({"repo": "a", "summary": "ünïcode"})
+            first = out.getvalue()
+            writer.emit({"repo": "b"})
+
+        # then
+        assert first == '{"repo": "a", "summary": "ünïcode"}\n'
+        assert [json.loads(line)["repo"] for line in out.getvalue().splitlines()] == ["a", "b"]
+
+    def test_json_streams_a_valid_array(self) -> None:
+        # given
+        out = io.StringIO()
+
+        # when
+        with RecordWriter("json", out) as writer:
+            writer.emit({"repo": "a"})
+            first = out.getvalue()
+            writer.emit({"repo": "b"})
+
+        # then
+        assert first == '[\n{"repo": "a"}'
+        assert json.loads(out.getvalue()) == [{"repo": "a"}, {"repo": "b"}]
+
+    def test_empty_json_run_is_an_empty_array(self) -> None:
+        # given
+        out = io.StringIO()
+
+        # when
+        with pytest.raises(RuntimeError):
+            with RecordWriter("json", out):
+                raise RuntimeError("failed before any record")
+
+        # then
+        assert json.loads(out.getvalue()) == []
+
+    def test_text_is_not_a_record_format(self) -> None:
+        # given / when / then
+        with pytest.raises(ValueError, match="Unknown output format"):
+            RecordWriter("text")
+
+    def test_llm_usage_totals_timings_and_prefix_cache(self) -> None:
+        # given
+        calls = [
+            LLMCallStats(operation="analyze_commits", wall_ms=10.0, prompt_tokens=100, cached_tokens=80),
+            LLMCallStats(operation="analyze_commits", wall_ms=5.5, prompt_tokens=50),
+        ]
+
+        # when
+        usage = llm_usage(calls)
+
+        # then
+        assert usage == {
+            "timings": {"llm_ms": 15.5, "llm_calls": 2},
+            "cache": {"prompt_tokens": 150, "cached_tokens": 80, "hit": True},
+        }
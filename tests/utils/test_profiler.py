@@ -0,0 +1,92 @@
+"""Unit tests for the --profile phase profiler."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from gitgossip.utils import profiler
+from gitgossip.utils.profiler import phase
+
+
+@pytest.fixture(autouse=True)
+def _no_leftover_profiler():
+    yield
+    profiler.stop()
+
+
+class TestPhaseProfiler:
+    """Verify phase accounting and the disabled fast path."""
+
+    def test_disabled_phase_is_a_shared_noop(self) -> None:
+        # given / when / then
+        assert profiler.active() is None
+        assert phase("parse") is phase("llm")
+
+    def test_nested_phases_record_self_time(self) -> None:
+        # given
+        running = profiler.start()
+
+        # when
+        with phase("outer"):
+            time.sleep(0.05)
+            with phase("inner"):
+                time.sleep(0.1)
+        with phase("inner"):
+            pass
+        profiler.stop()
+
+        # then
+        timings = {t.name: t for t in running.timings()}
+        assert timings["inner"].calls == 2
+        assert timings["inner"].wall_s == pytest.approx(0.1, abs=0.04)
+        assert timings["outer"].wall_s == pytest.approx(0.05, abs=0.04)
+        assert [t.name for t in running.timings()] == ["inner", "outer"]
+
+    def test_cprofile_dump_is_written_on_stop(self, tmp_path: Path) -> None:
+        # given
+        dump = tmp_path / "run.prof"
+        profiler.start(cprofile_path=dump)
+
+        # when
+        with phase("work"):
+            sum(range(1000))
+        finished = profiler.stop()
+
+        # then
+        assert finished is not None and dump.stat().st_size > 0
+        assert profiler.active() is None
+
+    def test_memory_tracking_records_peak_per_phase(self) -> None:
+        # given
+        running = profiler.start(memory=True)
+
+        # when
+        with phase("outer"):
+            with phase("big"):
+                block = bytearray(8 * 2**20)
+                del block
+            with phase("small"):
+                block = bytearray(1024)
+                del block
+        profiler.stop()
+
+        # then
+        timings = {t.name: t for t in running.timings()}
+        assert timings["big"].peak_bytes >= 8 * 2**20
+        assert timings["small"].peak_bytes < 8 * 2**20
+        assert timings["outer"].peak_bytes >= timings["big"].peak_bytes
+        assert running.peak_bytes >= timings["big"].peak_bytes
+
+    def test_timings_have_no_peak_without_memory_tracking(self) -> None:
+        # given
+        running = profiler.start()
+
+        # when
+        with phase("work"):
+            pass
+        profiler.stop()
+
+        # then
+        assert running.timings()[0].peak_bytes is None
+        assert running.peak_bytes is None
@@ -0,0 +1,53 @@
+"""Unit tests for parsing the combined raw/numstat/patch staged diff."""
+
+import subprocess
+from pathlib import Path
+
+from gitgossip.utils.staged_diff import STAGED_DIFF_ARGS, StagedFile, parse_staged_diff
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True, text=True).stdout
+
+
+class TestParseStagedDiff:
+    """Verify statuses, counts, renames and binary files come out of one git call."""
+
+    def test_renames_binaries_and_odd_paths(self, tmp_path: Path) -> None:
+        # given
+        _git(tmp_path, "init", "-b", "main")
+        (tmp_path / "f.txt").write_text("a\nb\n", encoding="utf-8")
+        (tmp_path / "old.txt").write_text("keep\n", encoding="utf-8")
+        (tmp_path / "bin.dat").write_bytes(b"\0\1")
+        (tmp_path / "gone.txt").write_text("x\n", encoding="utf-8")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "--no-gpg-sign", "-m", "init")
+        (tmp_path / "f.txt").write_text("a\nB\nc\n", encoding="utf-8")
+        (tmp_path / "bin.dat").write_bytes(b"\2\3")
+        (tmp_path / "tab\there ✓.py").write_text("n\n", encoding="utf-8")
+        _git(tmp_path, "mv", "old.txt", "new name.txt")
+        _git(tmp_path, "rm", "-q", "gone.txt")
+        _git(tmp_path, "add", ".")
+
+        # when
+        staged = parse_staged_diff(_git(tmp_path, *STAGED_DIFF_ARGS))
+
+        # then
+        assert staged.files == [
+            StagedFile("bin.dat", "M", None, None),
+            StagedFile("f.txt", "M", 2, 1),
+            StagedFile("gone.txt", "D", 0, 1),
+            StagedFile("new name.txt", "R", 0, 0, old_path="old.txt"),
+            StagedFile("tab\there ✓.py", "A", 1, 0),
+        ]
+        assert staged.patch == _git(tmp_path, "diff", "--cached", "--unified=3").removesuffix("\n")
+        assert staged.statuses["gone.txt"] == "D"
+        assert "R old.txt -> new name.txt (+0 -0)" in staged.file_summary().splitlines()
+        assert "M bin.dat (binary)" in staged.file_summary().splitlines()
+
+    def test_nothing_staged(self) -> None:
+        # given / when
+        staged = parse_staged_diff("")
+
+        # then
+        assert staged.files == [] and staged.patch == "" and staged.file_summary() == ""
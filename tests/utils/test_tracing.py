@@ -0,0 +1,186 @@
+"""Unit tests for the --trace span tracer and its file exporters."""
+
+import contextvars
+import json
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from gitgossip.core.interfaces.chat_client import IChatClient
+from gitgossip.core.llm import telemetry
+from gitgossip.core.llm.llm_analyzer import LLMAnalyzer
+from gitgossip.core.services.summarizer_service import SummarizerService
+from gitgossip.utils import tracing
+from gitgossip.utils.tracing import annotate, span
+
+
+@pytest.fixture(autouse=True)
+def _no_leftover_tracer():
+    yield
+    tracing.stop()
+
+
+def _lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def _streams(diff_text: str):
+    """Stand in for ``write_diff_between_branches``, writing ``diff_text`` as one commit."""
+
+    def write_diff(_target_branch, spool):
+        spool.write(diff_text)
+        return 1
+
+    return write_diff
+
+
+class _UsageChatClient(IChatClient):
+    """Chat client that reports provider usage the way the OpenAI client does."""
+
+    def complete(self, system: str, user: str, temperature: float, max_tokens: int) -> str:
+        telemetry.record_usage(120, 30, model="m", cached_tokens=100)
+        return "- summary"
+
+
+class TestTracer:
+    """Verify span nesting, attributes and the disabled fast path."""
+
+    def test_disabled_span_is_a_shared_noop(self) -> None:
+        # given / when / then
+        assert tracing.active() is None
+        assert span("a") is span("b", repo="x")
+        with span("a") as current:
+            current.set(ignored=True)
+        annotate(ignored=True)
+
+    def test_ndjson_streams_nested_spans_with_attributes(self, tmp_path: Path) -> None:
+        # given
+        out = tmp_path / "traces" / "run.ndjson"
+        tracer = tracing.start(out)
+
+        # when
+        with span("outer", repo="r1") as outer:
+            with span("inner", chunk_index=2, skipped=None):
+                annotate(tokens=42)
+            written_before_outer_ends = _lines(out)
+            outer.set(commit_count=3, path=Path("p"))
+        tracing.stop()
+
+        # then
+        inner, outer_record = _lines(out)
+        assert [r["name"] for r in written_before_outer_ends] == ["inner"]
+        assert inner["parent_span_id"] == outer_record["span_id"]
+        assert outer_record["parent_span_id"] is None
+        assert inner["trace_id"] == outer_record["trace_id"] == tracer.trace_id
+        assert inner["attributes"] == {"chunk_index": 2, "tokens": 42}
+        assert outer_record["attributes"] == {"repo": "r1", "commit_count": 3, "path": "p"}
+        assert outer_record["resource"]["service.name"] == "gitgossip"
+        assert outer_record["end_time_unix_nano"] >= inner["end_time_unix_nano"]
+
+    def test_exception_marks_span_failed_and_propagates(self, tmp_path: Path) -> None:
+        # given
+        out = tmp_path / "run.ndjson"
+        tracing.start(out)
+
+        # when
+        with pytest.raises(ValueError):
+            with span("boom"):
+                raise ValueError("bad input")
+        tracing.stop()
+
+        # then
+        (record,) = _lines(out)
+        assert record["status"] == "error"
+        assert record["error"] == "ValueError: bad input"
+
+    def test_threads_with_copied_context_nest_under_caller(self, tmp_path: Path) -> None:
+        # given
+        tracer = tracing.start(tmp_path / "run.ndjson")
+
+        def work() -> None:
+            with span("child"):
+                pass
+
+        # when
+        with span("parent") as parent:
+            worker = threading.Thread(target=contextvars.copy_context().run, args=(work,))
+            worker.start()
+            worker.join()
+        tracing.stop()
+
+        # then
+        child, _ = tracer.spans()
+        assert child.name == "child"
+        assert child.parent_id == parent.span_id
+        assert child.thread != parent.thread
+
+    def test_otlp_file_holds_one_export_request_per_run(self, tmp_path: Path) -> None:
+        # given
+        out = tmp_path / "run.otlp.json"
+        tracing.start(out, "otlp", resource={"service.version": "1.0"})
+
+        # when
+        with span("root"):
+            with span("llm.complete", prompt_tokens=10, cache_hit=True, ratio=0.5):
+                pass
+        tracing.stop()
+
+        # then
+        (request,) = _lines(out)
+        resource_spans = request["resourceSpans"][0]
+        resource = {a["key"]: a["value"] for a in resource_spans["resource"]["attributes"]}
+        assert resource["service.name"] == {"stringValue": "gitgossip"}
+        assert resource["service.version"] == {"stringValue": "1.0"}
+        child, root = resource_spans["scopeSpans"][0]["spans"]
+        assert child["parentSpanId"] == root["spanId"] and "parentSpanId" not in root
+        assert len(root["traceId"]) == 32 and len(root["spanId"]) == 16
+        assert int(child["endTimeUnixNano"]) >= int(child["startTimeUnixNano"])
+        attributes = {a["key"]: a["value"] for a in child["attributes"]}
+        assert attributes["prompt_tokens"] == {"intValue": "10"}
+        assert attributes["cache_hit"] == {"boolValue": True}
+        assert attributes["ratio"] == {"doubleValue": 0.5}
+        assert child["status"] == {"code": 1}
+
+    def test_unknown_format_is_rejected(self, tmp_path: Path) -> None:
+        # given / when / then
+        with pytest.raises(ValueError, match="Unknown trace format"):
+            tracing.start(tmp_path / "run.json", "zipkin")
+
+
+class TestInstrumentation:
+    """Verify the spans emitted by the summarizer and the analyzer."""
+
+    def test_merge_request_run_traces_chunks_and_llm_usage(self, tmp_path: Path) -> None:
+        # given
+        out = tmp_path / "run.ndjson"
+        tracing.start(out)
+        parser = MagicMock()
+        parser.repo_provider.write_diff_between_branches.side_effect = _streams(
+            "\n".join(f"+line {i}" for i in range(40))
+        )
+        service = SummarizerService(parser, LLMAnalyzer(chat_client=_UsageChatClient(), show_status=False), 100)
+
+        # when
+        service.summarize_for_merge_request("main")
+        tracing.stop()
+
+        # then
+        records = _lines(out)
+        by_id = {r["span_id"]: r for r in records}
+        chunks = [r for r in records if r["name"] == "summarize.chunk"]
+        assert [c["attributes"]["chunk_index"] for c in chunks] == [1, 2, 3, 4]
+        assert {c["attributes"]["chunk_count"] for c in chunks} == {4}
+        completions = [r for r in records if r["name"] == "llm.complete"]
+        assert len(completions) == 6  # four chunks, synthesis and the final MR summary
+        chunk_call = next(r for r in completions if r["attributes"]["operation"] == "summarize_diff_chunk")
+        assert by_id[chunk_call["parent_span_id"]]["name"] == "summarize.chunk"
+        assert chunk_call["attributes"]["prompt_tokens"] == 120
+        assert chunk_call["attributes"]["cached_tokens"] == 100
+        assert chunk_call["attributes"]["cache_hit"] is True
+        assert chunk_call["attributes"]["ok"] is True
+        root = records[-1]
+        assert root["name"] == "summarize.merge_request"
+        assert root["attributes"]["target_branch"] == "main"
+        assert root["attributes"]["diff_bytes"] > 100